@@ -0,0 +1,448 @@
+import json # импортируем json для хранения решений на диске
+import math # импортируем модуль math для математических операций
+import os # импортируем модуль os для путей и переменных окружения
+import pickle # импортируем pickle, чтобы проверить, можно ли передать функцию в процесс
+import tempfile # импортируем tempfile для временных файлов при сохранении и в тестах
+import threading # импортируем threading для блокировки при доступе из нескольких потоков
+import time # импортируем time для времени последнего использования решений
+import timeit # импортируем модуль timeit для замера времени выполнения
+import unittest # импортируем модуль unittest для создания unit-тестов
+
+import numpy as np # импортируем numpy для векторных функций
+
+import main # импортируем функции интегрирования лабораторной работы
+from integrate_cache import fingerprint # импортируем отпечаток функции
+
+
+DEFAULT_PATH = os.environ.get('INTEGRATE_AUTO_CACHE', os.path.join(os.path.expanduser('~'), '.cache', 'integrate_lab10', 'autotune.json')) # файл решений
+TRIAL_ITERS = (4096, 16384) # размеры пробных запусков: по двум точкам оцениваются накладные расходы и время итерации
+TRIAL_REPEAT = 2 # количество пробных запусков в каждой точке (берется минимум)
+MAX_DECISIONS = 256 # сколько решений хранится в файле: старые вытесняются, чтобы файл не рос без ограничения
+USAGE_SAVE_INTERVAL = 60.0 # не чаще чем раз в столько секунд время использования решений записывается без новой настройки
+
+# скалярные функции, у которых есть C-функция в integrate_cy.KERNELS
+_KERNEL_ALIASES = {math.sin: 'sin', math.cos: 'cos', math.exp: 'exp', np.sin: 'sin', np.cos: 'cos', np.exp: 'exp'}
+
+
+def _cython():
+    '''
+    Функция _cython() импортирует скомпилированный модуль integrate_cy или возвращает None
+    '''
+    try:
+        import integrate_cy # импортируем Cython модуль только при необходимости
+        return integrate_cy # возвращаем модуль
+    except ImportError: # модуль не скомпилирован
+        return None # бэкенды Cython недоступны
+
+
+def picklable(f) -> bool:
+    '''
+    Функция picklable() проверяет, можно ли передать f в другой процесс
+    '''
+    try:
+        pickle.dumps(f) # функцию нужно передать в другой процесс
+        return True # функция сериализуется
+    except (pickle.PicklingError, AttributeError, TypeError): # лямбды и локальные функции не сериализуются
+        return False # процессы недоступны
+
+
+def candidates(f, method: str = 'rectangle', *, can_pickle: bool | None = None) -> dict:
+    '''
+    Функция candidates() возвращает бэкенды, которые умеют считать интеграл f правилом method
+
+    Параметры:
+    f -- интегрируемая функция или описание C-функции из integrate_cy.KERNELS
+    method -- квадратурное правило из RULES
+    can_pickle -- уже известный результат picklable(f) (None -- проверить)
+
+    Возвращает:
+    dict -- имя бэкенда -> функция (f, a, b, n_iter, n_jobs) -> значение интеграла
+    '''
+    spec = f if isinstance(f, (str, tuple)) else _KERNEL_ALIASES.get(f) # описание C-функции, если оно есть
+    cy = _cython() # Cython модуль или None
+    result = {} # доступные бэкенды
+    if not isinstance(f, (str, tuple)): # бэкенды для Python функций
+        result['python'] = lambda f, a, b, n, jobs: main.integrate(f, a, b, n_iter=n, method=method) # базовая версия
+        if method == 'rectangle': # integrate_vectorized считает только прямоугольники
+            result['numpy'] = lambda f, a, b, n, jobs: main.integrate_vectorized(f, a, b, n_iter=n) # блоки numpy
+        if cy is not None: # Cython с вызовом Python функции
+            result['cython'] = lambda f, a, b, n, jobs: cy.integrate_cy(f, a, b, n, method=method) # Cython
+    result['thread'] = lambda f, a, b, n, jobs: main.integrate_threaded(f, a, b, n_jobs=jobs, n_iter=n, method=method) # потоки
+    if picklable(f) if can_pickle is None else can_pickle: # функцию можно передать в другой процесс
+        result['process'] = lambda f, a, b, n, jobs: main.integrate_processes(f, a, b, n_jobs=jobs, n_iter=n, method=method) # процессы
+    if cy is not None and spec is not None: # у функции есть C-реализация
+        result['kernel'] = lambda f, a, b, n, jobs: cy.integrate_kernel(spec, a, b, n, jobs, method=method) # C-функция, prange без GIL
+        if spec == 'cos' and method == 'rectangle': # специализированная версия для косинуса
+            result['cos_nogil'] = lambda f, a, b, n, jobs: cy.integrate_cos_nogil(a, b, n) # цикл без GIL
+    return result # возвращаем бэкенды
+
+
+class AutoTuner:
+    '''
+    Класс AutoTuner выбирает самый быстрый бэкенд для функции и класса размера задачи
+
+    При первом вызове для пары (функция, класс размера) каждый бэкенд запускается на
+    TRIAL_ITERS итераций, по двум точкам строится модель t = c0 + c1 * n_iter (c0 --
+    накладные расходы, например запуск пула), и выбирается бэкенд с наименьшим
+    предсказанным временем. Решение сохраняется в JSON-файл и используется следующими
+    вызовами и следующими запусками программы; хранится не больше max_decisions решений,
+    давно не использованные вытесняются. Время последнего использования (last_used)
+    хранится в каждом решении и записывается на диск вместе с очередной настройкой или
+    не реже раза в USAGE_SAVE_INTERVAL секунд, поэтому порядок вытеснения сохраняется
+    и между запусками
+
+    Параметры:
+    path -- путь к файлу решений (None -- хранить только в памяти)
+    n_jobs -- количество потоков/процессов параллельных бэкендов
+    max_decisions -- максимальное количество хранимых решений
+
+    Вызывает:
+    ValueError -- если n_jobs <= 0 или max_decisions <= 0
+    '''
+    def __init__(self, path: str | None = DEFAULT_PATH, *, n_jobs: int = 2, max_decisions: int = MAX_DECISIONS):
+        if n_jobs <= 0: # проверяем количество работников
+            raise ValueError('n_jobs должен быть положительным числом') # вызываем исключение
+        if max_decisions <= 0: # проверяем размер хранилища решений
+            raise ValueError('max_decisions должен быть положительным числом') # вызываем исключение
+        self.path = path # файл решений
+        self.n_jobs = n_jobs # количество работников
+        self.max_decisions = max_decisions # максимальное количество решений
+        self._lock = threading.Lock() # решения могут читаться и записываться из нескольких потоков
+        self._decisions = self._load() # ключ -> решение, последние -- недавно использованные
+        self._trim() # файл мог быть записан с большим ограничением
+        self._picklable = {} # отпечаток функции -> можно ли передать ее в процесс
+        self._saved_at = time.monotonic() # время последней записи на диск
+
+    def _load(self) -> dict:
+        '''
+        Функция _load() читает решения с диска; поврежденный или отсутствующий файл дает пустой словарь
+        '''
+        if self.path is None or not os.path.exists(self.path): # файла нет
+            return {} # решений нет
+        try:
+            with open(self.path, encoding='utf-8') as file: # открываем файл решений
+                decisions = json.load(file) # читаем решения
+        except (OSError, ValueError): # файл поврежден
+            return {} # настраиваемся заново
+        return dict(sorted(decisions.items(), key=lambda item: item[1].get('last_used', 0.0))) # давно не использованные -- первыми
+
+    def _trim(self):
+        '''
+        Функция _trim() вытесняет давно не использованные решения сверх max_decisions
+        '''
+        while len(self._decisions) > self.max_decisions: # решений больше ограничения
+            del self._decisions[next(iter(self._decisions))] # удаляем самое старое решение
+
+    def _save(self):
+        '''
+        Функция _save() атомарно записывает решения на диск
+        '''
+        if self.path is None: # решения хранятся только в памяти
+            return # ничего не записываем
+        folder = os.path.dirname(os.path.abspath(self.path)) # папка файла решений
+        os.makedirs(folder, exist_ok=True) # создаем папку
+        with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=folder, suffix='.tmp', delete=False) as file: # у каждого процесса свой временный файл
+            temp = file.name # имя временного файла
+            try:
+                json.dump(self._decisions, file, ensure_ascii=False, indent=2) # сохраняем решения
+            except BaseException: # запись не удалась
+                file.close() # закрываем файл перед удалением
+                os.unlink(temp) # удаляем временный файл
+                raise # передаем исключение дальше
+        os.replace(temp, self.path) # подменяем файл одним действием
+        self._saved_at = time.monotonic() # запоминаем время записи
+
+    @staticmethod
+    def _function_key(f, key=None) -> str:
+        '''
+        Функция _function_key() возвращает отпечаток функции или пользовательский ключ
+        '''
+        return repr(('key', key) if key is not None else fingerprint(f)) # отпечаток или ключ пользователя
+
+    def key(self, f, n_iter: int, method: str = 'rectangle', key=None) -> str:
+        '''
+        Функция key() строит ключ решения: отпечаток функции (или пользовательский key),
+        правило, класс размера (степень двойки n_iter) и количество работников
+
+        >>> AutoTuner(None).key(math.cos, 100000)
+        "('builtin', 'math', 'cos')|rectangle|2^17|jobs=2"
+        >>> AutoTuner(None).key(None, 100000, key='lin7')
+        "('key', 'lin7')|rectangle|2^17|jobs=2"
+        '''
+        return self._decision_key(self._function_key(f, key), n_iter, method) # ключ решения
+
+    def _decision_key(self, function_key: str, n_iter: int, method: str) -> str:
+        '''
+        Функция _decision_key() строит ключ решения по уже вычисленному отпечатку функции
+        '''
+        return f'{function_key}|{method}|2^{n_iter.bit_length()}|jobs={self.n_jobs}' # ключ решения
+
+    def _candidates(self, f, method: str, function_key: str) -> dict:
+        '''
+        Функция _candidates() возвращает candidates(f, method), проверяя сериализуемость f
+        один раз для каждого отпечатка функции function_key
+        '''
+        with self._lock: # читаем проверку под блокировкой
+            can_pickle = self._picklable.get(function_key) # результат прошлой проверки
+        if can_pickle is None: # функция встречается впервые
+            can_pickle = picklable(f) # проверяем сериализуемость
+            with self._lock: # запоминаем проверку под блокировкой
+                if len(self._picklable) >= self.max_decisions: # словарь проверок не растет без ограничения
+                    self._picklable.clear() # начинаем заново
+                self._picklable[function_key] = can_pickle # запоминаем результат
+        return candidates(f, method, can_pickle=can_pickle) # бэкенды для функции
+
+    def tune(self, f, a: float, b: float, n_iter: int, method: str = 'rectangle', key=None) -> dict:
+        '''
+        Функция tune() замеряет бэкенды и сохраняет решение
+
+        Параметры:
+        f -- интегрируемая функция или описание C-функции
+        a -- нижний предел интегрирования
+        b -- верхний предел интегрирования
+        n_iter -- количество итераций, для которого предсказывается время
+        method -- квадратурное правило из RULES
+        key -- пользовательский ключ вместо отпечатка f
+
+        Возвращает:
+        dict -- решение: backend, predicted (предсказанное время каждого бэкенда в секундах), last_used
+        '''
+        return self._tune(f, a, b, n_iter, method, self._function_key(f, key)) # замеряем бэкенды
+
+    def _tune(self, f, a: float, b: float, n_iter: int, method: str, function_key: str) -> dict:
+        '''
+        Функция _tune() замеряет бэкенды по уже вычисленному отпечатку функции (см. tune())
+        '''
+        predicted = {} # предсказанное время бэкендов
+        reference = None # значение первого бэкенда для проверки остальных
+        for name, run in self._candidates(f, method, function_key).items(): # перебираем бэкенды
+            times = [] # лучшее время в каждой точке
+            for n in TRIAL_ITERS: # пробные размеры
+                value = run(f, a, b, n, self.n_jobs) # прогревочный запуск: импорт, пул
+                times.append(min(timeit.repeat(lambda: run(f, a, b, n, self.n_jobs), number=1, repeat=TRIAL_REPEAT))) # лучшее время
+            if reference is None: # первый бэкенд -- эталон
+                reference = value # запоминаем значение
+            elif not math.isclose(value, reference, rel_tol=1e-8, abs_tol=1e-12): # бэкенд считает иначе
+                continue # такой бэкенд не выбираем
+            slope = max(times[1] - times[0], 0.0) / (TRIAL_ITERS[1] - TRIAL_ITERS[0]) # время одной итерации
+            overhead = max(times[0] - slope * TRIAL_ITERS[0], 0.0) # накладные расходы
+            predicted[name] = overhead + slope * n_iter # предсказанное время на n_iter итераций
+        decision = {'backend': min(predicted, key=predicted.get), 'predicted': predicted, 'last_used': time.time()} # самый быстрый бэкенд
+        decision_key = self._decision_key(function_key, n_iter, method) # ключ решения
+        with self._lock: # изменяем решения под блокировкой
+            self._decisions.pop(decision_key, None) # новое решение становится последним
+            self._decisions[decision_key] = decision # запоминаем решение
+            self._trim() # вытесняем старые решения
+            self._save() # сохраняем на диск
+        return decision # возвращаем решение
+
+    def choose(self, f, a: float, b: float, n_iter: int, method: str = 'rectangle', key=None) -> str:
+        '''
+        Функция choose() возвращает сохраненный бэкенд или настраивается, если решения еще нет
+        '''
+        return self._choose(f, a, b, n_iter, method, self._function_key(f, key)) # выбираем бэкенд
+
+    def _choose(self, f, a: float, b: float, n_iter: int, method: str, function_key: str, available: dict | None = None) -> str:
+        '''
+        Функция _choose() выбирает бэкенд по уже вычисленному отпечатку функции (см. choose())
+        '''
+        decision_key = self._decision_key(function_key, n_iter, method) # ключ решения
+        with self._lock: # читаем решения под блокировкой
+            decision = self._decisions.pop(decision_key, None) # сохраненное решение
+            if decision is not None: # решение использовано
+                decision['last_used'] = time.time() # запоминаем время использования
+                self._decisions[decision_key] = decision # и становится последним (вытесняется позже остальных)
+                if time.monotonic() - self._saved_at >= USAGE_SAVE_INTERVAL: # порядок использования давно не записывался
+                    self._save() # записываем его на диск
+        if available is None: # бэкенды еще не известны
+            available = self._candidates(f, method, function_key) # бэкенды для функции
+        if decision is None or decision['backend'] not in available: # решения нет или бэкенд стал недоступен
+            decision = self._tune(f, a, b, n_iter, method, function_key) # замеряем бэкенды
+        return decision['backend'] # возвращаем бэкенд
+
+    def integrate(self, f, a: float, b: float, *, n_iter: int = 100000, method: str = 'rectangle', backend: str | None = None,
+                  key=None) -> float:
+        '''
+        Функция integrate() вычисляет интеграл самым быстрым бэкендом
+
+        Параметры:
+        f -- интегрируемая функция или описание C-функции из integrate_cy.KERNELS
+        a -- нижний предел интегрирования
+        b -- верхний предел интегрирования
+        n_iter -- количество итераций
+        method -- квадратурное правило из RULES
+        backend -- явный выбор бэкенда вместо автоматического
+        key -- пользовательский ключ вместо отпечатка f (нужен, если отпечаток нельзя построить)
+
+        Возвращает:
+        float -- приближенное значение интеграла
+
+        Вызывает:
+        ValueError -- если n_iter <= 0, b <= a, backend недоступен для f или для f нельзя построить отпечаток без key
+        '''
+        if n_iter <= 0: # проверяем, что количество итераций положительное
+            raise ValueError('n_iter должен быть положительным числом') # вызываем исключение
+        if b <= a: # проверяем корректность пределов интегрирования
+            raise ValueError('b должен быть больше a') # вызываем исключение
+        function_key = self._function_key(f, key) # отпечаток функции считается один раз на вызов
+        available = self._candidates(f, method, function_key) # бэкенды для этой функции
+        if backend is not None and backend not in available: # явный выбор недоступен
+            raise ValueError(f'backend должен быть одним из {sorted(available)}') # вызываем исключение
+        name = backend or self._choose(f, a, b, n_iter, method, function_key, available) # выбранный бэкенд
+        return available[name](f, a, b, n_iter, self.n_jobs) # вычисляем интеграл
+
+    def report(self) -> list[dict]:
+        '''
+        Функция report() возвращает принятые решения
+
+        Возвращает:
+        list[dict] -- key, backend и predicted для каждого решения
+        '''
+        with self._lock: # читаем решения под блокировкой
+            return [{'key': key, **decision} for key, decision in self._decisions.items()] # решения
+
+    def forget(self):
+        '''
+        Функция forget() удаляет все решения, чтобы бэкенды были замерены заново
+        '''
+        with self._lock: # изменяем решения под блокировкой
+            self._decisions.clear() # удаляем решения
+            self._save() # сохраняем пустой файл
+
+
+_default_tuner = None # общий AutoTuner создается при первом вызове integrate_auto()
+
+
+def integrate_auto(f, a: float, b: float, *, n_iter: int = 100000, method: str = 'rectangle', backend: str | None = None,
+                   key=None) -> float:
+    '''
+    Функция integrate_auto() вычисляет интеграл самым быстрым бэкендом; решения общего
+    AutoTuner хранятся в DEFAULT_PATH (переменная окружения INTEGRATE_AUTO_CACHE)
+
+    Параметры:
+    f -- интегрируемая функция или описание C-функции из integrate_cy.KERNELS
+    a -- нижний предел интегрирования
+    b -- верхний предел интегрирования
+    n_iter -- количество итераций
+    method -- квадратурное правило из RULES
+    backend -- явный выбор бэкенда вместо автоматического
+    key -- пользовательский ключ вместо отпечатка f (нужен, если отпечаток нельзя построить)
+
+    Возвращает:
+    float -- приближенное значение интеграла
+    '''
+    global _default_tuner
+    if _default_tuner is None: # общий AutoTuner еще не создан
+        _default_tuner = AutoTuner() # читаем решения с диска
+    return _default_tuner.integrate(f, a, b, n_iter=n_iter, method=method, backend=backend, key=key) # вычисляем интеграл
+
+
+class TestAutoTuner(unittest.TestCase):
+    '''
+    Класс TestAutoTuner содержит unit-тесты для автоматического выбора бэкенда
+    '''
+    def test_tuning_and_disk_cache(self):
+        '''
+        Функция test_tuning_and_disk_cache() проверяет выбор бэкенда, сохранение решения и явный выбор
+        '''
+        with tempfile.TemporaryDirectory() as folder: # временная папка для решений
+            path = os.path.join(folder, 'autotune.json') # файл решений
+            tuner = AutoTuner(path) # новый AutoTuner
+            expected = main.integrate(math.cos, 0, 1, n_iter=50000) # эталон
+            self.assertAlmostEqual(tuner.integrate(math.cos, 0, 1, n_iter=50000), expected, places=9) # автоматический выбор
+            decision, = tuner.report() # одно решение
+            self.assertIn(decision['backend'], candidates(math.cos)) # выбран доступный бэкенд
+            self.assertEqual(decision['backend'], min(decision['predicted'], key=decision['predicted'].get)) # самый быстрый
+            self.assertTrue(os.path.exists(path)) # решение сохранено на диск
+
+            reloaded = AutoTuner(path) # новый AutoTuner читает решение с диска
+            reloaded.tune = None # повторная настройка вызвала бы ошибку
+            self.assertAlmostEqual(reloaded.integrate(math.cos, 0, 1, n_iter=60000), main.integrate(math.cos, 0, 1, n_iter=60000), places=9) # тот же класс размера
+            self.assertEqual(reloaded.integrate(math.cos, 0, 1, n_iter=50000, backend='python'), expected) # явный выбор
+            reloaded.forget() # удаляем решения
+            self.assertEqual(AutoTuner(path).report(), []) # на диске решений нет
+
+    def test_candidates_and_errors(self):
+        '''
+        Функция test_candidates_and_errors() проверяет список бэкендов и обработку ошибок
+        '''
+        self.assertNotIn('process', candidates(lambda x: x * x)) # лямбду нельзя передать в процесс
+        self.assertNotIn('numpy', candidates(math.cos, 'simpson')) # numpy считает только прямоугольники
+        if _cython() is not None: # Cython модуль скомпилирован
+            self.assertIn('kernel', candidates(math.exp)) # у экспоненты есть C-функция
+            self.assertNotIn('python', candidates('exp')) # описание C-функции не вызывается из Python
+        tuner = AutoTuner(None) # решения только в памяти
+        with self.assertRaises(ValueError): # бэкенд недоступен для лямбды
+            tuner.integrate(lambda x: x, 0, 1, backend='process') # вызываем функцию
+        with self.assertRaises(ValueError): # b <= a
+            tuner.integrate(math.cos, 1, 0) # вызываем функцию
+
+    def test_key_and_eviction(self):
+        '''
+        Функция test_key_and_eviction() проверяет пользовательский ключ, ограничение
+        количества решений и однократную проверку сериализуемости функции
+        '''
+        class Scaled:
+            def __init__(self, k):
+                self.k = k # коэффициент
+            def __call__(self, x):
+                return self.k * x # линейная функция
+        with tempfile.TemporaryDirectory() as folder: # временная папка для решений
+            path = os.path.join(folder, 'autotune.json') # файл решений
+            tuner = AutoTuner(path, max_decisions=2) # не больше двух решений
+            with self.assertRaises(ValueError): # отпечаток вызываемого объекта построить нельзя
+                tuner.integrate(Scaled(7), 0, 1, n_iter=1000) # вызываем функцию
+            self.assertAlmostEqual(tuner.integrate(Scaled(7), 0, 1, n_iter=1000, key='scaled7'), 3.5, places=2) # с пользовательским ключом
+            tuner.integrate(math.cos, 0, 1, n_iter=1000, backend='python') # явный выбор не сохраняет решения
+            for n_iter in (1000, 10 ** 5, 10 ** 7): # три класса размера
+                tuner.choose(math.cos, 0, 1, n_iter) # настраиваемся
+            keys = [row['key'] for row in AutoTuner(path).report()] # решения на диске
+            self.assertEqual(keys, [tuner.key(math.cos, 10 ** 5), tuner.key(math.cos, 10 ** 7)]) # старые решения вытеснены
+            self.assertEqual(os.listdir(folder), ['autotune.json']) # временные файлы не остаются
+            self.assertEqual(len(tuner._picklable), 2) # сериализуемость проверена один раз для каждой функции
+        with self.assertRaises(ValueError): # некорректное ограничение
+            AutoTuner(None, max_decisions=0) # создаем AutoTuner
+
+    def test_single_fingerprint_and_usage_order(self):
+        '''
+        Функция test_single_fingerprint_and_usage_order() проверяет, что отпечаток функции
+        строится один раз на вызов, а порядок использования решений сохраняется на диск
+        '''
+        global fingerprint
+        calls = [] # вызовы fingerprint()
+        original = fingerprint # настоящая функция
+        with tempfile.TemporaryDirectory() as folder: # временная папка для решений
+            path = os.path.join(folder, 'autotune.json') # файл решений
+            tuner = AutoTuner(path, max_decisions=2) # не больше двух решений
+            fingerprint = lambda f: calls.append(f) or original(f) # считаем вызовы
+            try:
+                tuner.integrate(math.cos, 0, 1, n_iter=1000) # настройка и вычисление
+                self.assertEqual(len(calls), 1) # один отпечаток на вызов
+                tuner.integrate(math.cos, 0, 1, n_iter=1000) # решение уже есть
+                self.assertEqual(len(calls), 2) # снова один отпечаток
+            finally:
+                fingerprint = original # возвращаем настоящую функцию
+            tuner.choose(math.cos, 0, 1, 10 ** 6) # второе решение
+            tuner._saved_at = -math.inf # порядок использования давно не записывался
+            tuner.choose(math.cos, 0, 1, 1000) # первое решение снова использовано и записано на диск
+            reloaded = AutoTuner(path, max_decisions=2) # новый запуск программы
+            self.assertEqual([row['key'] for row in reloaded.report()], [tuner.key(math.cos, 10 ** 6), tuner.key(math.cos, 1000)]) # порядок использования
+            reloaded.choose(math.cos, 0, 1, 10 ** 8) # третье решение вытесняет давно не использованное
+            self.assertEqual([row['key'] for row in AutoTuner(path).report()], [tuner.key(math.cos, 1000), tuner.key(math.cos, 10 ** 8)]) # часто используемое решение осталось
+
+
+def main_report():
+    '''
+    Функция main_report() настраивает бэкенды для нескольких функций и размеров и выводит решения
+    '''
+    tuner = AutoTuner() # решения сохраняются в DEFAULT_PATH
+    for f in (math.cos, math.exp, np.sin): # функции с разными наборами бэкендов
+        for n_iter in (10 ** 4, 10 ** 6): # маленькая и большая задача
+            tuner.integrate(f, 0, 1, n_iter=n_iter) # настраиваемся и вычисляем
+    for row in tuner.report(): # выводим решения
+        times = ', '.join(f'{name}={seconds * 1000:.2f} мс' for name, seconds in sorted(row['predicted'].items(), key=lambda item: item[1])) # предсказания
+        print(f"{row['key']}: {row['backend']} ({times})") # решение и предсказанное время
+
+
+if __name__ == '__main__':
+    main_report() # выводим решения
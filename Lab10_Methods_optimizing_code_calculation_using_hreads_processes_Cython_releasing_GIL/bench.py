@@ -0,0 +1,316 @@
+import argparse # импортируем argparse для разбора аргументов командной строки
+import csv # импортируем csv для сохранения результатов в таблицу
+import json # импортируем json для сохранения результатов и чтения прошлых замеров
+import math # импортируем модуль math для математических операций
+import os # импортируем модуль os для определения количества ядер
+import platform # импортируем platform для описания машины в отчете
+import statistics # импортируем statistics для медианы и стандартного отклонения
+import sys # импортируем sys для версии Python
+import tempfile # импортируем tempfile для временных файлов в тестах
+import time # импортируем time для отметки времени запуска
+import timeit # импортируем модуль timeit для замера времени выполнения
+import unittest # импортируем модуль unittest для создания unit-тестов
+from functools import partial # импортируем partial для фиксации аргументов замеряемой функции
+
+import numpy as np # импортируем numpy для заранее вычисленных отсчетов
+
+import main # импортируем функции интегрирования лабораторной работы
+from integrate_cache import IntegrationCache # импортируем кэш результатов интегрирования
+
+
+A, B = 0.0, math.pi / 2 # пределы интегрирования во всех замерах: ∫cos(x)dx от 0 до pi/2
+
+
+def _cython():
+    '''
+    Функция _cython() импортирует скомпилированный модуль integrate_cy
+
+    Вызывает:
+    ImportError -- если модуль не скомпилирован
+    '''
+    import integrate_cy # импортируем Cython модуль только при необходимости
+    return integrate_cy # возвращаем модуль
+
+
+def _persistent_pool(kind):
+    '''
+    Функция _persistent_pool() создает фабрику замера для долгоживущего Integrator:
+    пул создается один раз до замеров и закрывается после них
+    '''
+    def factory(n_iter, n_jobs):
+        integrator = main.Integrator(kind, n_jobs=n_jobs) # пул создается вне замеров
+        return (lambda: integrator.integrate(math.cos, A, B, n_iter=n_iter)), integrator.shutdown # вычисление и закрытие пула
+    return factory # возвращаем фабрику
+
+
+# бэкенды: имя -> (фабрика (n_iter, n_jobs) -> (функция без аргументов, закрытие или None), параллельный ли бэкенд)
+BACKENDS = {
+    'python': (lambda n_iter, n_jobs: (lambda: main.integrate(math.cos, A, B, n_iter=n_iter), None), False), # базовая версия
+    'cached': (lambda n_iter, n_jobs: (partial(IntegrationCache().wrap(main.integrate), math.cos, A, B, n_iter=n_iter), None), False), # попадания в кэш после прогрева
+    'numpy': (lambda n_iter, n_jobs: (lambda: main.integrate_vectorized(math.cos, A, B, n_iter=n_iter), None), False), # блоки numpy
+    'thread': (lambda n_iter, n_jobs: (lambda: main.integrate_threaded(math.cos, A, B, n_jobs=n_jobs, n_iter=n_iter), None), True), # потоки
+    'process': (lambda n_iter, n_jobs: (lambda: main.integrate_processes(math.cos, A, B, n_jobs=n_jobs, n_iter=n_iter), None), True), # процессы, пул на вызов
+    'thread_pool': (_persistent_pool('thread'), True), # потоки, долгоживущий пул
+    'process_pool': (_persistent_pool('process'), True), # процессы, долгоживущий пул
+    'cython': (lambda n_iter, n_jobs: (lambda: _cython().integrate_cy(math.cos, A, B, n_iter), None), False), # Cython с Python-функцией
+    'cython_cos': (lambda n_iter, n_jobs: (lambda: _cython().integrate_cos_cy(A, B, n_iter), None), False), # Cython, math.cos
+    'cython_nogil': (lambda n_iter, n_jobs: (lambda: _cython().integrate_cos_nogil(A, B, n_iter), None), False), # Cython без GIL
+    'cython_prange': (lambda n_iter, n_jobs: (lambda: _cython().integrate_cos_nogil_prange(A, B, n_iter, n_jobs), None), True), # OpenMP prange
+    'cython_samples': (lambda n_iter, n_jobs: (partial(_cython().integrate_samples, np.cos(np.linspace(A, B, n_iter + 1)), (B - A) / n_iter, 'trapezoid', n_jobs), None), True), # готовые отсчеты, prange
+    'kernel_thread': (lambda n_iter, n_jobs: (lambda: main.integrate_threaded('cos', A, B, n_jobs=n_jobs, n_iter=n_iter), None), True), # C-функция в потоках
+    # пары для оценки накладных расходов компенсированного суммирования
+    'python_kahan': (lambda n_iter, n_jobs: (lambda: main.integrate(math.cos, A, B, n_iter=n_iter, compensated=True), None), False), # math.fsum
+    'thread_kahan': (lambda n_iter, n_jobs: (lambda: main.integrate_threaded(math.cos, A, B, n_jobs=n_jobs, n_iter=n_iter, compensated=True), None), True), # потоки, math.fsum
+    'cython_kahan': (lambda n_iter, n_jobs: (lambda: _cython().integrate_cy(math.cos, A, B, n_iter, compensated=True), None), False), # Cython, Неймайер
+    'kernel': (lambda n_iter, n_jobs: (lambda: _cython().integrate_kernel('cos', A, B, n_iter, n_jobs), None), True), # C-функция, prange
+    'kernel_kahan': (lambda n_iter, n_jobs: (lambda: _cython().integrate_kernel('cos', A, B, n_iter, n_jobs, compensated=True), None), True), # prange, блоки Неймайера
+}
+
+
+def available_backends() -> list[str]:
+    '''
+    Функция available_backends() возвращает бэкенды, которые можно запустить:
+    бэкенды Cython доступны только при скомпилированном integrate_cy
+    '''
+    try:
+        _cython() # проверяем, что модуль скомпилирован
+        return list(BACKENDS) # доступны все бэкенды
+    except ImportError:
+        return [name for name in BACKENDS if not name.startswith(('cython', 'kernel'))] # только бэкенды без Cython
+
+
+def _percentile(values: list[float], q: float) -> float:
+    '''
+    Функция _percentile() вычисляет перцентиль q (от 0 до 100) с линейной интерполяцией
+    '''
+    ordered = sorted(values) # сортируем значения
+    position = (len(ordered) - 1) * q / 100 # дробная позиция перцентиля
+    lo = math.floor(position) # ближайший индекс снизу
+    hi = min(lo + 1, len(ordered) - 1) # ближайший индекс сверху
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (position - lo) # интерполируем между соседями
+
+
+def measure(backend: str, n_iter: int, n_jobs: int = 1, repeat: int = 7) -> dict:
+    '''
+    Функция measure() замеряет один бэкенд repeat раз и считает статистику
+
+    Параметры:
+    backend -- имя бэкенда из BACKENDS
+    n_iter -- количество итераций
+    n_jobs -- количество потоков/процессов для параллельных бэкендов
+    repeat -- количество замеров (перед ними выполняется один прогревочный запуск)
+
+    Возвращает:
+    dict -- строка отчета: backend, n_iter, n_jobs, repeat, min, median, p95, stdev (в секундах)
+    '''
+    factory, _ = BACKENDS[backend] # фабрика замеряемой функции
+    run, close = factory(n_iter, n_jobs) # функция без аргументов и закрытие ресурсов
+    try:
+        run() # прогревочный запуск: импорт модулей, запуск пула
+        times = timeit.repeat(run, number=1, repeat=repeat) # замеряем каждый запуск отдельно
+    finally:
+        if close is not None: # у бэкенда есть ресурсы
+            close() # закрываем пул
+    return {
+        'backend': backend, # имя бэкенда
+        'n_iter': n_iter, # количество итераций
+        'n_jobs': n_jobs, # количество работников
+        'repeat': repeat, # количество замеров
+        'min': min(times), # лучшее время
+        'median': statistics.median(times), # медиана
+        'p95': _percentile(times, 95), # 95-й перцентиль
+        'stdev': statistics.stdev(times) if len(times) > 1 else 0.0, # стандартное отклонение
+    }
+
+
+def run_benchmarks(backends=None, n_iters=(100000, 1000000), n_jobs=(1, 2, 4), repeat: int = 7, progress=None) -> list[dict]:
+    '''
+    Функция run_benchmarks() замеряет бэкенды на сетке n_iter x n_jobs и считает ускорение
+    относительно бэкенда 'python' и параллельную эффективность
+
+    Параметры:
+    backends -- имена бэкендов (по умолчанию все доступные)
+    n_iters -- значения количества итераций
+    n_jobs -- значения количества работников (последовательные бэкенды замеряются один раз)
+    repeat -- количество замеров в каждой точке
+    progress -- функция, вызываемая с каждой готовой строкой отчета
+
+    Возвращает:
+    list[dict] -- строки отчета; speedup -- ускорение медианы относительно 'python' при том же n_iter,
+                  efficiency -- ускорение относительно того же бэкенда с 1 работником, деленное на n_jobs
+    '''
+    backends = list(backends or available_backends()) # замеряемые бэкенды
+    if 'python' not in backends: # базовая версия нужна для расчета ускорения
+        backends.insert(0, 'python') # добавляем ее первой
+    rows = [] # строки отчета
+    for n_iter in n_iters: # перебираем количество итераций
+        for backend in backends: # перебираем бэкенды
+            parallel = BACKENDS[backend][1] # зависит ли бэкенд от n_jobs
+            for jobs in (sorted(set(n_jobs) | {1}) if parallel else [1]): # 1 работник нужен для эффективности
+                row = measure(backend, n_iter, jobs, repeat) # замеряем точку сетки
+                rows.append(row) # добавляем строку в отчет
+                if progress is not None: # нужно сообщать о прогрессе
+                    progress(row) # передаем готовую строку
+    medians = {(row['backend'], row['n_iter'], row['n_jobs']): row['median'] for row in rows} # медианы по точкам сетки
+    for row in rows: # считаем производные метрики
+        base = medians[('python', row['n_iter'], 1)] # базовая версия при том же n_iter
+        single = medians[(row['backend'], row['n_iter'], 1)] # тот же бэкенд с одним работником
+        row['speedup'] = base / row['median'] if row['median'] > 0 else 0.0 # ускорение относительно базовой версии
+        row['efficiency'] = single / row['median'] / row['n_jobs'] if row['median'] > 0 else 0.0 # параллельная эффективность
+    return rows # возвращаем отчет
+
+
+def environment() -> dict:
+    '''
+    Функция environment() описывает машину и сборку, на которых выполнены замеры
+    '''
+    info = {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'), # время запуска
+        'python': sys.version.split()[0], # версия Python
+        'platform': platform.platform(), # операционная система
+        'machine': platform.machine(), # архитектура процессора
+        'cpu_count': os.cpu_count(), # количество ядер
+    }
+    try:
+        info['integrate_cy'] = _cython().build_info() # OpenMP, SIMD и fast-math сборки Cython модуля
+    except ImportError: # модуль не скомпилирован
+        info['integrate_cy'] = None # замеры Cython недоступны
+    return info # возвращаем описание окружения
+
+
+def write_json(rows: list[dict], path: str):
+    '''
+    Функция write_json() сохраняет отчет и описание окружения в JSON
+    '''
+    with open(path, 'w', encoding='utf-8') as file: # открываем файл на запись
+        json.dump({'environment': environment(), 'results': rows}, file, ensure_ascii=False, indent=2) # сохраняем отчет
+
+
+def write_csv(rows: list[dict], path: str):
+    '''
+    Функция write_csv() сохраняет строки отчета в CSV
+    '''
+    with open(path, 'w', encoding='utf-8', newline='') as file: # открываем файл на запись
+        writer = csv.DictWriter(file, fieldnames=list(rows[0])) # столбцы -- ключи строк отчета
+        writer.writeheader() # записываем заголовок
+        writer.writerows(rows) # записываем строки
+
+
+def print_report(rows: list[dict]):
+    '''
+    Функция print_report() выводит отчет таблицей
+    '''
+    print(f'{"бэкенд":<14}{"n_iter":>10}{"n_jobs":>7}{"медиана, с":>12}{"p95, с":>11}{"stdev, с":>11}{"ускорение":>11}{"эффект.":>9}') # заголовок таблицы
+    print('-' * 85) # выводим разделительную линию
+    for row in rows: # выводим строки отчета
+        print(f'{row["backend"]:<14}{row["n_iter"]:>10}{row["n_jobs"]:>7}{row["median"]:>12.6f}{row["p95"]:>11.6f}'
+              f'{row["stdev"]:>11.6f}{row["speedup"]:>10.2f}x{row["efficiency"]:>9.0%}') # строка таблицы
+
+
+def compare_with_baseline(rows: list[dict], path: str, threshold: float = 1.1) -> list[dict]:
+    '''
+    Функция compare_with_baseline() сравнивает медианы с прошлым JSON-отчетом
+
+    Параметры:
+    rows -- текущий отчет
+    path -- путь к прошлому отчету, сохраненному write_json()
+    threshold -- во сколько раз медиана должна вырасти, чтобы считаться регрессией
+
+    Возвращает:
+    list[dict] -- строки текущего отчета, ставшие медленнее порога (с полем ratio)
+    '''
+    with open(path, encoding='utf-8') as file: # открываем прошлый отчет
+        baseline = json.load(file)['results'] # строки прошлого отчета
+    previous = {(row['backend'], row['n_iter'], row['n_jobs']): row['median'] for row in baseline} # медианы прошлого отчета
+    regressions = [] # строки с регрессией
+    for row in rows: # сравниваем каждую точку сетки
+        key = (row['backend'], row['n_iter'], row['n_jobs']) # точка сетки
+        if key in previous and previous[key] > 0 and row['median'] / previous[key] > threshold: # медиана заметно выросла
+            regressions.append(dict(row, ratio=row['median'] / previous[key])) # запоминаем регрессию
+    return regressions # возвращаем регрессии
+
+
+def parse_args(argv=None):
+    '''
+    Функция parse_args() разбирает аргументы командной строки
+    '''
+    parser = argparse.ArgumentParser(description='Замеры бэкендов integrate на ∫cos(x)dx от 0 до pi/2') # создаем парсер
+    parser.add_argument('--backends', nargs='+', choices=list(BACKENDS), help='бэкенды (по умолчанию все доступные)') # бэкенды
+    parser.add_argument('--n-iter', nargs='+', type=int, default=[100000, 1000000], help='значения n_iter') # сетка n_iter
+    parser.add_argument('--n-jobs', nargs='+', type=int, default=[1, 2, 4], help='значения n_jobs') # сетка n_jobs
+    parser.add_argument('--repeat', type=int, default=7, help='количество замеров в каждой точке') # количество замеров
+    parser.add_argument('--json', help='путь для JSON-отчета') # файл JSON
+    parser.add_argument('--csv', help='путь для CSV-отчета') # файл CSV
+    parser.add_argument('--baseline', help='прошлый JSON-отчет для поиска регрессий') # прошлый отчет
+    parser.add_argument('--threshold', type=float, default=1.1, help='порог регрессии для --baseline') # порог регрессии
+    return parser.parse_args(argv) # возвращаем разобранные аргументы
+
+
+def cli(argv=None) -> int:
+    '''
+    Функция cli() является точкой входа командной строки:
+    python bench.py --n-iter 100000 1000000 --n-jobs 1 2 4 --json bench.json --csv bench.csv
+
+    Возвращает:
+    int -- код возврата: 1, если найдены регрессии относительно --baseline, иначе 0
+    '''
+    args = parse_args(argv) # разбираем аргументы
+    rows = run_benchmarks(args.backends, args.n_iter, args.n_jobs, args.repeat) # выполняем замеры
+    print_report(rows) # выводим таблицу
+    if args.json: # нужен JSON-отчет
+        write_json(rows, args.json) # сохраняем JSON
+    if args.csv: # нужен CSV-отчет
+        write_csv(rows, args.csv) # сохраняем CSV
+    if args.baseline: # нужно сравнение с прошлым отчетом
+        regressions = compare_with_baseline(rows, args.baseline, args.threshold) # ищем регрессии
+        for row in regressions: # выводим каждую регрессию
+            print(f'Регрессия: {row["backend"]} n_iter={row["n_iter"]} n_jobs={row["n_jobs"]} медленнее в {row["ratio"]:.2f} раза') # сообщение о регрессии
+        return 1 if regressions else 0 # код возврата для CI
+    return 0 # регрессий не искали
+
+
+class TestBench(unittest.TestCase):
+    '''
+    Класс TestBench содержит unit-тесты для набора замеров
+    '''
+    def test_report_and_exports(self):
+        '''
+        Функция test_report_and_exports() проверяет метрики отчета, JSON, CSV и сравнение с прошлым отчетом
+        '''
+        rows = run_benchmarks(['numpy', 'thread'], n_iters=[2000], n_jobs=[2], repeat=3) # маленькая сетка
+        self.assertEqual([(row['backend'], row['n_jobs']) for row in rows], [('python', 1), ('numpy', 1), ('thread', 1), ('thread', 2)]) # точки сетки
+        for row in rows: # проверяем метрики каждой строки
+            self.assertLessEqual(row['min'], row['median']) # минимум не больше медианы
+            self.assertLessEqual(row['median'], row['p95']) # медиана не больше 95-го перцентиля
+        self.assertAlmostEqual(rows[0]['speedup'], 1.0) # базовая версия относительно себя
+        self.assertAlmostEqual(rows[2]['efficiency'], 1.0) # один работник -- эффективность 100%
+        with tempfile.TemporaryDirectory() as folder: # временная папка для отчетов
+            json_path, csv_path = os.path.join(folder, 'bench.json'), os.path.join(folder, 'bench.csv') # пути к отчетам
+            write_json(rows, json_path) # сохраняем JSON
+            write_csv(rows, csv_path) # сохраняем CSV
+            with open(csv_path, encoding='utf-8') as file: # читаем CSV
+                self.assertEqual(len(list(csv.DictReader(file))), len(rows)) # все строки сохранены
+            slower = [dict(row, median=row['median'] * 2) for row in rows] # отчет в два раза медленнее
+            self.assertEqual(len(compare_with_baseline(slower, json_path)), len(rows)) # все точки -- регрессии
+            self.assertEqual(compare_with_baseline(rows, json_path), []) # тот же отчет -- без регрессий
+
+    def test_environment(self):
+        '''
+        Функция test_environment() проверяет описание сборки Cython модуля в отчете
+        '''
+        build = environment()['integrate_cy'] # сведения о сборке
+        if build is None: # модуль не скомпилирован
+            self.skipTest('Cython модуль не скомпилирован') # пропускаем тест
+        self.assertEqual(set(build), {'openmp', 'max_threads', 'simd', 'fast_math', 'compiler'}) # все поля на месте
+        self.assertGreaterEqual(build['max_threads'], 1) # хотя бы один поток
+
+    def test_percentile(self):
+        '''
+        Функция test_percentile() проверяет интерполяцию перцентиля
+        '''
+        self.assertEqual(_percentile([1.0, 2.0, 3.0, 4.0, 5.0], 50), 3.0) # медиана
+        self.assertAlmostEqual(_percentile([1.0, 2.0, 3.0, 4.0, 5.0], 95), 4.8) # интерполяция между 4 и 5
+
+
+if __name__ == '__main__':
+    sys.exit(cli()) # запускаем замеры из командной строки
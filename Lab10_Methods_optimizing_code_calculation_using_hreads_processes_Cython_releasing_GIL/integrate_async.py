@@ -0,0 +1,215 @@
+import asyncio # импортируем asyncio для асинхронного интерфейса
+import math # импортируем модуль math для математических операций
+import statistics # импортируем statistics для разброса оценок частей
+import unittest # импортируем модуль unittest для создания unit-тестов
+from contextlib import aclosing # импортируем aclosing, чтобы поток результатов закрывался при досрочном выходе
+from typing import Callable, NamedTuple # импортируем типы для аннотаций
+
+from main import Integrator, QuadResult, _get_rule, integrate, partial_integrate # импортируем функции интегрирования лабораторной работы
+
+
+class Progress(NamedTuple):
+    '''
+    Класс Progress описывает состояние вычисления после очередной готовой части
+    '''
+    value: float # текущая оценка интеграла
+    error: float # оценка отклонения от результата по всем частям (inf, пока готово меньше двух частей)
+    done: int # количество готовых частей
+    total: int # общее количество частей
+    n_eval: int # количество выполненных вычислений f
+
+
+def _strided_part(f, a: float, step: float, offset: int, stride: int, n_iter: int, method: str) -> float:
+    '''
+    Функция _strided_part() вычисляет правило method на разбиениях offset, offset + stride, ...
+    общей сетки с шагом step; каждый узел получает вес stride * step, поэтому одна часть
+    сама по себе является оценкой всего интеграла по более редкой сетке
+
+    Узлы с одинаковым положением внутри разбиения образуют равномерную сетку с шагом
+    stride * step, поэтому каждая такая сетка считается одним вызовом partial_integrate()
+    (для описаний C-функций -- integrate_kernel() без GIL)
+
+    Возвращает:
+    float -- оценка интеграла по узлам части
+    '''
+    count = len(range(offset, n_iter, stride)) # количество разбиений части
+    width = count * stride * step # длина, которую покрывают разбиения части с весом stride * step
+    acc = 0.0 # взвешенная сумма по узлам правила
+    for t, w in zip(*_get_rule(method)): # узлы правила внутри разбиения
+        start = a + (offset + t) * step # первый узел с этим положением
+        acc += w * partial_integrate(f, start, start + width, count) # сумма значений на редкой сетке, умноженная на ее шаг
+    return acc # возвращаем оценку интеграла
+
+
+async def integrate_stream(f: Callable[[float], float] | str | tuple, a: float, b: float, *, n_iter: int = 100000,
+                           method: str = 'rectangle', kind: str = 'process', n_jobs: int = 2, n_chunks: int | None = None,
+                           integrator: Integrator | None = None):
+    '''
+    Функция integrate_stream() является асинхронным генератором: части вычисляются в пуле
+    через loop.run_in_executor(), а после каждой готовой части выдается Progress
+    с текущей оценкой и ее погрешностью
+
+    Часть j содержит разбиения j, j + n_chunks, j + 2 * n_chunks, ..., поэтому каждая часть
+    покрывает весь отрезок и оценка уточняется равномерно. Оценка -- среднее готовых частей,
+    погрешность -- стандартная ошибка среднего с поправкой на конечное число частей; после
+    всех частей value совпадает с integrate() (с точностью до округления), а error равна 0
+
+    При досрочном выходе из цикла оставшиеся части отменяются, если генератор закрыт:
+    используйте async with contextlib.aclosing(integrate_stream(...)) as stream
+
+    Параметры:
+    f -- интегрируемая функция или описание C-функции из integrate_cy.KERNELS
+    a -- нижний предел интегрирования
+    b -- верхний предел интегрирования
+    n_iter -- общее количество разбиений
+    method -- квадратурное правило из RULES
+    kind -- тип временного пула: 'thread' или 'process'
+    n_jobs -- количество потоков/процессов временного пула
+    n_chunks -- количество частей (по умолчанию n_jobs * chunks_per_job, не больше n_iter)
+    integrator -- уже созданный Integrator, пул которого нужно использовать
+
+    Возвращает:
+    AsyncIterator[Progress] -- состояния вычисления по мере готовности частей
+
+    Вызывает:
+    ValueError -- если n_iter <= 0, b <= a, n_chunks < 2 или method неизвестен
+    '''
+    if n_iter <= 0: # проверяем, что количество итераций положительное
+        raise ValueError('n_iter должен быть положительным числом') # вызываем исключение
+    if b <= a: # проверяем корректность пределов интегрирования
+        raise ValueError('b должен быть больше a') # вызываем исключение
+    nodes, _ = _get_rule(method) # проверяем правило до запуска пула
+
+    own = integrator is None # пул создается только на время вычисления
+    if own: # пул не передан -- создаем временный
+        integrator = Integrator(kind, n_jobs=n_jobs) # временный пул
+    stride = min(n_iter, n_chunks or integrator.n_jobs * integrator.chunks_per_job) # количество частей
+    if stride < 2: # по одной части нельзя оценить погрешность
+        if own: # временный пул больше не нужен
+            integrator.shutdown() # закрываем пул
+        raise ValueError('n_chunks и n_iter должны быть не меньше 2') # вызываем исключение
+
+    loop = asyncio.get_running_loop() # текущий цикл событий
+    step = (b - a) / n_iter # шаг общей сетки
+    pending = [loop.run_in_executor(integrator.executor, _strided_part, f, a, step, j, stride, n_iter, method) for j in range(stride)] # части в пуле
+    values = [] # оценки готовых частей в порядке готовности
+    n_eval = 0 # количество выполненных вычислений f
+    try:
+        waiting = set(pending) # еще не готовые части
+        while waiting: # пока есть незавершенные части
+            ready, waiting = await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED) # ждем хотя бы одну часть
+            for j in sorted(pending.index(fut) for fut in ready): # готовые части в порядке номеров
+                values.append(pending[j].result()) # оценка интеграла по части
+                n_eval += len(range(j, n_iter, stride)) * len(nodes) # вычисления f в части
+                if len(values) == stride: # все части готовы
+                    yield Progress(math.fsum(values) / stride, 0.0, stride, stride, n_eval) # итоговое значение
+                elif len(values) > 1: # погрешность оценивается по разбросу частей
+                    error = statistics.stdev(values) / math.sqrt(len(values)) * math.sqrt((stride - len(values)) / (stride - 1)) # ошибка среднего
+                    yield Progress(math.fsum(values) / len(values), error, len(values), stride, n_eval) # текущая оценка
+                else: # готова одна часть
+                    yield Progress(values[0], math.inf, 1, stride, n_eval) # погрешность неизвестна
+    finally:
+        for fut in pending: # при досрочном выходе, отмене или ошибке
+            fut.cancel() # отменяем еще не начатые части
+        if own: # пул был создан здесь
+            integrator.shutdown(wait=False) # закрываем пул, не дожидаясь уже запущенных частей
+
+
+async def integrate_async(f: Callable[[float], float] | str | tuple, a: float, b: float, *, n_iter: int = 100000,
+                          method: str = 'rectangle', kind: str = 'process', n_jobs: int = 2, n_chunks: int | None = None,
+                          tol: float | None = None, timeout: float | None = None, progress=None,
+                          integrator: Integrator | None = None) -> QuadResult:
+    '''
+    Функция integrate_async() вычисляет интеграл, не блокируя цикл событий: части считаются
+    в пуле потоков или процессов, а корутина ожидает их готовности
+
+    Если задан tol, вычисление останавливается, как только оценка погрешности станет не больше tol,
+    а оставшиеся части отменяются. Отмена задачи и истечение timeout тоже отменяют оставшиеся части
+
+    Параметры:
+    f -- интегрируемая функция или описание C-функции из integrate_cy.KERNELS
+    a -- нижний предел интегрирования
+    b -- верхний предел интегрирования
+    n_iter -- общее количество разбиений
+    method -- квадратурное правило из RULES
+    kind -- тип временного пула: 'thread' или 'process'
+    n_jobs -- количество потоков/процессов временного пула
+    n_chunks -- количество частей (по умолчанию n_jobs * chunks_per_job)
+    tol -- допустимая погрешность для досрочной остановки (None -- считать все части)
+    timeout -- ограничение времени в секундах (None -- без ограничения)
+    progress -- функция, вызываемая с каждым Progress
+    integrator -- уже созданный Integrator, пул которого нужно использовать
+
+    Возвращает:
+    QuadResult -- оценка интеграла, ее погрешность и количество вычислений f
+
+    Вызывает:
+    ValueError -- если аргументы некорректны
+    TimeoutError -- если вычисление не уложилось в timeout
+
+    >>> asyncio.run(integrate_async(math.cos, 0, math.pi/2, n_iter=1000, kind='thread')).error
+    0.0
+    '''
+    async def consume():
+        async with aclosing(integrate_stream(f, a, b, n_iter=n_iter, method=method, kind=kind, n_jobs=n_jobs,
+                                             n_chunks=n_chunks, integrator=integrator)) as stream: # поток закроется при выходе
+            async for state in stream: # состояния по мере готовности частей
+                if progress is not None: # нужно сообщать о прогрессе
+                    progress(state) # передаем состояние
+                if tol is not None and state.error <= tol: # точность достигнута
+                    break # остальные части отменит aclosing
+        return QuadResult(state.value, state.error, state.n_eval) # последняя оценка
+
+    return await asyncio.wait_for(consume(), timeout) # ограничиваем время вычисления
+
+
+class TestIntegrateAsync(unittest.TestCase):
+    '''
+    Класс TestIntegrateAsync содержит unit-тесты для асинхронного интегрирования
+    '''
+    def test_full_result_matches_integrate(self):
+        '''
+        Функция test_full_result_matches_integrate() проверяет, что после всех частей
+        результат совпадает с integrate(), а прогресс монотонен
+        '''
+        states = [] # состояния вычисления
+        for kind, method in (('thread', 'rectangle'), ('process', 'simpson')): # оба типа пула
+            states.clear() # собираем состояния заново
+            result = asyncio.run(integrate_async(math.exp, 0, 1, n_iter=1000, method=method, kind=kind, n_chunks=10, progress=states.append)) # вычисляем
+            self.assertAlmostEqual(result.value, integrate(math.exp, 0, 1, n_iter=1000, method=method), places=12) # совпадает с integrate()
+            self.assertEqual([state.done for state in states], list(range(1, 11))) # по состоянию на каждую часть
+            self.assertEqual(states[-1].error, 0.0) # после всех частей погрешность равна 0
+            self.assertTrue(math.isinf(states[0].error)) # по одной части погрешность неизвестна
+
+    def test_early_stop_and_timeout(self):
+        '''
+        Функция test_early_stop_and_timeout() проверяет досрочную остановку, отмену и timeout
+        '''
+        with Integrator('thread', n_jobs=1) as integrator: # один поток -- части готовятся по очереди
+            result = asyncio.run(integrate_async(math.cos, 0, 1, n_iter=100000, n_chunks=50, tol=1e-3, integrator=integrator)) # остановка по точности
+            self.assertLess(result.n_eval, 100000) # посчитаны не все части
+            self.assertAlmostEqual(result.value, math.sin(1), delta=1e-3 + 1e-5) # оценка в пределах точности
+        with self.assertRaises(TimeoutError): # вычисление не укладывается во время
+            asyncio.run(integrate_async(math.cos, 0, 1, n_iter=2000000, kind='thread', n_jobs=1, n_chunks=200, timeout=0.01)) # вызываем функцию
+
+        async def cancel():
+            task = asyncio.create_task(integrate_async(math.cos, 0, 1, n_iter=2000000, kind='thread', n_jobs=1, n_chunks=200)) # длинное вычисление
+            await asyncio.sleep(0.01) # даем вычислению начаться
+            task.cancel() # отменяем задачу
+            with self.assertRaises(asyncio.CancelledError): # задача отменена
+                await task # дожидаемся отмены
+        asyncio.run(cancel()) # запускаем проверку отмены
+
+    def test_invalid_arguments(self):
+        '''
+        Функция test_invalid_arguments() проверяет обработку некорректных аргументов
+        '''
+        for kwargs in ({'n_iter': 0}, {'n_chunks': 1}, {'method': 'unknown'}): # некорректные аргументы
+            with self.assertRaises(ValueError): # ожидаем исключение
+                asyncio.run(integrate_async(math.cos, 0, 1, kind='thread', **kwargs)) # вызываем функцию
+        with self.assertRaises(ValueError): # b <= a
+            asyncio.run(integrate_async(math.cos, 1, 0, kind='thread')) # вызываем функцию
+
+
+if __name__ == '__main__':
+    unittest.main() # запускаем тесты
@@ -0,0 +1,505 @@
+import functools # импортируем functools для partial и сохранения метаданных обертки
+import hashlib # импортируем hashlib для хеша байт-кода функции
+import math # импортируем модуль math для математических операций
+import pickle # импортируем pickle для устойчивой сериализации значений
+import threading # импортируем threading для блокировки при доступе из нескольких потоков
+import time # импортируем time для монотонных часов TTL
+import types # импортируем types для проверки модулей и объектов кода
+import weakref # импортируем weakref, чтобы запомненные отпечатки не удерживали функции
+import unittest # импортируем модуль unittest для создания unit-тестов
+from collections import OrderedDict # импортируем OrderedDict для порядка LRU
+from typing import NamedTuple # импортируем NamedTuple для статистики кэша
+
+import numpy as np # импортируем numpy для отпечатка массивов
+
+import main # импортируем функции интегрирования лабораторной работы
+
+
+def _digest_const(value, digest, seen: set):
+    '''
+    Функция _digest_const() добавляет в digest константу байт-кода; вложенный код
+    (генераторы списков, внутренние lambda) хешируется рекурсивно, а не через repr,
+    который содержит адрес объекта в памяти
+    '''
+    if isinstance(value, types.CodeType): # вложенный код
+        _digest_code(value, digest, seen) # хешируем его содержимое
+    elif isinstance(value, (tuple, frozenset)): # составная константа
+        items = list(value) # элементы константы
+        if isinstance(value, frozenset): # порядок элементов множества зависит от PYTHONHASHSEED
+            items.sort(key=repr) # упорядочиваем элементы
+        digest.update(type(value).__name__.encode() + b'(') # тип константы
+        for item in items: # элементы константы
+            _digest_const(item, digest, seen) # хешируем элемент
+        digest.update(b')') # конец константы
+    else: # числа, строки, None, Ellipsis
+        digest.update(repr(value).encode() + b';') # repr таких констант устойчив
+
+
+def _digest_code(code, digest, seen: set):
+    '''
+    Функция _digest_code() добавляет в digest байт-код, константы и имена code
+    и всех вложенных в него объектов кода
+    '''
+    digest.update(code.co_code) # байт-код
+    digest.update(repr(code.co_names).encode()) # имена глобальных переменных и атрибутов
+    for const in code.co_consts: # константы: lambda x: x * 2 и lambda x: x * 3 различаются
+        _digest_const(const, digest, seen) # хешируем константу
+
+
+@functools.lru_cache(maxsize=1024)
+def _code_names(code) -> frozenset:
+    '''
+    Функция _code_names() возвращает имена, на которые ссылается code и вложенный в него код
+    '''
+    names = set(code.co_names) # имена самого кода
+    for const in code.co_consts: # вложенный код
+        if isinstance(const, types.CodeType): # генератор списка или внутренняя функция
+            names |= _code_names(const) # имена вложенного кода
+    return frozenset(sorted(names)) # возвращаем имена (неизменяемые: результат запоминается)
+
+
+def _digest_value(value, digest, seen: set):
+    '''
+    Функция _digest_value() добавляет в digest значение глобальной или замкнутой переменной,
+    аргумента по умолчанию, аргумента partial или __self__ метода; значение сериализуется
+    целиком, поэтому объекты, различающиеся в любом месте, дают разные отпечатки
+
+    Вызывает:
+    ValueError -- если значение нельзя сериализовать (нужно передать key)
+    '''
+    if isinstance(value, types.ModuleType): # модуль задается именем
+        digest.update(b'module:' + value.__name__.encode()) # имя модуля
+    elif isinstance(value, type): # класс задается модулем и именем
+        digest.update(f'class:{value.__module__}.{value.__qualname__}'.encode()) # имя класса
+    elif isinstance(value, np.ndarray) and not value.dtype.hasobject: # массив numpy: repr сокращает большие массивы
+        digest.update(f'ndarray:{value.dtype.str}{value.shape}'.encode()) # тип и форма массива
+        digest.update(np.ascontiguousarray(value).tobytes()) # все элементы массива
+    elif callable(value) and (hasattr(value, '__code__') or hasattr(value, '__func__') or isinstance(value, functools.partial)): # функция
+        digest.update(repr(_fingerprint(value, seen)).encode()) # отпечаток функции
+    else: # остальные значения сериализуются pickle
+        try:
+            digest.update(pickle.dumps(value, protocol=4)) # байты значения
+        except Exception as error: # значение нельзя сериализовать целиком
+            if isinstance(value, (list, tuple)): # список или кортеж с функциями или локальными объектами
+                digest.update(type(value).__name__.encode() + b'(') # тип контейнера
+                for item in value: # элементы контейнера
+                    _digest_value(item, digest, seen) # хешируем элемент
+                digest.update(b')') # конец контейнера
+            elif isinstance(value, dict) or isinstance(getattr(value, '__dict__', None), dict): # словарь или объект локального класса
+                if not isinstance(value, dict): # объект: класс и его атрибуты
+                    digest.update(f'object:{type(value).__module__}.{type(value).__qualname__}'.encode()) # имя класса
+                items = value if isinstance(value, dict) else vars(value) # ключи и значения
+                _digest_value(sorted(items.items(), key=lambda item: repr(item[0])), digest, seen) # хешируем пары
+            else:
+                raise ValueError('Нельзя построить отпечаток функции, передайте key') from error # вызываем исключение
+
+
+_MARK = object() # метка вложенной функции в списке объектов, от которых зависит отпечаток
+_MEMO = weakref.WeakKeyDictionary() # функция (или объект метода) -> {функция: (объекты, отпечаток)}
+_MEMO_LOCK = threading.Lock() # отпечатки могут запрашиваться из нескольких потоков
+
+
+def _identity_state(f, seen: set, top: bool = False) -> list:
+    '''
+    Функция _identity_state() возвращает объекты, от которых зависит отпечаток f:
+    код, аргументы по умолчанию, значения замкнутых и глобальных переменных (для
+    вложенных функций -- их собственные объекты). Пока эти объекты те же самые,
+    отпечаток f не изменился, если они не изменялись на месте
+
+    Для метода верхнего уровня (top=True) сам объект метода не входит в список:
+    отпечаток запоминается по этому объекту, а ссылка на него не дала бы его удалить
+    '''
+    if id(f) in seen: # функция ссылается сама на себя
+        return [_MARK] # повторно не обходим
+    seen.add(id(f)) # отмечаем функцию
+    if isinstance(f, functools.partial): # частично примененная функция
+        state = [_MARK, *_identity_state(f.func, seen), *f.args, *f.keywords.keys(), *f.keywords.values()] # функция и аргументы
+        values = [] # вложенные значения уже добавлены
+    elif isinstance(f, types.MethodType): # метод объекта
+        state = [_MARK, *_identity_state(f.__func__, seen), *([] if top else [f.__self__]), *getattr(f.__self__, '__dict__', {}).values()] # функция, объект и его атрибуты
+        values = [] # вложенные значения уже добавлены
+    elif isinstance(f, types.FunctionType): # функция Python
+        state = [f.__code__, f.__defaults__, f.__kwdefaults__] # код и аргументы по умолчанию
+        values = [] # значения замкнутых и глобальных переменных
+        for cell in f.__closure__ or (): # замкнутые переменные
+            try:
+                values.append(cell.cell_contents) # значение переменной
+            except ValueError: # переменная еще не присвоена
+                values.append(None) # пустая ячейка
+        namespace = f.__globals__ # глобальные переменные модуля функции
+        values += [namespace.get(name, _MARK) for name in _code_names(f.__code__)] # значения глобальных переменных
+    else: # встроенная функция: отпечаток задается именем
+        return [f] # сам объект
+    for value in values: # значения переменных
+        if isinstance(value, (types.FunctionType, types.MethodType, functools.partial)): # вложенная функция
+            state += _identity_state(value, seen) # ее собственные объекты (сама функция не удерживается)
+        else:
+            state.append(value) # объект значения
+    return state # возвращаем объекты
+
+
+def fingerprint(f) -> tuple:
+    '''
+    Функция fingerprint() строит устойчивый отпечаток интегрируемой функции: одинаковые
+    по смыслу функции дают одинаковый отпечаток, даже если это разные объекты
+
+    В отпечаток входят байт-код (вместе с вложенным кодом), константы, значения глобальных
+    переменных, на которые ссылается код, аргументы по умолчанию, значения замкнутых
+    переменных, аргументы partial и __self__ метода. Значения сериализуются целиком
+    (массивы numpy -- через tobytes(), остальное -- через pickle)
+
+    Отпечаток запоминается для объекта функции и пересчитывается, только если у нее
+    сменились __code__, аргументы по умолчанию, значения замкнутых переменных или
+    глобальные переменные, на которые ссылается код (сравниваются сами объекты, а не
+    их содержимое), поэтому попадание в кэш не сериализует значения заново.
+    Изменение объекта на месте (arr[0] = 1 для замкнутого массива) отпечаток не меняет:
+    для таких функций передавайте key
+
+    Параметры:
+    f -- интегрируемая функция или описание C-функции из integrate_cy.KERNELS
+
+    Возвращает:
+    tuple -- отпечаток, пригодный для ключа словаря
+
+    Вызывает:
+    ValueError -- если для f нельзя построить отпечаток (нужно передать key)
+
+    >>> fingerprint(math.cos) == fingerprint(math.cos)
+    True
+    >>> fingerprint(lambda x: x * x) == fingerprint(lambda x: x * x)
+    True
+    >>> fingerprint(lambda x: x * x) == fingerprint(lambda x: x + x)
+    False
+    >>> fingerprint(lambda x: sum(x * k for k in (1, 2))) == fingerprint(lambda x: sum(x * k for k in (1, 2)))
+    True
+    '''
+    if isinstance(f, (str, tuple)): # описание C-функции
+        return ('kernel', repr(f)) # описание однозначно задает функцию
+    if isinstance(f, types.MethodType): # метод создается заново при каждом обращении, поэтому запоминаем по объекту
+        owner, name = f.__self__, f.__func__ # объект метода и функция
+    else:
+        owner, name = f, None # сама функция
+    try:
+        state = _identity_state(f, set(), top=True) # объекты, от которых зависит отпечаток
+        with _MEMO_LOCK: # читаем запомненные отпечатки под блокировкой
+            entry = _MEMO.get(owner, {}).get(name) # запомненные объекты и отпечаток
+    except TypeError: # объект нельзя хранить по слабой ссылке
+        return _fingerprint(f, set()) # строим отпечаток без запоминания
+    if entry is not None and len(entry[0]) == len(state) and all(old is new for old, new in zip(entry[0], state)): # объекты те же
+        return entry[1] # запомненный отпечаток
+    result = _fingerprint(f, set()) # строим отпечаток заново
+    with _MEMO_LOCK: # запоминаем отпечаток под блокировкой
+        _MEMO.setdefault(owner, {})[name] = (state, result) # объекты и отпечаток
+    return result # возвращаем отпечаток
+
+
+def _fingerprint(f, seen: set) -> tuple:
+    '''
+    Функция _fingerprint() строит отпечаток f без запоминания (см. fingerprint())
+    '''
+    if isinstance(f, (str, tuple)): # описание C-функции
+        return ('kernel', repr(f)) # описание однозначно задает функцию
+    if id(f) in seen: # функция ссылается сама на себя
+        return ('recursive', getattr(f, '__qualname__', '')) # имя вместо повторного обхода
+    seen.add(id(f)) # отмечаем функцию
+    try:
+        digest = hashlib.sha1() # хеш значений
+        if isinstance(f, functools.partial): # частично примененная функция
+            for value in (f.args, sorted(f.keywords.items())): # аргументы partial
+                _digest_value(value, digest, seen) # хешируем аргументы
+            return ('partial', _fingerprint(f.func, seen), digest.hexdigest()) # функция и ее аргументы
+        if hasattr(f, '__func__') and hasattr(f, '__self__'): # метод объекта: Lin(1).f и Lin(7).f различаются
+            _digest_value(f.__self__, digest, seen) # хешируем объект
+            return ('method', _fingerprint(f.__func__, seen), digest.hexdigest()) # функция и объект
+        code = getattr(f, '__code__', None) # байт-код Python-функции
+        if code is None: # встроенная функция (math.cos) или вызываемый объект
+            if callable(f) and getattr(f, '__module__', None) and getattr(f, '__qualname__', None): # встроенная функция модуля
+                return ('builtin', f.__module__, f.__qualname__) # имя однозначно задает функцию
+            raise ValueError('Нельзя построить отпечаток функции, передайте key') # вызываем исключение
+        _digest_code(code, digest, seen) # байт-код, константы и вложенный код
+        namespace = getattr(f, '__globals__', {}) # глобальные переменные модуля функции
+        for name in sorted(_code_names(code)): # имена, на которые ссылается код
+            if name in namespace: # глобальная переменная (встроенные функции и атрибуты пропускаются)
+                digest.update(b'global:' + name.encode()) # имя переменной
+                _digest_value(namespace[name], digest, seen) # ее текущее значение
+        _digest_value((f.__defaults__, sorted((f.__kwdefaults__ or {}).items())), digest, seen) # значения аргументов по умолчанию
+        for cell in f.__closure__ or (): # замкнутые переменные
+            try:
+                value = cell.cell_contents # значение переменной
+            except ValueError: # переменная еще не присвоена
+                value = None # пустая ячейка
+            _digest_value(value, digest, seen) # замыкания с разными значениями различаются
+        return ('function', f.__module__, f.__qualname__, digest.hexdigest()) # имя и хеш
+    finally:
+        seen.discard(id(f)) # отпечаток функции построен
+
+
+class CacheStats(NamedTuple):
+    '''
+    Класс CacheStats хранит статистику кэша
+    '''
+    hits: int # количество попаданий
+    misses: int # количество промахов
+    evictions: int # количество вытесненных записей (LRU)
+    expirations: int # количество устаревших записей (TTL)
+    size: int # текущее количество записей
+    maxsize: int # максимальное количество записей
+
+
+class IntegrationCache:
+    '''
+    Класс IntegrationCache хранит результаты интегрирования: ключ строится из отпечатка
+    функции, имени интегратора, пределов и остальных параметров. Старые записи вытесняются
+    по LRU при превышении maxsize и удаляются по истечении ttl секунд
+
+    Отпечаток функции запоминается (см. fingerprint()), поэтому попадание занимает
+    микросекунды даже для функций с большими замкнутыми массивами; если такой массив
+    изменяется на месте, передавайте key, иначе кэш вернет прежнее значение
+
+    Параметры:
+    maxsize -- максимальное количество записей
+    ttl -- время жизни записи в секундах (None -- без ограничения)
+    timer -- функция текущего времени (для тестов)
+
+    Вызывает:
+    ValueError -- если maxsize <= 0 или ttl <= 0
+
+    >>> cache = IntegrationCache(maxsize=2)
+    >>> integrate = cache.wrap(main.integrate)
+    >>> integrate(math.cos, 0, 1, n_iter=10) == integrate(math.cos, 0, 1, n_iter=10)
+    True
+    >>> cache.stats()
+    CacheStats(hits=1, misses=1, evictions=0, expirations=0, size=1, maxsize=2)
+    '''
+    def __init__(self, maxsize: int = 1024, ttl: float | None = None, *, timer=time.monotonic):
+        if maxsize <= 0: # проверяем размер кэша
+            raise ValueError('maxsize должен быть положительным числом') # вызываем исключение
+        if ttl is not None and ttl <= 0: # проверяем время жизни записи
+            raise ValueError('ttl должен быть положительным числом') # вызываем исключение
+        self.maxsize = maxsize # максимальное количество записей
+        self.ttl = ttl # время жизни записи
+        self._timer = timer # функция текущего времени
+        self._entries = OrderedDict() # ключ -> (время устаревания, значение), последние -- недавно использованные
+        self._lock = threading.Lock() # кэш может использоваться из нескольких потоков
+        self._hits = self._misses = self._evictions = self._expirations = 0 # счетчики статистики
+
+    def make_key(self, fn, f, a: float, b: float, key=None, **params) -> tuple:
+        '''
+        Функция make_key() строит ключ записи
+
+        Параметры:
+        fn -- функция интегрирования (main.integrate, main.integrate_threaded, ...)
+        f -- интегрируемая функция
+        a -- нижний предел интегрирования
+        b -- верхний предел интегрирования
+        key -- пользовательский ключ вместо отпечатка f
+        params -- остальные именованные параметры fn (n_iter, method, n_jobs, ...)
+
+        Возвращает:
+        tuple -- ключ записи
+        '''
+        function = ('key', key) if key is not None else fingerprint(f) # отпечаток функции или ключ пользователя
+        return (fn.__module__, fn.__qualname__, function, float(a), float(b), tuple(sorted(params.items()))) # ключ записи
+
+    def get_or_compute(self, fn, f, a: float, b: float, *, key=None, **params) -> float:
+        '''
+        Функция get_or_compute() возвращает значение из кэша или вычисляет его
+        вызовом fn(f, a, b, **params) и сохраняет
+
+        Параметры:
+        fn -- функция интегрирования
+        f -- интегрируемая функция
+        a -- нижний предел интегрирования
+        b -- верхний предел интегрирования
+        key -- пользовательский ключ вместо отпечатка f
+        params -- остальные именованные параметры fn
+
+        Возвращает:
+        float -- значение интеграла
+        '''
+        entry_key = self.make_key(fn, f, a, b, key, **params) # ключ записи
+        with self._lock: # ищем запись под блокировкой
+            entry = self._entries.get(entry_key) # запись или None
+            if entry is not None and entry[0] is not None and entry[0] <= self._timer(): # запись устарела
+                del self._entries[entry_key] # удаляем устаревшую запись
+                self._expirations += 1 # считаем устаревание
+                entry = None # считаем промахом
+            if entry is not None: # попадание
+                self._entries.move_to_end(entry_key) # запись становится недавно использованной
+                self._hits += 1 # считаем попадание
+                return entry[1] # возвращаем сохраненное значение
+            self._misses += 1 # считаем промах
+
+        value = fn(f, a, b, **params) # вычисляем интеграл вне блокировки, чтобы не останавливать другие потоки
+        expires = None if self.ttl is None else self._timer() + self.ttl # время устаревания записи
+        with self._lock: # сохраняем запись под блокировкой
+            self._entries[entry_key] = (expires, value) # сохраняем значение
+            self._entries.move_to_end(entry_key) # запись становится недавно использованной
+            while len(self._entries) > self.maxsize: # кэш переполнен
+                self._entries.popitem(last=False) # вытесняем давно не использованную запись
+                self._evictions += 1 # считаем вытеснение
+        return value # возвращаем вычисленное значение
+
+    def wrap(self, fn):
+        '''
+        Функция wrap() возвращает версию fn с кэшированием результатов; обертка
+        принимает дополнительный именованный аргумент key
+
+        Параметры:
+        fn -- функция интегрирования с сигнатурой fn(f, a, b, **params)
+
+        Возвращает:
+        function -- функция с той же сигнатурой и аргументом key
+        '''
+        @functools.wraps(fn) # сохраняем имя и документацию fn
+        def cached(f, a, b, *, key=None, **params):
+            return self.get_or_compute(fn, f, a, b, key=key, **params) # значение из кэша или вычисленное
+        cached.cache = self # доступ к кэшу через обертку
+        return cached # возвращаем обертку
+
+    def stats(self) -> CacheStats:
+        '''
+        Функция stats() возвращает статистику кэша
+
+        Возвращает:
+        CacheStats -- попадания, промахи, вытеснения, устаревания и размер
+        '''
+        with self._lock: # читаем счетчики под блокировкой
+            return CacheStats(self._hits, self._misses, self._evictions, self._expirations, len(self._entries), self.maxsize) # статистика
+
+    def clear(self):
+        '''
+        Функция clear() удаляет все записи и обнуляет статистику
+        '''
+        with self._lock: # изменяем кэш под блокировкой
+            self._entries.clear() # удаляем записи
+            self._hits = self._misses = self._evictions = self._expirations = 0 # обнуляем счетчики
+
+
+DEFAULT_CACHE = IntegrationCache() # общий кэш для готовых оберток
+cached_integrate = DEFAULT_CACHE.wrap(main.integrate) # integrate с кэшированием
+cached_integrate_threaded = DEFAULT_CACHE.wrap(main.integrate_threaded) # integrate_threaded с кэшированием
+cached_integrate_processes = DEFAULT_CACHE.wrap(main.integrate_processes) # integrate_processes с кэшированием
+
+
+class TestIntegrationCache(unittest.TestCase):
+    '''
+    Класс TestIntegrationCache содержит unit-тесты для кэша результатов интегрирования
+    '''
+    def test_hits_and_keys(self):
+        '''
+        Функция test_hits_and_keys() проверяет попадания и различение ключей
+        '''
+        cache = IntegrationCache() # новый кэш
+        integrate = cache.wrap(main.integrate) # integrate с кэшированием
+        threaded = cache.wrap(main.integrate_threaded) # integrate_threaded с кэшированием
+        expected = main.integrate(math.cos, 0, 1, n_iter=100) # значение без кэша
+        self.assertEqual(integrate(math.cos, 0, 1, n_iter=100), expected) # промах
+        self.assertEqual(integrate(math.cos, 0, 1, n_iter=100), expected) # попадание
+        integrate(math.cos, 0, 1, n_iter=100, method='simpson') # другой метод -- промах
+        integrate(math.sin, 0, 1, n_iter=100) # другая функция -- промах
+        threaded(math.cos, 0, 1, n_iter=100, n_jobs=2) # другой интегратор -- промах
+        integrate(lambda x: x * 2, 0, 1, n_iter=10) # промах
+        integrate(lambda x: x * 2, 0, 1, n_iter=10) # тот же код в новом объекте -- попадание
+        integrate(lambda x: x * 3, 0, 1, n_iter=10) # другая константа -- промах
+        scale = 4 # значение замкнутой переменной
+        integrate(lambda x: x * scale, 0, 1, n_iter=10) # промах
+        scale = 5 # новое значение замкнутой переменной
+        self.assertAlmostEqual(integrate(lambda x: x * scale, 0, 1, n_iter=10), 2.25) # другое значение -- промах
+        self.assertEqual(integrate(lambda x: 0.0, 0, 1, n_iter=10, key='cos'), 0.0) # пользовательский ключ -- промах
+        self.assertEqual(integrate(math.cos, 0, 1, n_iter=10, key='cos'), 0.0) # тот же ключ -- попадание
+        self.assertEqual(fingerprint(('poly', [1, 2])), fingerprint(('poly', [1, 2]))) # описание C-функции
+        self.assertNotEqual(fingerprint(functools.partial(math.pow, 2)), fingerprint(functools.partial(math.pow, 3))) # разные аргументы partial
+        self.assertEqual(cache.stats()[:2], (3, 9)) # попадания и промахи
+
+    def test_fingerprint_values(self):
+        '''
+        Функция test_fingerprint_values() проверяет, что в отпечаток входят значения глобальных
+        переменных, объект метода, массивы numpy целиком и вложенный код
+        '''
+        cache = IntegrationCache() # новый кэш
+        integrate = cache.wrap(main.integrate) # integrate с кэшированием
+        namespace = {'K': 1} # глобальные переменные модуля функции
+        exec('def g(x): return K * x', namespace) # функция, читающая глобальную переменную K
+        self.assertAlmostEqual(integrate(namespace['g'], 0, 1, n_iter=10), 0.45) # K = 1
+        namespace['K'] = 100 # меняем глобальную переменную
+        self.assertAlmostEqual(integrate(namespace['g'], 0, 1, n_iter=10), 45.0) # новое значение -- промах
+
+        class Lin:
+            def __init__(self, k):
+                self.k = k # коэффициент
+            def f(self, x):
+                return self.k * x # линейная функция
+        self.assertAlmostEqual(integrate(Lin(1).f, 0, 1, n_iter=10), 0.45) # метод объекта Lin(1)
+        self.assertAlmostEqual(integrate(Lin(7).f, 0, 1, n_iter=10), 3.15) # другой объект -- промах
+        self.assertAlmostEqual(integrate(Lin(7).f, 0, 1, n_iter=10), 3.15) # тот же объект по значению -- попадание
+
+        def make(values):
+            return lambda x: values.sum() * x # замыкание на массив
+        first = np.zeros(5000) # большой массив (repr сокращает его)
+        second = first.copy() # такой же массив
+        second[2500] = 400.0 # отличается в середине
+        self.assertEqual(integrate(make(first), 0, 1, n_iter=10), 0.0) # промах
+        self.assertEqual(integrate(make(second), 0, 1, n_iter=10), main.integrate(make(second), 0, 1, n_iter=10)) # другой массив -- промах
+        self.assertEqual(fingerprint(lambda x: [x * k for k in (1, 2)][1]), fingerprint(lambda x: [x * k for k in (1, 2)][1])) # вложенный код без адресов
+        self.assertNotEqual(fingerprint(lambda x: [x * k for k in (1, 2)][1]), fingerprint(lambda x: [x + k for k in (1, 2)][1])) # разный вложенный код
+        self.assertEqual(cache.stats()[:2], (1, 6)) # попадания и промахи
+        with self.assertRaises(ValueError): # значение нельзя сериализовать
+            fingerprint(lambda x: x * bool(cache._lock)) # замыкание на кэш с блокировкой
+
+    def test_fingerprint_memo(self):
+        '''
+        Функция test_fingerprint_memo() проверяет, что отпечаток запоминается для объекта функции
+        и строится заново только при смене кода, замкнутых или глобальных переменных
+        '''
+        global _fingerprint
+        calls = [] # функции, для которых отпечаток строился заново
+        original = _fingerprint # настоящая функция построения отпечатка
+
+        def counting(f, seen):
+            calls.append(f) # считаем построение отпечатка
+            return original(f, seen) # строим отпечаток
+        _fingerprint = counting # подменяем функцию в модуле
+        try:
+            values = np.zeros(10 ** 6) # большой замкнутый массив
+            f = lambda x: values[0] + x # функция с замыканием
+            first = fingerprint(f) # отпечаток строится
+            self.assertIs(fingerprint(f), first) # попадание: массив не хешируется заново
+            self.assertEqual(len(calls), 1) # отпечаток построен один раз
+            values[0] = 1.0 # изменение на месте отпечаток не меняет (нужен key)
+            self.assertIs(fingerprint(f), first) # запомненный отпечаток
+            values = np.ones(10 ** 6) # новое значение замкнутой переменной
+            self.assertNotEqual(fingerprint(f), first) # отпечаток построен заново
+            f.__defaults__ = (2,) # новые аргументы по умолчанию
+            fingerprint(f) # отпечаток построен заново
+            self.assertEqual(len(calls), 3) # три построения
+        finally:
+            _fingerprint = original # возвращаем настоящую функцию
+
+    def test_lru_and_ttl(self):
+        '''
+        Функция test_lru_and_ttl() проверяет вытеснение LRU, устаревание по TTL и некорректные аргументы
+        '''
+        now = [0.0] # текущее время управляется тестом
+        cache = IntegrationCache(maxsize=2, ttl=10, timer=lambda: now[0]) # маленький кэш со сроком жизни
+        integrate = cache.wrap(main.integrate) # integrate с кэшированием
+        integrate(math.cos, 0, 1, n_iter=10) # запись 1
+        integrate(math.cos, 0, 2, n_iter=10) # запись 2
+        integrate(math.cos, 0, 1, n_iter=10) # запись 1 становится недавно использованной
+        integrate(math.cos, 0, 3, n_iter=10) # запись 3 вытесняет запись 2
+        integrate(math.cos, 0, 1, n_iter=10) # запись 1 осталась -- попадание
+        now[0] = 11.0 # время жизни записей истекло
+        integrate(math.cos, 0, 1, n_iter=10) # устаревшая запись -- промах
+        self.assertEqual(cache.stats(), CacheStats(hits=2, misses=4, evictions=1, expirations=1, size=2, maxsize=2)) # статистика
+        cache.clear() # очищаем кэш
+        self.assertEqual(cache.stats(), CacheStats(0, 0, 0, 0, 0, 2)) # кэш пуст
+        with self.assertRaises(ValueError): # некорректный размер
+            IntegrationCache(maxsize=0) # создаем кэш
+        with self.assertRaises(ValueError): # некорректное время жизни
+            IntegrationCache(ttl=0) # создаем кэш
+        with self.assertRaises(ValueError): # объект без кода и имени
+            fingerprint(object()) # отпечаток нельзя построить
+
+
+if __name__ == '__main__':
+    unittest.main() # запускаем тесты
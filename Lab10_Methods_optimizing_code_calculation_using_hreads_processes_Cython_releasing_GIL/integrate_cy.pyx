@@ -1,43 +1,112 @@
 import math # импортируем стандартный модуль math для математических функций
 import cython # импортируем модуль cython для аннотаций и директив
 from libc.math cimport cos as c_cos # импортируем C-функцию cos из стандартной библиотеки C
+from libc.math cimport sin as c_sin, exp as c_exp, fabs # импортируем C-функции sin, exp и модуль числа fabs
 from cython.parallel import prange # импортируем prange для параллельных циклов в Cython
+from array import array # импортируем array для хранения параметров подынтегральных функций
+
+
+# квадратурные правила на одном разбиении, приведенном к [0, 1]: имя -> (узлы, веса), как RULES в main.py
+RULES = {
+    'rectangle': ((0.0,), (1.0,)), # прямоугольники по значению в начале разбиения
+    'midpoint': ((0.5,), (1.0,)), # средние прямоугольники
+    'trapezoid': ((0.0, 1.0), (0.5, 0.5)), # трапеции
+    'simpson': ((0.0, 0.5, 1.0), (1/6, 4/6, 1/6)), # Симпсон
+    'gauss2': ((0.5 - math.sqrt(3)/6, 0.5 + math.sqrt(3)/6), (0.5, 0.5)), # Гаусс--Лежандр 2 узла
+    'gauss3': ((0.5 - math.sqrt(15)/10, 0.5, 0.5 + math.sqrt(15)/10), (5/18, 8/18, 5/18)), # Гаусс--Лежандр 3 узла
+}
+
+
+def _rule_arrays(method):
+    '''
+    Функция _rule_arrays() возвращает узлы и веса правила method в виде array('d')
+
+    Вызывает:
+    ValueError -- если правило неизвестно
+    '''
+    if method not in RULES: # проверяем, что правило есть в таблице
+        raise ValueError(f'Неизвестный метод {method!r}, доступны: {", ".join(RULES)}') # вызываем исключение
+    nodes, weights = RULES[method] # узлы и веса правила
+    return array('d', nodes), array('d', weights) # копируем в компактные массивы double
 
 
 @cython.boundscheck(False) # отключаем проверку границ массивов для ускорения
 @cython.wraparound(False) # отключаем проверку индексов с отрицательными значениями
-def integrate_cy(f: callable, double a, double b, int n_iter=100000):
+cdef inline void _neumaier_add(double* s, double* c, double v) noexcept nogil:
+    '''
+    Функция _neumaier_add() прибавляет v к сумме s методом Кэхэна--Неймайера,
+    накапливая потерянные младшие разряды в поправке c
+    '''
+    cdef double total = s[0] + v # новая сумма
+    if fabs(s[0]) >= fabs(v): # потеряны младшие разряды v
+        c[0] += (s[0] - total) + v # запоминаем потерю
+    else: # потеряны младшие разряды s
+        c[0] += (v - total) + s[0] # запоминаем потерю
+    s[0] = total # обновляем сумму
+
+
+def integrate_cy(f: callable, double a, double b, int n_iter=100000, method='rectangle', bint compensated=False):
     '''
     Функция integrate_cy() является Cython-оптимизированной версией функции интегрирования
-    методом прямоугольников
-    
+    методом прямоугольников или другим правилом из RULES
+
     Параметры:
     f -- Python-функция для интегрирования
     a -- нижний предел интегрирования
     b -- верхний предел интегрирования
     n_iter -- количество итераций
-    
+    method -- квадратурное правило из RULES
+    compensated -- суммировать методом Кэхэна--Неймайера
+
     Возвращает:
     double -- приближенное значение интеграла
-    
+
     Вызывает:
-    ValueError -- если n_iter <= 0 или b <= a
+    ValueError -- если n_iter <= 0, b <= a или method неизвестен
     '''
     if n_iter <= 0: # проверяем корректность количества итераций
         raise ValueError('n_iter должен быть положительным числом') # вызываем исключение
     if b <= a: # проверяем корректность пределов интегрирования
         raise ValueError('b должен быть больше a') # вызываем исключение
-    
+    nodes, weights = _rule_arrays(method) # узлы и веса правила
+
     cdef double acc = 0.0 # объявляем C-переменную acc типа double для накопления суммы
+    cdef double comp = 0.0 # поправка компенсированного суммирования
     cdef double step = (b - a) / n_iter # объявляем C-переменную step для шага интегрирования
     cdef double x # объявляем C-переменную x для текущей точки
     cdef int i # объявляем C-переменную i для счетчика цикла
-    
-    for i in range(n_iter): # выполняем цикл интегрирования
-        x = a + i * step # вычисляем текущую точку x
-        acc += f(x) * step # добавляем площадь прямоугольника, вызывая Python-функцию
-    
-    return acc # возвращаем результат интегрирования
+    cdef double[::1] t = nodes # узлы правила
+    cdef double[::1] w = weights # веса правила
+    cdef Py_ssize_t k, k0 = 0, k1 = t.shape[0] # диапазон узлов, вычисляемых на каждом разбиении
+    cdef double edge = 0.0 # вес общих узлов на границах соседних разбиений
+
+    if method == 'rectangle' and not compensated: # исходный метод прямоугольников
+        for i in range(n_iter): # выполняем цикл интегрирования
+            x = a + i * step # вычисляем текущую точку x
+            acc += f(x) * step # добавляем площадь прямоугольника, вызывая Python-функцию
+        return acc # возвращаем результат интегрирования
+
+    if k1 > 1 and t[0] == 0.0 and t[k1 - 1] == 1.0: # концы разбиений общие
+        k0, k1 = 1, k1 - 1 # концы считаем отдельно, один раз на границу
+        edge = w[0] + w[t.shape[0] - 1] # граница входит в два соседних разбиения
+        acc = w[0] * f(a) + w[t.shape[0] - 1] * f(b) # крайние точки входят по одному разу
+
+    if not compensated: # обычное суммирование
+        for i in range(n_iter): # выполняем цикл интегрирования
+            x = a + i * step # начало текущего разбиения
+            if edge != 0.0 and i > 0: # внутренняя граница разбиений
+                acc += edge * f(x) # одно вычисление на два соседних разбиения
+            for k in range(k0, k1): # внутренние узлы разбиения
+                acc += w[k] * f(x + t[k] * step) # прибавляем взвешенное значение в узле
+        return acc * step # умножаем взвешенную сумму на ширину разбиения
+
+    for i in range(n_iter): # тот же цикл с компенсированным суммированием
+        x = a + i * step # начало текущего разбиения
+        if edge != 0.0 and i > 0: # внутренняя граница разбиений
+            _neumaier_add(&acc, &comp, edge * f(x)) # одно вычисление на два соседних разбиения
+        for k in range(k0, k1): # внутренние узлы разбиения
+            _neumaier_add(&acc, &comp, w[k] * f(x + t[k] * step)) # прибавляем взвешенное значение в узле
+    return (acc + comp) * step # сумма с поправкой, умноженная на ширину разбиения
 
 
 @cython.boundscheck(False) # отключаем проверку границ массивов
@@ -99,16 +168,455 @@ def integrate_cos_nogil(double a, double b, int n_iter=100000):
 @cython.wraparound(False) # отключаем проверку отрицательных индексов
 def integrate_cos_nogil_prange(double a, double b, int n_iter=100000, int n_threads=4):
     '''
-    Функция integrate_cos_nogil_prange() является упрощенной многопоточной версией
-    для демонстрации использования noGIL с параллельным выполнением
-    
+    Функция integrate_cos_nogil_prange() является многопоточной версией
+    с отпусканием GIL: цикл распределяется между потоками OpenMP через prange,
+    а частичные суммы потоков объединяются редукцией по переменной acc
+
     Параметры:
     a -- нижний предел интегрирования
     b -- верхний предел интегрирования
     n_iter -- количество итераций
     n_threads -- количество потоков
-    
+
     Возвращает:
     double -- приближенное значение интеграла cos(x) на отрезке [a, b]
+
+    Вызывает:
+    ValueError -- если n_iter <= 0, b <= a или n_threads <= 0
+    '''
+    if n_iter <= 0: # проверяем корректность количества итераций
+        raise ValueError('n_iter должен быть положительным числом') # вызываем исключение
+    if b <= a: # проверяем корректность пределов интегрирования
+        raise ValueError('b должен быть больше a') # вызываем исключение
+    if n_threads <= 0: # проверяем корректность количества потоков
+        raise ValueError('n_threads должен быть положительным числом') # вызываем исключение
+
+    cdef double acc = 0.0 # переменная редукции: каждый поток копит свою частичную сумму
+    cdef double step = (b - a) / n_iter # объявляем C-переменную step для шага интегрирования
+    cdef int i # объявляем C-переменную i для счетчика цикла
+
+    with nogil: # отпускаем GIL на время параллельного цикла
+        for i in prange(n_iter, num_threads=n_threads, schedule='static'): # делим итерации между потоками поровну
+            acc += c_cos(a + i * step) * step # оператор += делает acc переменной редукции OpenMP
+
+    return acc # возвращаем сумму частичных сумм всех потоков
+
+
+# тип C-функции подынтегрального выражения: точка x, массив параметров и его длина
+ctypedef double (*kernel_t)(double x, const double* p, Py_ssize_t n) noexcept nogil
+
+
+cdef double _kernel_sin(double x, const double* p, Py_ssize_t n) noexcept nogil:
+    return p[0] * c_sin(p[1] * x) # amplitude * sin(freq * x)
+
+
+cdef double _kernel_cos(double x, const double* p, Py_ssize_t n) noexcept nogil:
+    return p[0] * c_cos(p[1] * x) # amplitude * cos(freq * x)
+
+
+cdef double _kernel_exp(double x, const double* p, Py_ssize_t n) noexcept nogil:
+    return p[0] * c_exp(p[1] * x) # amplitude * exp(rate * x)
+
+
+cdef double _kernel_poly(double x, const double* p, Py_ssize_t n) noexcept nogil:
+    cdef double acc = 0.0 # значение многочлена по схеме Горнера
+    cdef Py_ssize_t k # индекс коэффициента
+    for k in range(n - 1, -1, -1): # идем от старшего коэффициента к младшему
+        acc = acc * x + p[k] # p[0] + p[1]*x + p[2]*x**2 + ...
+    return acc # возвращаем значение многочлена
+
+
+cdef double _kernel_gauss(double x, const double* p, Py_ssize_t n) noexcept nogil:
+    cdef double z = (x - p[0]) / p[1] # нормируем точку: (x - mu) / sigma
+    return p[2] * c_exp(-0.5 * z * z) # amplitude * exp(-z**2 / 2)
+
+
+# реестр C-функций: имя -> (номер в таблице указателей, параметры по умолчанию)
+KERNELS = {
+    'sin': (0, (1.0, 1.0)), # amplitude, freq
+    'cos': (1, (1.0, 1.0)), # amplitude, freq
+    'exp': (2, (1.0, 1.0)), # amplitude, rate
+    'poly': (3, None), # коэффициенты многочлена от младшего к старшему, обязательны
+    'gauss': (4, (0.0, 1.0, 1.0)), # mu, sigma, amplitude
+}
+
+cdef kernel_t _kernel_table[5] # таблица указателей на C-функции в порядке номеров KERNELS
+_kernel_table[0] = _kernel_sin
+_kernel_table[1] = _kernel_cos
+_kernel_table[2] = _kernel_exp
+_kernel_table[3] = _kernel_poly
+_kernel_table[4] = _kernel_gauss
+
+
+def kernel_names():
+    '''
+    Функция kernel_names() возвращает имена C-функций, доступных для интегрирования без GIL
+
+    Возвращает:
+    tuple -- отсортированные имена из реестра KERNELS
+    '''
+    return tuple(sorted(KERNELS)) # возвращаем имена реестра
+
+
+def parse_kernel(spec):
+    '''
+    Функция parse_kernel() разбирает описание подынтегральной функции
+
+    Параметры:
+    spec -- имя функции ('sin') или пара (имя, параметры), например ('poly', [1, 3, 2])
+
+    Возвращает:
+    tuple -- (номер функции в таблице, array('d') параметров)
+
+    Вызывает:
+    ValueError -- если функция неизвестна или параметры некорректны
+    '''
+    if isinstance(spec, str): # передано только имя функции
+        name, params = spec, None # параметры берем по умолчанию
+    else:
+        name, params = spec # передана пара (имя, параметры)
+    if name not in KERNELS: # проверяем, что функция есть в реестре
+        raise ValueError(f'Неизвестная функция {name!r}, доступны: {", ".join(kernel_names())}') # вызываем исключение
+    index, defaults = KERNELS[name] # номер функции и параметры по умолчанию
+    if params is None: # параметры не переданы
+        if defaults is None: # у функции нет параметров по умолчанию
+            raise ValueError(f'Для функции {name!r} нужно передать параметры') # вызываем исключение
+        params = defaults # используем параметры по умолчанию
+    params = array('d', params) # копируем параметры в компактный массив double
+    if len(params) == 0: # многочлену нужен хотя бы один коэффициент
+        raise ValueError('Список параметров не должен быть пустым') # вызываем исключение
+    if defaults is not None and len(params) != len(defaults): # проверяем количество параметров
+        raise ValueError(f'Функция {name!r} принимает {len(defaults)} параметра(ов)') # вызываем исключение
+    if name == 'gauss' and params[1] <= 0: # sigma должна быть положительной
+        raise ValueError('sigma должна быть положительной') # вызываем исключение
+    return index, params # возвращаем номер функции и параметры
+
+
+cdef enum:
+    N_BLOCKS = 64 # количество блоков компенсированного суммирования, не зависит от числа потоков
+
+
+cdef inline double _panel(kernel_t kernel, const double* p, Py_ssize_t n, double x, double step, const double* t,
+                          const double* w, Py_ssize_t k0, Py_ssize_t k1, double edge, int i) noexcept nogil:
+    '''
+    Функция _panel() вычисляет взвешенную сумму значений kernel в узлах разбиения с началом x
+    '''
+    cdef double panel = 0.0 # вклад разбиения
+    cdef Py_ssize_t k # номер узла
+    if edge != 0.0 and i > 0: # внутренняя граница разбиений
+        panel = edge * kernel(x, p, n) # одно вычисление на два соседних разбиения
+    for k in range(k0, k1): # внутренние узлы разбиения
+        panel = panel + w[k] * kernel(x + t[k] * step, p, n) # прибавляем взвешенное значение в узле
+    return panel # возвращаем вклад разбиения
+
+
+@cython.boundscheck(False) # отключаем проверку границ массивов
+@cython.wraparound(False) # отключаем проверку отрицательных индексов
+cdef double _rule_sum_nogil(kernel_t kernel, const double* p, Py_ssize_t n, double a, double b, int n_iter,
+                            const double* t, const double* w, Py_ssize_t m, int n_threads, bint compensated) noexcept nogil:
+    '''
+    Функция _rule_sum_nogil() вычисляет составное правило с узлами t и весами w
+    для C-функции kernel без GIL, распределяя разбиения между n_threads потоками
+
+    При compensated разбиения делятся на N_BLOCKS фиксированных блоков, каждый блок
+    суммируется методом Кэхэна--Неймайера, а суммы блоков складываются по порядку:
+    результат не зависит ни от количества потоков, ни от порядка их завершения
+    '''
+    cdef double step = (b - a) / n_iter # шаг интегрирования
+    cdef double acc = 0.0 # переменная редукции по разбиениям
+    cdef double ends = 0.0 # вклад крайних точек для правил с общими концами
+    cdef double edge = 0.0 # вес общих узлов на границах соседних разбиений
+    cdef double panel, s, c, total # вклад разбиения, сумма и поправка блока, новая сумма (приватные для потока)
+    cdef double block_sums[N_BLOCKS] # суммы блоков компенсированного суммирования
+    cdef Py_ssize_t k0 = 0, k1 = m # диапазон узлов, вычисляемых на каждом разбиении
+    cdef int i, block # номер разбиения и номер блока
+
+    if m > 1 and t[0] == 0.0 and t[m - 1] == 1.0: # концы разбиений общие
+        k0, k1 = 1, m - 1 # концы считаем отдельно, один раз на границу
+        edge = w[0] + w[m - 1] # граница входит в два соседних разбиения
+        ends = w[0] * kernel(a, p, n) + w[m - 1] * kernel(b, p, n) # крайние точки входят по одному разу
+
+    if not compensated: # обычное суммирование с редукцией OpenMP
+        for i in prange(n_iter, num_threads=n_threads, schedule='static'): # распределяем разбиения между потоками
+            acc += _panel(kernel, p, n, a + i * step, step, t, w, k0, k1, edge, i) # acc -- переменная редукции OpenMP
+        return (acc + ends) * step # умножаем взвешенную сумму на ширину разбиения
+
+    for block in prange(N_BLOCKS, num_threads=n_threads, schedule='static'): # блоки распределяются между потоками
+        s = 0.0 # сумма блока (присваивания без += чтобы переменные остались приватными)
+        c = 0.0 # накопленная поправка на потерянные младшие разряды
+        for i in range(<int>(<long long>block * n_iter // N_BLOCKS), <int>((<long long>block + 1) * n_iter // N_BLOCKS)): # разбиения блока
+            panel = _panel(kernel, p, n, a + i * step, step, t, w, k0, k1, edge, i) # вклад разбиения
+            total = s + panel # новая сумма
+            if fabs(s) >= fabs(panel): # потеряны младшие разряды panel
+                c = c + ((s - total) + panel) # запоминаем потерю
+            else: # потеряны младшие разряды s
+                c = c + ((panel - total) + s) # запоминаем потерю
+            s = total # обновляем сумму
+        block_sums[block] = s + c # сумма блока с поправкой
+
+    s, c = ends, 0.0 # складываем суммы блоков по порядку тем же методом
+    for block in range(N_BLOCKS): # проходим по блокам
+        _neumaier_add(&s, &c, block_sums[block]) # прибавляем сумму блока
+    return (s + c) * step # умножаем взвешенную сумму на ширину разбиения
+
+
+def integrate_kernel(spec, double a, double b, int n_iter=100000, int n_threads=1, method='rectangle', bint compensated=False):
+    '''
+    Функция integrate_kernel() интегрирует функцию из реестра KERNELS
+    методом прямоугольников или другим правилом из RULES полностью без GIL
+
+    Параметры:
+    spec -- имя функции или пара (имя, параметры), см. parse_kernel()
+    a -- нижний предел интегрирования
+    b -- верхний предел интегрирования
+    n_iter -- количество итераций
+    n_threads -- количество потоков OpenMP
+    method -- квадратурное правило из RULES
+    compensated -- суммировать методом Кэхэна--Неймайера в фиксированных блоках
+                   (результат воспроизводим при любом n_threads)
+
+    Возвращает:
+    double -- приближенное значение интеграла
+
+    Вызывает:
+    ValueError -- если n_iter <= 0, b <= a, n_threads <= 0, spec или method некорректны
+    '''
+    if n_iter <= 0: # проверяем корректность количества итераций
+        raise ValueError('n_iter должен быть положительным числом') # вызываем исключение
+    if b <= a: # проверяем корректность пределов интегрирования
+        raise ValueError('b должен быть больше a') # вызываем исключение
+    if n_threads <= 0: # проверяем корректность количества потоков
+        raise ValueError('n_threads должен быть положительным числом') # вызываем исключение
+
+    index, params = parse_kernel(spec) # получаем номер функции и ее параметры
+    nodes, weights = _rule_arrays(method) # узлы и веса правила
+    cdef double[::1] p = params # типизированное представление параметров без копирования
+    cdef double[::1] t = nodes # узлы правила
+    cdef double[::1] w = weights # веса правила
+    cdef kernel_t kernel = _kernel_table[<int>index] # указатель на C-функцию
+    cdef double result # результат интегрирования
+
+    with nogil: # весь цикл выполняется без GIL
+        result = _rule_sum_nogil(kernel, &p[0], p.shape[0], a, b, n_iter, &t[0], &w[0], t.shape[0], n_threads, compensated) # считаем правило
+
+    return result # возвращаем результат интегрирования
+
+
+@cython.boundscheck(False) # отключаем проверку границ массивов
+@cython.wraparound(False) # отключаем проверку отрицательных индексов
+def integrate_cumulative_cy(f, double a, double b, int n_iter=100000):
+    '''
+    Функция integrate_cumulative_cy() вычисляет интеграл от a до каждой точки сетки
+    методом прямоугольников; для описаний C-функций из KERNELS цикл идет без GIL
+
+    Параметры:
+    f -- Python-функция или описание C-функции, см. parse_kernel()
+    a -- нижний предел интегрирования
+    b -- верхний предел интегрирования
+    n_iter -- количество итераций
+
+    Возвращает:
+    array('d') -- n_iter + 1 значений, первый элемент равен 0, последний -- интегралу на [a, b]
+
+    Вызывает:
+    ValueError -- если n_iter <= 0, b <= a или описание функции некорректно
+    '''
+    if n_iter <= 0: # проверяем корректность количества итераций
+        raise ValueError('n_iter должен быть положительным числом') # вызываем исключение
+    if b <= a: # проверяем корректность пределов интегрирования
+        raise ValueError('b должен быть больше a') # вызываем исключение
+
+    result = array('d', [0.0]) * (n_iter + 1) # компактный массив double, заполненный нулями
+    cdef double[::1] out = result # типизированное представление результата без копирования
+    cdef double acc = 0.0 # объявляем C-переменную acc типа double для накопления суммы
+    cdef double step = (b - a) / n_iter # объявляем C-переменную step для шага интегрирования
+    cdef int i # объявляем C-переменную i для счетчика цикла
+    cdef double[::1] p # параметры C-функции
+    cdef kernel_t kernel # указатель на C-функцию
+
+    if isinstance(f, (str, tuple)): # f задана описанием C-функции
+        index, params = parse_kernel(f) # получаем номер функции и ее параметры
+        p = params # типизированное представление параметров
+        kernel = _kernel_table[<int>index] # указатель на C-функцию
+        with nogil: # весь цикл выполняется без GIL
+            for i in range(n_iter): # выполняем цикл интегрирования
+                acc += kernel(a + i * step, &p[0], p.shape[0]) * step # добавляем площадь прямоугольника
+                out[i + 1] = acc # записываем интеграл до правого конца разбиения
+    else:
+        for i in range(n_iter): # выполняем цикл интегрирования
+            acc += f(a + i * step) * step # добавляем площадь прямоугольника, вызывая Python-функцию
+            out[i + 1] = acc # записываем интеграл до правого конца разбиения
+
+    return result # возвращаем накопленные интегралы
+
+
+
+SAMPLE_METHODS = ('rectangle', 'trapezoid', 'simpson') # правила для интегрирования отсчетов
+
+
+@cython.boundscheck(False) # отключаем проверку границ массивов
+@cython.wraparound(False) # отключаем проверку отрицательных индексов
+def integrate_samples(const double[::1] y, double dx, method='trapezoid', int n_threads=1):
+    '''
+    Функция integrate_samples() интегрирует отсчеты y, взятые с постоянным шагом dx,
+    без GIL; y -- любой непрерывный буфер double (numpy.ndarray, array('d'), memoryview),
+    данные не копируются
+
+    Правила: 'rectangle' -- левые прямоугольники (как integrate()), 'trapezoid' -- трапеции,
+    'simpson' -- Симпсон; при нечетном количестве интервалов последние три интервала
+    считаются правилом Симпсона 3/8
+
+    Параметры:
+    y -- отсчеты функции в точках a, a + dx, ..., a + (len(y) - 1) * dx
+    dx -- шаг между отсчетами
+    method -- 'rectangle', 'trapezoid' или 'simpson'
+    n_threads -- количество потоков OpenMP
+
+    Возвращает:
+    double -- приближенное значение интеграла
+
+    Вызывает:
+    ValueError -- если отсчетов меньше двух, dx <= 0, n_threads <= 0, method неизвестен
+                  или буфер не является непрерывным массивом double
+    '''
+    cdef Py_ssize_t n = y.shape[0] - 1 # количество интервалов
+    cdef Py_ssize_t i, pairs # номер интервала и количество пар интервалов для Симпсона
+    cdef double acc = 0.0 # переменная редукции
+    cdef double tail = 0.0 # вклад хвоста, не вошедшего в пары Симпсона
+    if n < 1: # нужен хотя бы один интервал
+        raise ValueError('нужно хотя бы два отсчета') # вызываем исключение
+    if dx <= 0: # проверяем шаг
+        raise ValueError('dx должен быть положительным числом') # вызываем исключение
+    if n_threads <= 0: # проверяем количество потоков
+        raise ValueError('n_threads должен быть положительным числом') # вызываем исключение
+    if method not in SAMPLE_METHODS: # проверяем правило
+        raise ValueError(f'method должен быть одним из {SAMPLE_METHODS}') # вызываем исключение
+
+    if method == 'rectangle': # левые прямоугольники
+        for i in prange(n, nogil=True, num_threads=n_threads, schedule='static'): # все отсчеты, кроме последнего
+            acc += y[i] # acc -- переменная редукции OpenMP
+        return acc * dx # умножаем сумму на шаг
+
+    if method == 'trapezoid' or n < 2: # трапеции (и Симпсон на одном интервале)
+        for i in prange(1, n, nogil=True, num_threads=n_threads, schedule='static'): # внутренние отсчеты
+            acc += y[i] # внутренние отсчеты входят с весом 1
+        return (acc + 0.5 * (y[0] + y[n])) * dx # крайние отсчеты входят с весом 1/2
+
+    pairs = n // 2 if n % 2 == 0 else (n - 3) // 2 # пары интервалов для формулы Симпсона
+    if n % 2: # нечетное количество интервалов
+        tail = 3.0 / 8.0 * (y[n - 3] + 3.0 * y[n - 2] + 3.0 * y[n - 1] + y[n]) * dx # правило 3/8 на последних трех интервалах
+    for i in prange(pairs, nogil=True, num_threads=n_threads, schedule='static'): # пары интервалов
+        acc += y[2 * i] + 4.0 * y[2 * i + 1] + y[2 * i + 2] # формула Симпсона на паре
+    return acc * dx / 3.0 + tail # умножаем сумму на dx/3 и добавляем хвост
+
+
+@cython.boundscheck(False) # отключаем проверку границ массивов
+@cython.wraparound(False) # отключаем проверку отрицательных индексов
+def integrate_samples_xy(const double[::1] x, const double[::1] y, int n_threads=1):
+    '''
+    Функция integrate_samples_xy() интегрирует отсчеты y в неравномерно расположенных
+    точках x методом трапеций без GIL; x и y -- любые непрерывные буферы double, данные не копируются
+
+    Параметры:
+    x -- неубывающие абсциссы отсчетов
+    y -- значения функции в точках x
+    n_threads -- количество потоков OpenMP
+
+    Возвращает:
+    double -- приближенное значение интеграла от x[0] до x[-1]
+
+    Вызывает:
+    ValueError -- если длины x и y различаются, отсчетов меньше двух, x убывает где-либо
+                  или n_threads <= 0
+    '''
+    cdef Py_ssize_t n = y.shape[0] - 1 # количество интервалов
+    cdef Py_ssize_t i # номер интервала
+    cdef double acc = 0.0 # переменная редукции
+    cdef Py_ssize_t descending = 0 # количество убывающих шагов x
+    if x.shape[0] != y.shape[0]: # проверяем длины
+        raise ValueError('x и y должны иметь одинаковую длину') # вызываем исключение
+    if n < 1: # нужен хотя бы один интервал
+        raise ValueError('нужно хотя бы два отсчета') # вызываем исключение
+    if n_threads <= 0: # проверяем количество потоков
+        raise ValueError('n_threads должен быть положительным числом') # вызываем исключение
+
+    for i in prange(n, nogil=True, num_threads=n_threads, schedule='static'): # все интервалы
+        acc += (x[i + 1] - x[i]) * (y[i] + y[i + 1]) # удвоенная площадь трапеции
+        descending += x[i + 1] < x[i] # проверка порядка считается в том же проходе
+    if descending: # абсциссы не упорядочены
+        raise ValueError('x должен быть неубывающим') # вызываем исключение
+    return 0.5 * acc # площадь под ломаной
+
+# сведения о сборке вычисляются препроцессором C во время компиляции модуля
+cdef extern from *:
+    """
+    #ifdef _OPENMP
+    #include <omp.h>
+    static int cy_openmp_version(void) { return _OPENMP; }
+    static int cy_max_threads(void) { return omp_get_max_threads(); }
+    #else
+    static int cy_openmp_version(void) { return 0; }
+    static int cy_max_threads(void) { return 1; }
+    #endif
+
+    #if defined(__FAST_MATH__) || defined(_M_FP_FAST)
+    #define CY_FAST_MATH 1
+    #else
+    #define CY_FAST_MATH 0
+    #endif
+
+    static const char* cy_simd(void) {
+    #if defined(__AVX512F__)
+        return "avx512f";
+    #elif defined(__AVX2__)
+        return "avx2";
+    #elif defined(__AVX__)
+        return "avx";
+    #elif defined(__SSE4_2__)
+        return "sse4.2";
+    #elif defined(__SSE2__) || defined(_M_X64)
+        return "sse2";
+    #elif defined(__ARM_NEON) || defined(_M_ARM64)
+        return "neon";
+    #else
+        return "none";
+    #endif
+    }
+
+    static const char* cy_compiler(void) {
+    #if defined(__clang__)
+        return "clang " __clang_version__;
+    #elif defined(__GNUC__)
+        return "gcc " __VERSION__;
+    #elif defined(_MSC_VER)
+        #define CY_STR2(x) #x
+        #define CY_STR(x) CY_STR2(x)
+        return "msvc " CY_STR(_MSC_VER);
+    #else
+        return "unknown";
+    #endif
+    }
+    """
+    int cy_openmp_version() # версия OpenMP (0 -- собрано без OpenMP)
+    int cy_max_threads() # количество потоков OpenMP по умолчанию
+    int CY_FAST_MATH # собрано ли с fast-math
+    const char* cy_simd() # самый широкий набор SIMD-инструкций, разрешенный при сборке
+    const char* cy_compiler() # компилятор и его версия
+
+
+def build_info():
+    '''
+    Функция build_info() описывает, как собран модуль, чтобы результаты замеров
+    можно было связать со сборкой
+
+    Возвращает:
+    dict -- openmp (версия OpenMP в формате yyyymm, 0 -- без OpenMP), max_threads (потоков OpenMP
+            по умолчанию), simd (набор SIMD-инструкций, разрешенный компилятору), fast_math, compiler
     '''
-    return integrate_cos_nogil(a, b, n_iter) # возвращаем результат однопоточной версии
\ No newline at end of file
+    return {
+        'openmp': cy_openmp_version(), # версия OpenMP
+        'max_threads': cy_max_threads(), # потоков OpenMP по умолчанию
+        'simd': cy_simd().decode(), # набор SIMD-инструкций
+        'fast_math': bool(CY_FAST_MATH), # собрано ли с fast-math
+        'compiler': cy_compiler().decode(), # компилятор
+    }
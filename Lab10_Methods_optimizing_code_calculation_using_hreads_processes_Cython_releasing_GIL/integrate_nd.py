@@ -0,0 +1,426 @@
+import math # импортируем модуль math для математических операций
+import os # импортируем модуль os для определения количества ядер
+import statistics # импортируем statistics для медианы замеров
+import timeit # импортируем модуль timeit для замера времени выполнения
+import unittest # импортируем модуль unittest для создания unit-тестов
+from functools import lru_cache # импортируем lru_cache, чтобы направляющие числа Соболя считались один раз
+
+import numpy as np # импортируем numpy для векторных вычислений
+
+from main import Integrator, QuadResult, _get_rule # импортируем пул работников, результат и правила интегрирования
+
+
+_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19) # основания последовательности Холтона по измерениям
+
+# параметры Соболя (Joe, Kuo) для измерений 2..8: степень s, коэффициенты a и начальные m_1..m_s
+_SOBOL_PARAMS = (
+    (1, 0, (1,)), # измерение 2
+    (2, 1, (1, 3)), # измерение 3
+    (3, 1, (1, 3, 1)), # измерение 4
+    (3, 2, (1, 1, 1)), # измерение 5
+    (4, 1, (1, 1, 3, 3)), # измерение 6
+    (4, 4, (1, 3, 5, 13)), # измерение 7
+    (5, 2, (1, 1, 5, 5, 17)), # измерение 8
+)
+_SOBOL_BITS = 32 # разрядность точек Соболя: не больше 2**32 точек
+
+SEQUENCES = ('random', 'halton', 'sobol') # последовательности точек для integrate_mc()
+MAX_DIM = len(_PRIMES) # максимальная размерность квазислучайных последовательностей
+
+
+def halton(start: int, count: int, dim: int) -> np.ndarray:
+    '''
+    Функция halton() возвращает точки start..start+count-1 последовательности Холтона
+    в единичном кубе (точка 0 пропускается, так как она лежит в углу куба)
+
+    Параметры:
+    start -- номер первой точки
+    count -- количество точек
+    dim -- размерность (не больше MAX_DIM)
+
+    Возвращает:
+    np.ndarray -- массив формы (count, dim)
+
+    >>> halton(0, 3, 2).tolist()
+    [[0.5, 0.3333333333333333], [0.25, 0.6666666666666666], [0.75, 0.1111111111111111]]
+    '''
+    points = np.empty((count, dim)) # массив для точек
+    for d, base in enumerate(_PRIMES[:dim]): # по измерению на каждое простое основание
+        index = np.arange(start + 1, start + count + 1, dtype=np.int64) # номера точек без нулевой
+        value, scale = np.zeros(count), 1.0 # обратная запись числа и вес текущего разряда
+        while np.any(index > 0): # пока у номеров остаются разряды
+            scale /= base # вес следующего разряда после запятой
+            value += scale * (index % base) # переносим младший разряд за запятую
+            index //= base # отбрасываем младший разряд
+        points[:, d] = value # записываем измерение
+    return points # возвращаем точки
+
+
+@lru_cache(maxsize=None)
+def _sobol_directions(dim: int) -> np.ndarray:
+    '''
+    Функция _sobol_directions() вычисляет направляющие числа Соболя для dim измерений
+
+    Возвращает:
+    np.ndarray -- массив формы (dim, _SOBOL_BITS) целых направляющих чисел
+    '''
+    v = np.zeros((dim, _SOBOL_BITS), dtype=np.uint64) # направляющие числа
+    v[0] = [1 << (_SOBOL_BITS - 1 - k) for k in range(_SOBOL_BITS)] # первое измерение -- последовательность ван дер Корпута
+    for d, (s, a, m) in enumerate(_SOBOL_PARAMS[:dim - 1], start=1): # остальные измерения по примитивным многочленам
+        row = [m[k] << (_SOBOL_BITS - 1 - k) for k in range(s)] # начальные направляющие числа
+        for k in range(s, _SOBOL_BITS): # остальные числа по рекуррентной формуле
+            value = row[k - s] ^ (row[k - s] >> s) # старший и свободный члены многочлена
+            for i in range(1, s): # промежуточные коэффициенты многочлена
+                if (a >> (s - 1 - i)) & 1: # коэффициент равен 1
+                    value ^= row[k - i] # добавляем соответствующее число
+            row.append(value) # сохраняем число
+        v[d] = row # записываем измерение
+    return v # возвращаем направляющие числа
+
+
+def sobol(start: int, count: int, dim: int) -> np.ndarray:
+    '''
+    Функция sobol() возвращает точки start..start+count-1 последовательности Соболя
+    в порядке кода Грея: первая точка блока вычисляется по своему номеру, а каждая
+    следующая отличается от предыдущей одним направляющим числом, поэтому блоки
+    последовательности можно строить независимо в разных работниках
+
+    Параметры:
+    start -- номер первой точки
+    count -- количество точек
+    dim -- размерность (не больше MAX_DIM)
+
+    Возвращает:
+    np.ndarray -- массив формы (count, dim)
+
+    >>> sobol(0, 4, 2).tolist()
+    [[0.0, 0.0], [0.5, 0.5], [0.75, 0.25], [0.25, 0.75]]
+    '''
+    v = _sobol_directions(dim) # направляющие числа
+    gray = start ^ (start >> 1) # код Грея номера первой точки
+    steps = np.empty((count, dim), dtype=np.uint64) # первая точка и изменения между соседними точками
+    steps[0] = np.bitwise_xor.reduce(v[:, [k for k in range(gray.bit_length()) if gray >> k & 1]], axis=1) # первая точка блока
+    index = np.arange(start + 1, start + count, dtype=np.int64) # номера следующих точек
+    low = np.frexp((index & -index).astype(float))[1] - 1 # номер младшего единичного разряда -- разряд, меняющийся в коде Грея
+    steps[1:] = v[:, low].T # направляющие числа изменяющихся разрядов
+    return np.bitwise_xor.accumulate(steps, axis=0) / float(1 << _SOBOL_BITS) # накапливаем изменения и переводим в доли единицы
+
+
+def _as_bounds(bounds) -> np.ndarray:
+    '''
+    Функция _as_bounds() приводит пределы интегрирования к массиву формы (dim, 2)
+
+    Вызывает:
+    ValueError -- если пределов нет или в каком-то измерении b <= a
+    '''
+    bounds = np.asarray(bounds, dtype=float).reshape(-1, 2) # пары (a, b) по измерениям
+    if len(bounds) == 0: # нет ни одного измерения
+        raise ValueError('bounds должен содержать хотя бы одну пару (a, b)') # вызываем исключение
+    if np.any(bounds[:, 1] <= bounds[:, 0]): # проверяем пределы каждого измерения
+        raise ValueError('b должен быть больше a') # вызываем исключение
+    return bounds # возвращаем массив пределов
+
+
+def _evaluate(f, points: np.ndarray) -> np.ndarray:
+    '''
+    Функция _evaluate() вычисляет f в точках: f получает по массиву на каждое измерение,
+    а скалярные функции (math.sin(x) * math.cos(y)) оборачиваются в np.vectorize
+
+    Параметры:
+    f -- функция dim аргументов
+    points -- массив формы (m, dim)
+
+    Возвращает:
+    np.ndarray -- значения f формы (m,)
+    '''
+    columns = points.T # по массиву на каждое измерение
+    try:
+        y = np.asarray(f(*columns), dtype=float) # пробуем вызвать функцию сразу на массивах
+        if y.shape == (len(points),): # функция вернула по значению на каждую точку
+            return y # значит она векторизуема
+    except (TypeError, ValueError): # скалярные функции не принимают массивы
+        pass # переходим к запасному варианту
+    return np.vectorize(f, otypes=[float])(*columns) # вызываем функцию поточечно
+
+
+def _rule_axis(a: float, b: float, n_iter: int, method: str) -> tuple[np.ndarray, np.ndarray]:
+    '''
+    Функция _rule_axis() строит узлы и веса составного правила на отрезке [a, b];
+    общие концы соседних разбиений объединяются в один узел с суммарным весом
+
+    Возвращает:
+    tuple -- (узлы, веса с учетом ширины разбиения)
+    '''
+    nodes, weights = _get_rule(method) # узлы и веса правила на [0, 1]
+    t, w = np.asarray(nodes), np.asarray(weights) # переводим в массивы
+    step = (b - a) / n_iter # ширина разбиения
+    x = a + (np.arange(n_iter)[:, None] + t) * step # узлы всех разбиений, форма (n_iter, m)
+    if len(t) > 1 and t[0] == 0.0 and t[-1] == 1.0: # концы разбиений общие
+        m = len(t) - 1 # узлов на разбиение без правого конца
+        wx = np.zeros(n_iter * m + 1) # веса узлов общей сетки
+        wx[:-1] = np.tile(w[:-1], n_iter) # веса узлов без правых концов
+        wx[m::m] += w[-1] # правый конец разбиения совпадает с левым концом следующего
+        return np.append(x[:, :-1].ravel(), b), wx * step # узлы и веса без повторов
+    return x.ravel(), np.tile(w, n_iter) * step # узлы и веса без общих концов
+
+
+def _tensor_block(f, axes: list, lo: int, hi: int) -> float:
+    '''
+    Функция _tensor_block() вычисляет вклад узлов lo..hi-1 тензорной сетки
+
+    Параметры:
+    f -- функция dim аргументов
+    axes -- список пар (узлы, веса) по измерениям
+    lo, hi -- диапазон номеров узлов в развернутой сетке
+
+    Возвращает:
+    float -- взвешенная сумма значений f в узлах блока
+    '''
+    shape = tuple(len(x) for x, _ in axes) # размеры сетки по измерениям
+    index = np.unravel_index(np.arange(lo, hi), shape) # номера узлов по каждому измерению
+    points = np.column_stack([x[i] for (x, _), i in zip(axes, index)]) # координаты узлов блока
+    weights = np.prod([w[i] for (_, w), i in zip(axes, index)], axis=0) # веса узлов -- произведения весов по измерениям
+    return float(np.dot(weights, _evaluate(f, points))) # взвешенная сумма значений
+
+
+def _run_blocks(task, blocks: list, backend: str, n_jobs: int, integrator: Integrator | None) -> list:
+    '''
+    Функция _run_blocks() вычисляет task(*block) для всех блоков в текущем потоке
+    или в пуле Integrator и возвращает результаты в порядке блоков
+
+    Вызывает:
+    ValueError -- если backend неизвестен
+    '''
+    if backend not in ('numpy', 'thread', 'process'): # проверяем название бэкенда
+        raise ValueError("backend должен быть 'numpy', 'thread' или 'process'") # вызываем исключение
+    if backend == 'numpy': # вычисляем все в текущем потоке
+        return [task(*block) for block in blocks] # блоки по очереди
+    if integrator is None: # пул не передан -- создаем временный
+        with Integrator(backend, n_jobs=n_jobs) as pool: # пул закроется после вычисления
+            return _run_blocks(task, blocks, backend, n_jobs, pool) # вычисляем во временном пуле
+    fs = [integrator.submit(task, *block) for block in blocks] # отправляем все блоки в пул
+    return [fut.result() for fut in fs] # собираем результаты в порядке блоков
+
+
+def integrate_tensor(f, bounds, *, n_iter: int | tuple = 32, method: str = 'gauss3', backend: str = 'numpy',
+                     n_jobs: int = 2, chunk_size: int = 65536, integrator: Integrator | None = None) -> float:
+    '''
+    Функция integrate_tensor() вычисляет кратный интеграл по прямоугольнику (параллелепипеду)
+    тензорным произведением одномерных составных правил из RULES
+
+    Узлы сетки перебираются блоками по chunk_size точек, поэтому память не зависит от
+    общего числа узлов; блоки вычисляются в текущем потоке или в пуле Integrator
+
+    Параметры:
+    f -- функция dim аргументов, f(x, y) или f(x, y, z); принимает массивы numpy или скаляры
+    bounds -- пары (a, b) по измерениям
+    n_iter -- количество разбиений по каждому измерению (одно число или по числу на измерение)
+    method -- квадратурное правило из RULES
+    backend -- 'numpy' (в текущем потоке), 'thread' или 'process' (блоки в пуле)
+    n_jobs -- количество потоков/процессов, если integrator не передан
+    chunk_size -- максимальное количество узлов в одном блоке
+    integrator -- уже созданный Integrator, пул которого нужно использовать
+
+    Возвращает:
+    float -- приближенное значение интеграла
+
+    Вызывает:
+    ValueError -- если n_iter <= 0, chunk_size <= 0, b <= a, method или backend некорректны
+
+    >>> round(integrate_tensor(lambda x, y: x * y, [(0, 1), (0, 2)], n_iter=2, method='gauss2'), 12)
+    1.0
+    '''
+    bounds = _as_bounds(bounds) # пределы по измерениям
+    counts = (n_iter,) * len(bounds) if isinstance(n_iter, int) else tuple(n_iter) # разбиения по измерениям
+    if len(counts) != len(bounds) or min(counts) <= 0: # проверяем количество разбиений
+        raise ValueError('n_iter должен быть положительным числом для каждого измерения') # вызываем исключение
+    if chunk_size <= 0: # проверяем, что размер блока положительный
+        raise ValueError('chunk_size должен быть положительным числом') # вызываем исключение
+
+    axes = [_rule_axis(a, b, n, method) for (a, b), n in zip(bounds, counts)] # узлы и веса по измерениям
+    total = math.prod(len(x) for x, _ in axes) # общее количество узлов
+    blocks = [(f, axes, lo, min(lo + chunk_size, total)) for lo in range(0, total, chunk_size)] # блоки узлов
+    return math.fsum(_run_blocks(_tensor_block, blocks, backend, n_jobs, integrator)) # складываем вклады блоков
+
+
+def _mc_block(f, bounds: np.ndarray, sequence: str, start: int, count: int, seed) -> tuple[int, float, float]:
+    '''
+    Функция _mc_block() вычисляет f в точках start..start+count-1 выбранной последовательности
+
+    Возвращает:
+    tuple -- (количество точек, среднее значение f, сумма квадратов отклонений от среднего)
+    '''
+    dim = len(bounds) # размерность
+    if sequence == 'sobol': # квазислучайные точки Соболя
+        u = sobol(start, count, dim) # точки в единичном кубе
+    elif sequence == 'halton': # квазислучайные точки Холтона
+        u = halton(start, count, dim) # точки в единичном кубе
+    else: # псевдослучайные точки
+        u = np.random.default_rng(seed).random((count, dim)) # у каждого блока свой независимый генератор
+    y = _evaluate(f, bounds[:, 0] + u * (bounds[:, 1] - bounds[:, 0])) # значения f в точках области
+    mean = float(np.mean(y)) # среднее значение блока
+    return count, mean, float(np.sum((y - mean) ** 2)) # статистика блока
+
+
+def integrate_mc(f, bounds, *, n_samples: int = 65536, sequence: str = 'sobol', seed: int | None = None,
+                 backend: str = 'numpy', n_jobs: int = 2, chunk_size: int = 65536,
+                 integrator: Integrator | None = None) -> QuadResult:
+    '''
+    Функция integrate_mc() вычисляет кратный интеграл по прямоугольнику (параллелепипеду)
+    методом Монте-Карло ('random') или квази-Монте-Карло ('halton', 'sobol')
+
+    Точки генерируются блоками по chunk_size прямо в работниках, поэтому память ограничена
+    одним блоком. Блоки зависят только от chunk_size и seed, а их статистика складывается
+    в порядке блоков, поэтому результат не зависит от backend и количества работников
+
+    Параметры:
+    f -- функция dim аргументов, f(x, y) или f(x, y, z); принимает массивы numpy или скаляры
+    bounds -- пары (a, b) по измерениям
+    n_samples -- количество точек
+    sequence -- 'random', 'halton' или 'sobol' (для Соболя лучше брать n_samples = 2**k)
+    seed -- зерно генератора для 'random'
+    backend -- 'numpy' (в текущем потоке), 'thread' или 'process' (блоки в пуле)
+    n_jobs -- количество потоков/процессов, если integrator не передан
+    chunk_size -- количество точек в одном блоке
+    integrator -- уже созданный Integrator, пул которого нужно использовать
+
+    Возвращает:
+    QuadResult -- значение, стандартная ошибка среднего (для квазислучайных точек
+                  это завышенная оценка) и количество вычислений f
+
+    Вызывает:
+    ValueError -- если n_samples < 2, chunk_size <= 0, b <= a, sequence, размерность или backend некорректны
+
+    >>> result = integrate_mc(lambda x, y: x + y, [(0, 1), (0, 1)], n_samples=4096)
+    >>> round(result.value, 3), result.n_eval
+    (1.0, 4096)
+    '''
+    bounds = _as_bounds(bounds) # пределы по измерениям
+    if sequence not in SEQUENCES: # проверяем название последовательности
+        raise ValueError("sequence должен быть 'random', 'halton' или 'sobol'") # вызываем исключение
+    if sequence != 'random' and len(bounds) > MAX_DIM: # для квазислучайных точек заданы не все измерения
+        raise ValueError(f'квазислучайные последовательности поддерживают не больше {MAX_DIM} измерений') # вызываем исключение
+    if n_samples < 2: # для оценки ошибки нужно хотя бы две точки
+        raise ValueError('n_samples должен быть не меньше 2') # вызываем исключение
+    if chunk_size <= 0: # проверяем, что размер блока положительный
+        raise ValueError('chunk_size должен быть положительным числом') # вызываем исключение
+
+    starts = range(0, n_samples, chunk_size) # начала блоков
+    seeds = np.random.SeedSequence(seed).spawn(len(starts)) # независимые зерна блоков
+    blocks = [(f, bounds, sequence, start, min(chunk_size, n_samples - start), s) for start, s in zip(starts, seeds)] # блоки точек
+    count, mean, m2 = 0, 0.0, 0.0 # объединенная статистика
+    for n, block_mean, block_m2 in _run_blocks(_mc_block, blocks, backend, n_jobs, integrator): # блоки в исходном порядке
+        delta = block_mean - mean # разность средних
+        total = count + n # количество точек после объединения
+        m2 += block_m2 + delta * delta * count * n / total # формула Чана для суммы квадратов отклонений
+        mean += delta * n / total # новое среднее
+        count = total # новое количество точек
+    volume = float(np.prod(bounds[:, 1] - bounds[:, 0])) # объем области
+    return QuadResult(volume * mean, volume * math.sqrt(m2 / (count - 1) / count), count) # значение, ошибка, вычисления
+
+
+class TestIntegrateND(unittest.TestCase):
+    '''
+    Класс TestIntegrateND содержит unit-тесты для кратного интегрирования
+    '''
+    def test_tensor_accuracy_and_backends(self):
+        '''
+        Функция test_tensor_accuracy_and_backends() проверяет тензорные правила и бэкенды
+        '''
+        exact = (math.e - 1) ** 3 # ∫∫∫exp(x+y+z) по единичному кубу
+        f = lambda x, y, z: np.exp(x + y + z) # векторизуемая функция
+        self.assertAlmostEqual(integrate_tensor(f, [(0, 1)] * 3, n_iter=8, method='gauss3'), exact, places=9) # Гаусс
+        self.assertAlmostEqual(integrate_tensor(f, [(0, 1)] * 3, n_iter=(8, 8, 8), method='simpson', chunk_size=100), exact, places=5) # Симпсон по блокам
+        scalar = lambda x, y: math.sin(x) * math.cos(y) # скалярная функция
+        expected = (1 - math.cos(1)) * math.sin(2) # ∫sin(x)dx на [0, 1] * ∫cos(y)dy на [0, 2]
+        self.assertAlmostEqual(integrate_tensor(scalar, [(0, 1), (0, 2)], n_iter=8), expected, places=9) # через np.vectorize
+        reference = integrate_tensor(np.hypot, [(0, 1), (-1, 2)], n_iter=16) # эталон в текущем потоке
+        for backend in ('thread', 'process'): # параллельные бэкенды
+            result = integrate_tensor(np.hypot, [(0, 1), (-1, 2)], n_iter=16, backend=backend, chunk_size=500) # блоки в пуле
+            self.assertAlmostEqual(result, reference, places=12) # результаты совпадают
+
+    def test_monte_carlo(self):
+        '''
+        Функция test_monte_carlo() проверяет точность, воспроизводимость и оценку ошибки Монте-Карло
+        '''
+        exact = (math.e - 1) ** 3 # ∫∫∫exp(x+y+z) по единичному кубу
+        f = lambda x, y, z: np.exp(x + y + z) # векторизуемая функция
+        errors = {} # ошибки последовательностей
+        for sequence in SEQUENCES: # проверяем каждую последовательность
+            result = integrate_mc(f, [(0, 1)] * 3, n_samples=2 ** 14, sequence=sequence, seed=1) # интеграл
+            self.assertLess(abs(result.value - exact), 5 * result.error) # ошибка в пределах оценки
+            errors[sequence] = abs(result.value - exact) # фактическая ошибка
+        self.assertLess(errors['sobol'], errors['random']) # квазислучайные точки точнее
+        first = integrate_mc(np.hypot, [(0, 1), (0, 1)], n_samples=5000, sequence='random', seed=7, chunk_size=1000) # в текущем потоке
+        second = integrate_mc(np.hypot, [(0, 1), (0, 1)], n_samples=5000, sequence='random', seed=7, chunk_size=1000, backend='process', n_jobs=3) # в процессах
+        self.assertEqual(first, second) # результат не зависит от бэкенда
+
+    def test_invalid_arguments(self):
+        '''
+        Функция test_invalid_arguments() проверяет обработку некорректных аргументов
+        '''
+        f = lambda x, y: x * y # функция двух переменных
+        with self.assertRaises(ValueError): # b <= a
+            integrate_tensor(f, [(0, 1), (1, 1)]) # вызываем функцию
+        with self.assertRaises(ValueError): # количество разбиений не совпадает с размерностью
+            integrate_tensor(f, [(0, 1), (0, 1)], n_iter=(4, 4, 4)) # вызываем функцию
+        with self.assertRaises(ValueError): # неизвестный бэкенд
+            integrate_tensor(f, [(0, 1), (0, 1)], backend='gpu') # вызываем функцию
+        with self.assertRaises(ValueError): # неизвестная последовательность
+            integrate_mc(f, [(0, 1), (0, 1)], sequence='lattice') # вызываем функцию
+        with self.assertRaises(ValueError): # слишком большая размерность для Соболя
+            integrate_mc(f, [(0, 1)] * (MAX_DIM + 1), sequence='sobol') # вызываем функцию
+
+
+def scaling_report(dims=(1, 2, 3), n_jobs=(1, 2, 4), n_points: int = 2 ** 18, repeat: int = 3) -> list[dict]:
+    '''
+    Функция scaling_report() замеряет, как время кратного интегрирования зависит
+    от размерности и количества потоков при одинаковом количестве точек; используется
+    пул потоков Integrator('thread'), т.к. numpy отпускает GIL, а лямбду f нельзя передать в процесс
+
+    Параметры:
+    dims -- размерности
+    n_jobs -- количество потоков (1 -- вычисление в текущем потоке)
+    n_points -- примерное количество узлов/точек в каждом замере
+    repeat -- количество замеров в каждой точке
+
+    Возвращает:
+    list[dict] -- строки отчета: method, dim, n_jobs, points, median, speedup
+    '''
+    f = lambda *xs: np.exp(-sum(x * x for x in xs)) # гауссиана в dim измерениях
+    rows = [] # строки отчета
+    for dim in dims: # перебираем размерности
+        per_axis = max(1, round(n_points ** (1 / dim) / 3)) # разбиений на измерение для gauss3
+        runs = { # замеряемые методы
+            'tensor': lambda jobs, pool: integrate_tensor(f, [(0, 1)] * dim, n_iter=per_axis, backend='thread' if pool else 'numpy', integrator=pool),
+            'sobol': lambda jobs, pool: integrate_mc(f, [(0, 1)] * dim, n_samples=n_points, backend='thread' if pool else 'numpy', integrator=pool),
+        }
+        for method, run in runs.items(): # перебираем методы
+            base = None # время в текущем потоке
+            for jobs in n_jobs: # перебираем количество работников
+                pool = Integrator('thread', n_jobs=jobs) if jobs > 1 else None # numpy отпускает GIL, поэтому хватает потоков
+                try:
+                    run(jobs, pool) # прогревочный запуск
+                    median = statistics.median(timeit.repeat(lambda: run(jobs, pool), number=1, repeat=repeat)) # медиана времени
+                finally:
+                    if pool is not None: # пул был создан
+                        pool.shutdown() # закрываем пул
+                base = base or median # время с одним работником
+                points = (per_axis * 3) ** dim if method == 'tensor' else n_points # количество вычислений f
+                rows.append({'method': method, 'dim': dim, 'n_jobs': jobs, 'points': points, 'median': median, 'speedup': base / median}) # строка отчета
+    return rows # возвращаем отчет
+
+
+def main():
+    '''
+    Функция main() запускает тесты и выводит таблицу масштабирования
+    '''
+    unittest.main(argv=['integrate_nd'], exit=False) # запускаем тесты
+    print(f'\nМасштабирование кратного интегрирования (ядер: {os.cpu_count()})') # выводим заголовок
+    print(f"{'метод':<8}{'dim':>4}{'n_jobs':>8}{'точек':>10}{'медиана, с':>12}{'ускорение':>11}") # заголовок таблицы
+    for row in scaling_report(): # строки отчета
+        print(f"{row['method']:<8}{row['dim']:>4}{row['n_jobs']:>8}{row['points']:>10}{row['median']:>12.6f}{row['speedup']:>10.2f}x") # строка таблицы
+
+
+if __name__ == '__main__':
+    main() # запускаем тесты и замеры
@@ -2,57 +2,226 @@ import math # импортируем модуль math для математич
 import timeit # импортируем модуль timeit для замера времени выполнения
 import doctest # импортируем модуль doctest для выполнения тестов в docstring
 import unittest # импортируем модуль unittest для создания unit-тестов
-from typing import Callable # импортируем Callable для аннотаций типов функций
+from array import array # импортируем array для компактных массивов результатов
+from typing import Callable, NamedTuple # импортируем Callable для аннотаций типов функций и NamedTuple для результатов
 from concurrent import futures # импортируем futures для работы с потоками и процессами
 from functools import partial # импортируем partial для создания частичных функций
+from multiprocessing import shared_memory # импортируем shared_memory для общих буферов результатов
+import heapq # импортируем heapq для очереди отрезков с наибольшей ошибкой
+from collections import deque # импортируем deque для стека отрезков адаптивного метода
+import numpy as np # импортируем numpy для векторизованных вычислений
 
 
-def integrate(f: Callable[[float], float], a: float, b: float, *, n_iter: int = 100000) -> float:
+# квадратурные правила на одном разбиении, приведенном к [0, 1]: имя -> (узлы, веса)
+RULES = {
+    'rectangle': ((0.0,), (1.0,)), # прямоугольники по значению в начале разбиения, O(1/n)
+    'midpoint': ((0.5,), (1.0,)), # средние прямоугольники, O(1/n**2)
+    'trapezoid': ((0.0, 1.0), (0.5, 0.5)), # трапеции, O(1/n**2)
+    'simpson': ((0.0, 0.5, 1.0), (1/6, 4/6, 1/6)), # Симпсон, O(1/n**4)
+    'gauss2': ((0.5 - math.sqrt(3)/6, 0.5 + math.sqrt(3)/6), (0.5, 0.5)), # Гаусс--Лежандр 2 узла, O(1/n**4)
+    'gauss3': ((0.5 - math.sqrt(15)/10, 0.5, 0.5 + math.sqrt(15)/10), (5/18, 8/18, 5/18)), # Гаусс--Лежандр 3 узла, O(1/n**6)
+}
+
+
+def _get_rule(method: str) -> tuple:
+    '''
+    Функция _get_rule() возвращает узлы и веса правила method
+
+    Вызывает:
+    ValueError -- если правило неизвестно
+    '''
+    if method not in RULES: # проверяем, что правило есть в таблице
+        raise ValueError(f'Неизвестный метод {method!r}, доступны: {", ".join(RULES)}') # вызываем исключение
+    return RULES[method] # возвращаем узлы и веса
+
+
+def rule_evaluations(method: str, n_iter: int) -> int:
+    '''
+    Функция rule_evaluations() возвращает количество вычислений f, которое делает
+    integrate() с правилом method на n_iter разбиениях: узлы на концах разбиений
+    (трапеции, Симпсон) общие у соседних разбиений и считаются один раз
+
+    >>> rule_evaluations('rectangle', 10), rule_evaluations('simpson', 10), rule_evaluations('gauss3', 10)
+    (10, 21, 30)
+    '''
+    nodes, _ = _get_rule(method) # узлы правила
+    if len(nodes) > 1 and nodes[0] == 0.0 and nodes[-1] == 1.0: # концы разбиений общие
+        return n_iter * (len(nodes) - 1) + 1 # n_iter + 1 концов и внутренние узлы каждого разбиения
+    return n_iter * len(nodes) # все узлы у каждого разбиения свои
+
+
+def integrate(f: Callable[[float], float], a: float, b: float, *, n_iter: int = 100000, method: str = 'rectangle',
+              compensated: bool = False) -> float:
     '''
     Функция integrate() вычисляет приближенное значение определенного интеграла
-    методом правых прямоугольников
-    
+    методом правых прямоугольников или другим правилом из RULES
+
     Параметры:
     f -- интегрируемая функция
     a -- нижний предел интегрирования
     b -- верхний предел интегрирования
     n_iter -- количество разбиений интервала
-    
+    method -- квадратурное правило из RULES ('rectangle', 'midpoint', 'trapezoid',
+              'simpson', 'gauss2', 'gauss3')
+    compensated -- суммировать слагаемые без потери точности (math.fsum): результат
+                   не зависит от накопления ошибок округления
+
     Возвращает:
     float -- приближенное значение интеграла
-    
+
     Вызывает:
-    ValueError -- если n_iter <= 0 или b <= a
+    ValueError -- если n_iter <= 0, b <= a или method неизвестен
     '''
     if n_iter <= 0: # проверяем, что количество итераций положительное
         raise ValueError('n_iter должен быть положительным числом') # вызываем исключение
     if b <= a: # проверяем корректность пределов интегрирования
         raise ValueError('b должен быть больше a') # вызываем исключение
-    
+    nodes, weights = _get_rule(method) # узлы и веса правила
+
     acc = 0.0 # инициализируем аккумулятор для суммы
     step = (b - a) / n_iter # вычисляем ширину каждого прямоугольника
-    
+
+    if method == 'rectangle' and compensated: # метод прямоугольников с точным суммированием
+        return math.fsum(f(a + i * step) for i in range(n_iter)) * step # сумма значений, умноженная на шаг
+    if method == 'rectangle': # исходный метод прямоугольников
+        for i in range(n_iter): # проходим по всем подинтервалам
+            acc += f(a + i * step) * step # прибавляем площадь текущего прямоугольника
+        return acc # возвращаем приближенное значение интеграла
+
+    inner = list(zip(nodes, weights)) # узлы, которые вычисляются на каждом разбиении
+    edge = 0.0 # вес общих узлов на границах соседних разбиений
+    if len(nodes) > 1 and nodes[0] == 0.0 and nodes[-1] == 1.0: # концы разбиений общие
+        inner = inner[1:-1] # концы считаем отдельно, один раз на границу
+        edge = weights[0] + weights[-1] # граница входит в два соседних разбиения
+        acc = weights[0] * f(a) + weights[-1] * f(b) # крайние точки входят по одному разу
+
+    if compensated: # точное суммирование тех же слагаемых в том же порядке
+        def terms(): # слагаемые взвешенной суммы
+            yield acc # вклад крайних точек
+            for i in range(n_iter): # проходим по всем подинтервалам
+                x = a + i * step # начало текущего разбиения
+                if edge and i: # внутренняя граница разбиений
+                    yield edge * f(x) # одно вычисление на два соседних разбиения
+                for t, w in inner: # внутренние узлы разбиения
+                    yield w * f(x + t * step) # взвешенное значение в узле
+        return math.fsum(terms()) * step # умножаем взвешенную сумму на ширину разбиения
+
     for i in range(n_iter): # проходим по всем подинтервалам
-        acc += f(a + i * step) * step # прибавляем площадь текущего прямоугольника
-    
+        x = a + i * step # начало текущего разбиения
+        if edge and i: # внутренняя граница разбиений
+            acc += edge * f(x) # одно вычисление на два соседних разбиения
+        for t, w in inner: # внутренние узлы разбиения
+            acc += w * f(x + t * step) # прибавляем взвешенное значение в узле
+
+    return acc * step # умножаем взвешенную сумму на ширину разбиения
+
+
+# скалярные функции math, у которых есть точные аналоги-ufunc в numpy
+_MATH_UFUNCS = {
+    math.cos: np.cos, # косинус
+    math.sin: np.sin, # синус
+    math.tan: np.tan, # тангенс
+    math.exp: np.exp, # экспонента
+    math.log: np.log, # натуральный логарифм
+    math.sqrt: np.sqrt, # квадратный корень
+}
+
+
+def _vectorize(f, x):
+    '''
+    Функция _vectorize() подбирает способ вызова функции f на массиве точек
+
+    Параметры:
+    f -- интегрируемая функция
+    x -- первый блок абсцисс
+
+    Возвращает:
+    tuple -- (функция от массива numpy, значения f на блоке x)
+    '''
+    func = _MATH_UFUNCS.get(f, f) # заменяем math.cos и подобные на ufunc numpy
+    if isinstance(func, np.ufunc): # ufunc numpy уже умеет работать с массивами
+        return func, func(x) # возвращаем функцию и значения на первом блоке
+    try:
+        y = np.asarray(func(x), dtype=float) # пробуем вызвать функцию сразу на массиве
+        if y.shape == x.shape: # функция вернула по значению на каждую точку
+            return func, y # значит она векторизуема (лямбды с арифметикой, функции numpy)
+    except (TypeError, ValueError): # скалярные функции не принимают массивы
+        pass # переходим к запасному варианту
+    func = np.vectorize(f, otypes=[float]) # оборачиваем скалярную функцию в np.vectorize
+    return func, func(x) # возвращаем обертку и значения на первом блоке
+
+
+def integrate_vectorized(f: Callable[[float], float], a: float, b: float, *, n_iter: int = 100000, chunk_size: int = 65536) -> float:
+    '''
+    Функция integrate_vectorized() вычисляет интеграл тем же методом, что и integrate(),
+    но вызывает f на массивах numpy блоками по chunk_size точек
+
+    Память ограничена размером одного блока, а цикл по точкам выполняется на уровне C.
+    Результат совпадает с integrate() с относительной погрешностью не хуже 1e-9:
+    numpy суммирует блоки попарно, а не последовательно, поэтому последние разряды
+    могут отличаться.
+
+    Параметры:
+    f -- интегрируемая функция (ufunc numpy, функция от массива или скалярная функция)
+    a -- нижний предел интегрирования
+    b -- верхний предел интегрирования
+    n_iter -- количество разбиений интервала
+    chunk_size -- количество точек, обрабатываемых за один вызов f
+
+    Возвращает:
+    float -- приближенное значение интеграла
+
+    Вызывает:
+    ValueError -- если n_iter <= 0, b <= a или chunk_size <= 0
+
+    >>> round(integrate_vectorized(np.cos, 0, math.pi/2, n_iter=1000, chunk_size=100), 3)
+    1.001
+    '''
+    if n_iter <= 0: # проверяем, что количество итераций положительное
+        raise ValueError('n_iter должен быть положительным числом') # вызываем исключение
+    if b <= a: # проверяем корректность пределов интегрирования
+        raise ValueError('b должен быть больше a') # вызываем исключение
+    if chunk_size <= 0: # проверяем, что размер блока положительный
+        raise ValueError('chunk_size должен быть положительным числом') # вызываем исключение
+
+    acc = 0.0 # инициализируем аккумулятор для суммы
+    step = (b - a) / n_iter # вычисляем ширину каждого прямоугольника
+    func = None # способ вызова f определяем на первом блоке
+
+    for start in range(0, n_iter, chunk_size): # проходим по блокам индексов
+        x = a + np.arange(start, min(start + chunk_size, n_iter), dtype=float) * step # строим абсциссы текущего блока
+        if func is None: # на первом блоке выбираем способ вызова
+            func, y = _vectorize(f, x) # ufunc, векторная функция или np.vectorize
+        else:
+            y = func(x) # вычисляем значения f на всем блоке одним вызовом
+        acc += float(np.sum(y)) * step # прибавляем площадь прямоугольников блока
+
     return acc # возвращаем приближенное значение интеграла
 
 
-def partial_integrate(f, start, end, n_iter):
+def partial_integrate(f, start, end, n_iter, method='rectangle', compensated=False):
     '''
     Функция partial_integrate() является вспомогательной функцией
     для параллельного вычисления интеграла
     
     Параметры:
-    f -- интегрируемая функция
+    f -- интегрируемая функция или описание C-функции из integrate_cy.KERNELS
     start -- начало отрезка интегрирования
     end -- конец отрезка интегрирования
     n_iter -- количество итераций на отрезке
+    method -- квадратурное правило из RULES
+    compensated -- использовать компенсированное суммирование
     
+    Если f задана описанием C-функции ('sin', ('poly', [1, 2])), интеграл считается
+    функцией integrate_cy.integrate_kernel() без GIL, поэтому потоки работают параллельно
+
     Возвращает:
     float -- значение интеграла на отрезке [start, end]
     '''
-    return integrate(f, start, end, n_iter=n_iter) # вызываем основную функцию integrate
+    if isinstance(f, (str, tuple)): # f задана описанием C-функции из реестра integrate_cy.KERNELS
+        from integrate_cy import integrate_kernel # импортируем Cython функцию только при необходимости
+        return integrate_kernel(f, start, end, n_iter, method=method, compensated=compensated) # считаем интеграл без GIL
+    return integrate(f, start, end, n_iter=n_iter, method=method, compensated=compensated) # вызываем основную функцию integrate
 
 
 class TestIntegrate(unittest.TestCase):
@@ -85,17 +254,144 @@ class TestIntegrate(unittest.TestCase):
         diff = abs(result2 - result1) # вычисляем разницу результатов
         self.assertLess(diff, 0.05) # проверяем, что разница меньше 0.05
 
+    def test_vectorized_matches_integrate(self):
+        '''
+        Функция test_vectorized_matches_integrate() сравнивает integrate_vectorized() с integrate()
+        для ufunc, векторизуемой лямбды и скалярной функции
+        '''
+        cases = [
+            (math.cos, 0, math.pi/2), # math.cos заменяется на np.cos
+            (lambda x: 2*x**2 + 3*x + 1, 0, 2), # лямбда работает с массивами напрямую
+            (lambda x: math.cos(x) if x < 1 else 0.5, 0, 2), # скалярная функция через np.vectorize
+        ]
+        for f, a, b in cases: # проверяем каждый случай
+            expected = integrate(f, a, b, n_iter=10001) # эталонный результат
+            result = integrate_vectorized(f, a, b, n_iter=10001, chunk_size=1000) # блоки с неполным последним
+            self.assertAlmostEqual(result, expected, delta=abs(expected) * 1e-9) # сравниваем с допуском
+
+    def test_rules_order_and_evaluations(self):
+        '''
+        Функция test_rules_order_and_evaluations() проверяет порядок сходимости правил RULES
+        и количество вычислений f
+        '''
+        orders = {'rectangle': 1, 'midpoint': 2, 'trapezoid': 2, 'simpson': 4, 'gauss2': 4, 'gauss3': 6} # ожидаемые порядки
+        for method, order in orders.items(): # проверяем каждое правило
+            calls = [] # список для подсчета вызовов f
+            f = lambda x: calls.append(x) or math.exp(x) # exp, запоминающая каждый вызов
+            coarse = abs(integrate(f, 0, 1, n_iter=8, method=method) - (math.e - 1)) # ошибка на 8 разбиениях
+            self.assertEqual(len(calls), rule_evaluations(method, 8)) # число вызовов совпадает с rule_evaluations()
+            fine = abs(integrate(f, 0, 1, n_iter=16, method=method) - (math.e - 1)) # ошибка на 16 разбиениях
+            self.assertAlmostEqual(math.log2(coarse / fine), order, delta=0.3) # ошибка падает в 2**order раз
+        with self.assertRaises(ValueError): # неизвестное правило
+            integrate(math.exp, 0, 1, method='boole') # вызываем с неизвестным правилом
+
+    def test_rules_parallel_and_cython(self):
+        '''
+        Функция test_rules_parallel_and_cython() сравнивает правила в потоках и в Cython с integrate()
+        '''
+        for method in RULES: # проверяем каждое правило
+            expected = integrate(math.cos, 0, 2, n_iter=400, method=method) # эталон на Python
+            self.assertAlmostEqual(integrate_threaded(math.cos, 0, 2, n_jobs=4, n_iter=400, method=method), expected, places=12) # в потоках
+        try:
+            from integrate_cy import integrate_cy, integrate_kernel # импортируем Cython функции
+        except ImportError:
+            self.skipTest('Cython модуль не скомпилирован') # пропускаем часть теста без скомпилированного модуля
+        for method in RULES: # проверяем каждое правило в Cython
+            expected = integrate(math.cos, 0, 2, n_iter=400, method=method) # эталон на Python
+            self.assertAlmostEqual(integrate_cy(math.cos, 0, 2, 400, method=method), expected, places=12) # Python функция
+            self.assertAlmostEqual(integrate_kernel('cos', 0, 2, 400, n_threads=2, method=method), expected, places=12) # C-функция без GIL
+
+    def test_nogil_prange_matches_serial(self):
+        '''
+        Функция test_nogil_prange_matches_serial() проверяет, что редукция prange
+        дает тот же результат, что и однопоточная noGIL версия
+        '''
+        try:
+            from integrate_cy import integrate_cos_nogil, integrate_cos_nogil_prange # импортируем Cython функции
+        except ImportError:
+            self.skipTest('Cython модуль не скомпилирован') # пропускаем тест без скомпилированного модуля
+        expected = integrate_cos_nogil(0, math.pi/2, n_iter=100001) # однопоточный результат
+        for n_threads in (1, 2, 3, 4): # проверяем разное количество потоков
+            result = integrate_cos_nogil_prange(0, math.pi/2, n_iter=100001, n_threads=n_threads) # параллельный результат
+            self.assertAlmostEqual(result, expected, places=10) # порядок суммирования влияет только на последние разряды
+
+    def test_compensated_summation(self):
+        '''
+        Функция test_compensated_summation() проверяет компенсированное суммирование:
+        оно не хуже обычного и не зависит от количества потоков и порядка завершения частей
+        '''
+        f = lambda x: 1e8 if x == 0 else 1e-8 # большое слагаемое, за которым идут маленькие
+        self.assertEqual(integrate(f, 0, 1, n_iter=10000, compensated=True), math.fsum([1e8] + [1e-8] * 9999) / 10000) # точная сумма
+        for method in ('rectangle', 'simpson'): # проверяем оба пути суммирования
+            exact = math.sin(2) # точное значение интеграла cos на [0, 2]
+            plain = integrate(math.cos, 0, 2, n_iter=1000, method=method) # обычное суммирование
+            kahan = integrate(math.cos, 0, 2, n_iter=1000, method=method, compensated=True) # компенсированное суммирование
+            self.assertLessEqual(abs(kahan - exact), abs(plain - exact) + 1e-15) # не хуже обычного
+            results = set() # результаты при разном количестве потоков
+            for n_jobs in (1, 2, 3): # части одни и те же, меняется только порядок их завершения
+                with Integrator('thread', n_jobs=n_jobs) as integrator: # пул потоков
+                    results.add(integrator.integrate(math.cos, 0, 2, n_iter=1000, method=method, n_chunks=12, compensated=True)) # 12 частей
+            self.assertEqual(len(results), 1) # результат воспроизводим
+        try:
+            from integrate_cy import integrate_cy, integrate_kernel # импортируем Cython функции
+        except ImportError:
+            self.skipTest('Cython модуль не скомпилирован') # пропускаем часть теста без скомпилированного модуля
+        self.assertAlmostEqual(integrate_cy(math.cos, 0, 2, 1000, compensated=True), integrate(math.cos, 0, 2, n_iter=1000, compensated=True), places=14) # Неймайер против fsum
+        results = {integrate_kernel('cos', 0, 2, 100001, n_threads=n_threads, method='simpson', compensated=True) for n_threads in (1, 2, 3, 4)} # разное число потоков OpenMP
+        self.assertEqual(len(results), 1) # фиксированные блоки дают один и тот же результат
+
+    def test_integrate_samples(self):
+        '''
+        Функция test_integrate_samples() проверяет интегрирование отсчетов из разных буферов
+        '''
+        try:
+            from integrate_cy import integrate_samples, integrate_samples_xy # импортируем Cython функции
+        except ImportError:
+            self.skipTest('Cython модуль не скомпилирован') # пропускаем тест без скомпилированного модуля
+        step = 2 / 400 # шаг отсчетов на [0, 2]
+        y = np.cos(np.arange(401) * step) # 401 отсчет -- 400 интервалов
+        for method, n_iter in (('rectangle', 400), ('trapezoid', 400), ('simpson', 200)): # правило и эквивалентное разбиение integrate()
+            expected = integrate(math.cos, 0, 2, n_iter=n_iter, method=method) # эталон на Python
+            for buffer in (y, array('d', y), memoryview(y.tobytes()).cast('d')): # numpy, array и память только для чтения
+                self.assertAlmostEqual(integrate_samples(buffer, step, method, n_threads=2), expected, places=12) # без копирования
+        self.assertAlmostEqual(integrate_samples(y[:-2], step, 'simpson'), math.sin(2 - 2 * step), places=9) # нечетное число интервалов
+        x = np.sort(np.random.default_rng(0).uniform(0, 2, 1000)) # неравномерные абсциссы
+        self.assertAlmostEqual(integrate_samples_xy(x, x * x, n_threads=2), float(np.trapezoid(x * x, x)), places=12) # совпадает с numpy
+        with self.assertRaises(ValueError): # убывающие абсциссы
+            integrate_samples_xy(x[::-1].copy(), x) # вызываем функцию
+        with self.assertRaises(ValueError): # один отсчет
+            integrate_samples(y[:1], step) # вызываем функцию
 
-def integrate_threaded(f: Callable[[float], float], a: float, b: float, *, n_jobs: int = 2, n_iter: int = 100000) -> float:
+    def test_threaded_kernel_spec(self):
+        '''
+        Функция test_threaded_kernel_spec() проверяет integrate_threaded() с описанием C-функции
+        '''
+        try:
+            from integrate_cy import integrate_kernel # импортируем Cython функцию
+        except ImportError:
+            self.skipTest('Cython модуль не скомпилирован') # пропускаем тест без скомпилированного модуля
+        spec = ('poly', [1, 3, 2]) # 2*x**2 + 3*x + 1
+        result = integrate_threaded(spec, 0, 2, n_jobs=4, n_iter=10000) # считаем в 4 потоках без GIL
+        expected = integrate(lambda x: 2*x**2 + 3*x + 1, 0, 2, n_iter=10000) # эталон на Python
+        self.assertAlmostEqual(result, expected, places=8) # результаты должны совпасть
+        self.assertAlmostEqual(integrate_kernel('gauss', -10, 10, n_iter=100000), math.sqrt(2*math.pi), places=8) # интеграл гауссианы
+        with self.assertRaises(ValueError): # неизвестное имя функции
+            integrate_kernel('tan', 0, 1) # вызываем с неизвестной функцией
+
+
+def integrate_threaded(f: Callable[[float], float] | str | tuple, a: float, b: float, *, n_jobs: int = 2, n_iter: int = 100000, method: str = 'rectangle',
+                       compensated: bool = False) -> float:
     '''
     Функция integrate_threaded() вычисляет интеграл с использованием потоков
     
     Параметры:
-    f -- интегрируемая функция
+    f -- интегрируемая функция или описание C-функции из integrate_cy.KERNELS
     a -- нижний предел интегрирования
     b -- верхний предел интегрирования
     n_jobs -- количество потоков
     n_iter -- общее количество итераций
+    method -- квадратурное правило из RULES
+    compensated -- компенсированное суммирование внутри частей и между частями
     
     Возвращает:
     float -- приближенное значение интеграла
@@ -103,29 +399,23 @@ def integrate_threaded(f: Callable[[float], float], a: float, b: float, *, n_job
     Вызывает:
     ValueError -- если n_iter//n_jobs == 0
     '''
-    if n_iter // n_jobs == 0: # проверяем, что на каждый поток достаточно итераций
-        raise ValueError('Количество итераций на поток должно быть > 0') # вызываем исключение
-    
-    executor = futures.ThreadPoolExecutor(max_workers=n_jobs) # создаем пул потоков
-    step = (b - a) / n_jobs # вычисляем длину отрезка для каждого потока
-    local_iter = n_iter // n_jobs # вычисляем количество итераций на поток
-    
-    spawn = partial(executor.submit, partial_integrate, f, n_iter=local_iter) # создаем частичную функцию
-    fs = [spawn(a + i * step, a + (i + 1) * step) for i in range(n_jobs)] # запускаем задачи в потоках
-    
-    return sum(f.result() for f in futures.as_completed(fs)) # суммируем результаты всех потоков
+    with Integrator('thread', n_jobs=n_jobs) as integrator: # пул потоков закрывается после вычисления
+        return integrator.integrate(f, a, b, n_iter=n_iter, method=method, compensated=compensated) # делим отрезок между потоками
 
 
-def integrate_processes(f: Callable[[float], float], a: float, b: float, *, n_jobs: int = 2, n_iter: int = 100000) -> float:
+def integrate_processes(f: Callable[[float], float] | str | tuple, a: float, b: float, *, n_jobs: int = 2, n_iter: int = 100000, method: str = 'rectangle',
+                        compensated: bool = False) -> float:
     '''
     Функция integrate_processes() вычисляет интеграл с использованием процессов
     
     Параметры:
-    f -- интегрируемая функция
+    f -- интегрируемая функция или описание C-функции из integrate_cy.KERNELS
     a -- нижний предел интегрирования
     b -- верхний предел интегрирования
     n_jobs -- количество процессов
     n_iter -- общее количество итераций
+    method -- квадратурное правило из RULES
+    compensated -- компенсированное суммирование внутри частей и между частями
     
     Возвращает:
     float -- приближенное значение интеграла
@@ -133,58 +423,885 @@ def integrate_processes(f: Callable[[float], float], a: float, b: float, *, n_jo
     Вызывает:
     ValueError -- если n_iter//n_jobs == 0
     '''
-    if n_iter // n_jobs == 0: # проверяем, что на каждый процесс достаточно итераций
-        raise ValueError('Количество итераций на процесс должно быть > 0') # вызываем исключение
-    
-    executor = futures.ProcessPoolExecutor(max_workers=n_jobs) # создаем пул процессов
-    step = (b - a) / n_jobs # вычисляем длину отрезка для каждого процесса
-    local_iter = n_iter // n_jobs # вычисляем количество итераций на процесс
-    
-    spawn = partial(executor.submit, partial_integrate, f, n_iter=local_iter) # создаем частичную функцию
-    fs = [spawn(a + i * step, a + (i + 1) * step) for i in range(n_jobs)] # запускаем задачи в процессах
-    
-    return sum(f.result() for f in futures.as_completed(fs)) # суммируем результаты всех процессов
+    with Integrator('process', n_jobs=n_jobs) as integrator: # пул процессов закрывается после вычисления
+        return integrator.integrate(f, a, b, n_iter=n_iter, method=method, compensated=compensated) # делим отрезок между процессами
+
+
+class ChunkStat(NamedTuple):
+    '''
+    Класс ChunkStat хранит статистику одной части отрезка, вычисленной в пуле
+    '''
+    start: float # начало части
+    end: float # конец части
+    n_iter: int # количество итераций в части
+    seconds: float # время вычисления части в работнике
+
+
+def _split_iterations(a: float, b: float, n_iter: int, n_chunks: int) -> list[tuple[float, float, int]]:
+    '''
+    Функция _split_iterations() делит n_iter итераций на n_chunks частей, отличающихся
+    не больше чем на одну итерацию; границы частей лежат точно на общей сетке с шагом (b - a)/n_iter,
+    поэтому ни одна итерация не теряется
+
+    Возвращает:
+    list -- список троек (начало части, конец части, количество итераций)
+
+    >>> [n for _, _, n in _split_iterations(0, 1, 10, 4)]
+    [2, 3, 2, 3]
+    '''
+    step = (b - a) / n_iter # шаг общей сетки
+    bounds = [k * n_iter // n_chunks for k in range(n_chunks + 1)] # номера итераций на границах частей
+    return [(a + lo * step, b if hi == n_iter else a + hi * step, hi - lo) for lo, hi in zip(bounds, bounds[1:])] # части отрезка
+
+
+def _timed_partial_integrate(f, start, end, n_iter, method='rectangle', compensated=False):
+    '''
+    Функция _timed_partial_integrate() вызывает partial_integrate() и замеряет время в работнике
+
+    Возвращает:
+    tuple -- (значение интеграла на части, время вычисления в секундах)
+    '''
+    began = timeit.default_timer() # засекаем начало вычисления
+    value = partial_integrate(f, start, end, n_iter, method, compensated) # считаем интеграл на части
+    return value, timeit.default_timer() - began # возвращаем значение и затраченное время
+
+
+class SharedArray:
+    '''
+    Класс SharedArray -- массив numpy из float, лежащий в multiprocessing.shared_memory
+
+    Буфер создает родительский процесс, работники подключаются к нему по имени name
+    и пишут результаты прямо в него, без pickle. Массив доступен через атрибут array;
+    после close() (или выхода из блока with) память освобождается
+    '''
+    def __init__(self, length: int):
+        '''
+        Параметры:
+        length -- количество элементов массива
+        '''
+        self._shm = shared_memory.SharedMemory(create=True, size=max(length, 1) * 8) # выделяем общую память (хотя бы 8 байт)
+        self.name = self._shm.name # имя, по которому подключаются работники
+        self.array = np.frombuffer(self._shm.buf, dtype=float, count=length) # массив поверх общей памяти (держит буфер, пока жив хоть один срез)
+
+    def __enter__(self):
+        return self # возвращаем сам объект для использования в with
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close() # освобождаем общую память при выходе из блока with
+        return False # не подавляем исключения
+
+    def close(self):
+        '''
+        Функция close() отключает массив и удаляет общую память
+
+        Общая память удаляется в любом случае; если у вызывающего еще остались срезы
+        array, отключение вызывает BufferError, а сам буфер освободится вместе с ними
+        '''
+        if self.array is not None: # память еще не освобождена
+            self.array = None # убираем ссылку на буфер, иначе close() не сможет его отключить
+            try:
+                self._shm.unlink() # сначала удаляем общую память, чтобы она не осталась в системе
+            finally:
+                self._shm.close() # отключаемся от общей памяти (BufferError, если остались срезы array)
+
+
+def _shared_chunk(f, name: str, length: int, start: float, n_iter: int, step: float, offset: int, mode: str):
+    '''
+    Функция _shared_chunk() вычисляет часть отрезка в работнике и записывает результат
+    в общий массив: вклады f(x)*step всех точек (mode='samples'), накопленные суммы внутри
+    части (mode='cumulative') или сумму части (mode='partials')
+
+    Параметры:
+    f -- интегрируемая функция
+    name -- имя общей памяти SharedArray
+    length -- длина общего массива
+    start -- начало части
+    n_iter -- количество итераций в части
+    step -- шаг общей сетки
+    offset -- позиция записи: номер первой точки части или номер части
+    mode -- 'samples', 'cumulative' или 'partials'
+    '''
+    shm = shared_memory.SharedMemory(name=name) # подключаемся к общей памяти родителя
+    try:
+        out = np.ndarray((length,), dtype=float, buffer=shm.buf) # массив поверх общей памяти
+        x = start + np.arange(n_iter, dtype=float) * step # абсциссы части
+        _, y = _vectorize(f, x) # значения f во всех точках части
+        if mode == 'samples': # нужны вклады всех точек
+            np.multiply(y, step, out=out[offset:offset + n_iter]) # пишем вклады прямо в общую память
+        elif mode == 'cumulative': # нужны накопленные суммы внутри части
+            np.multiply(np.cumsum(y), step, out=out[offset:offset + n_iter]) # пишем локальную префиксную сумму
+        else:
+            out[offset] = float(np.sum(y)) * step # пишем сумму части
+        del out # убираем ссылку на буфер перед отключением
+    finally:
+        shm.close() # отключаемся от общей памяти, не удаляя ее
+
+
+def _shared_add(name: str, length: int, lo: int, hi: int, value: float):
+    '''
+    Функция _shared_add() прибавляет value к элементам lo..hi-1 общего массива
+    (второй проход параллельной префиксной суммы)
+    '''
+    shm = shared_memory.SharedMemory(name=name) # подключаемся к общей памяти родителя
+    try:
+        out = np.ndarray((length,), dtype=float, buffer=shm.buf) # массив поверх общей памяти
+        out[lo:hi] += value # сдвигаем часть на сумму всех предыдущих частей
+        del out # убираем ссылку на буфер перед отключением
+    finally:
+        shm.close() # отключаемся от общей памяти, не удаляя ее
+
+
+class Integrator:
+    '''
+    Класс Integrator владеет долгоживущим пулом потоков или процессов и переиспользует его
+    между вызовами, чтобы не платить за создание пула на каждый интеграл
+
+    Отрезок делится не на n_jobs, а на n_jobs * chunks_per_job небольших частей: пул раздает
+    их из общей очереди освободившимся работникам, поэтому дорогие участки функции
+    не задерживают остальных. Статистика частей последнего вызова лежит в chunk_stats
+
+    Используется как контекстный менеджер: пул закрывается при выходе из блока with
+    или при явном вызове shutdown()
+
+    >>> with Integrator('thread', n_jobs=2) as integrator:
+    ...     [round(value, 3) for value in integrator.integrate_batch([(math.cos, 0, math.pi/2), (math.sin, 0, math.pi)], n_iter=1000)]
+    [1.001, 2.0]
+    '''
+    def __init__(self, kind: str = 'thread', *, n_jobs: int = 2, chunks_per_job: int = 8):
+        '''
+        Параметры:
+        kind -- тип пула: 'thread' (потоки) или 'process' (процессы)
+        n_jobs -- количество потоков/процессов
+        chunks_per_job -- на сколько частей в среднем делится работа одного работника
+
+        Вызывает:
+        ValueError -- если kind неизвестен, n_jobs <= 0 или chunks_per_job <= 0
+        '''
+        if kind not in ('thread', 'process'): # проверяем тип пула
+            raise ValueError("kind должен быть 'thread' или 'process'") # вызываем исключение
+        if n_jobs <= 0: # проверяем количество работников
+            raise ValueError('n_jobs должен быть положительным числом') # вызываем исключение
+        if chunks_per_job <= 0: # проверяем количество частей на работника
+            raise ValueError('chunks_per_job должен быть положительным числом') # вызываем исключение
+        self.kind = kind # запоминаем тип пула
+        self.n_jobs = n_jobs # запоминаем количество работников
+        self.chunks_per_job = chunks_per_job # запоминаем степень дробления работы
+        self.chunk_stats = [] # статистика частей последнего вызова
+        executor_cls = futures.ThreadPoolExecutor if kind == 'thread' else futures.ProcessPoolExecutor # выбираем класс пула
+        self._executor = executor_cls(max_workers=n_jobs) # создаем пул один раз на весь срок жизни объекта
+
+    def __enter__(self):
+        return self # возвращаем сам объект для использования в with
+
+    def __exit__(self, exc_type, exc, tb):
+        self.shutdown() # закрываем пул при выходе из блока with
+        return False # не подавляем исключения
+
+    def shutdown(self, wait: bool = True):
+        '''
+        Функция shutdown() закрывает пул; после нее новые вычисления невозможны
+
+        Параметры:
+        wait -- ждать ли завершения уже запущенных задач
+        '''
+        self._executor.shutdown(wait=wait) # закрываем пул потоков/процессов
+
+    @property
+    def executor(self) -> futures.Executor:
+        '''
+        Свойство executor возвращает пул работников, например для loop.run_in_executor()
+        '''
+        return self._executor # возвращаем пул
+
+    def submit(self, fn, *args, **kwargs) -> futures.Future:
+        '''
+        Функция submit() отправляет в пул произвольную задачу fn(*args, **kwargs)
+
+        Возвращает:
+        futures.Future -- объект с будущим результатом задачи
+        '''
+        return self._executor.submit(fn, *args, **kwargs) # передаем задачу пулу
+
+    def _submit_parts(self, f, a: float, b: float, n_iter: int, method: str = 'rectangle', n_chunks: int | None = None,
+                      compensated: bool = False) -> list:
+        '''
+        Функция _submit_parts() делит отрезок [a, b] на части и отправляет их в пул
+
+        Возвращает:
+        list -- список пар (часть отрезка, Future с парой (значение, время))
+
+        Вызывает:
+        ValueError -- если n_iter//n_jobs == 0 или n_chunks <= 0
+        '''
+        if n_iter // self.n_jobs == 0: # проверяем, что на каждого работника достаточно итераций
+            worker = 'поток' if self.kind == 'thread' else 'процесс' # название работника для сообщения
+            raise ValueError(f'Количество итераций на {worker} должно быть > 0') # вызываем исключение
+        if n_chunks is None: # количество частей не задано явно
+            n_chunks = self.n_jobs * self.chunks_per_job # дробим работу для балансировки
+        if n_chunks <= 0: # проверяем количество частей
+            raise ValueError('n_chunks должен быть положительным числом') # вызываем исключение
+
+        parts = _split_iterations(a, b, n_iter, min(n_chunks, n_iter)) # части с точным учетом итераций
+        return [(part, self._executor.submit(_timed_partial_integrate, f, *part, method, compensated)) for part in parts] # запускаем задачи в пуле
+
+    def _collect(self, submitted: list, compensated: bool = False) -> float:
+        '''
+        Функция _collect() дожидается результатов частей по мере готовности, дописывает
+        их статистику в chunk_stats и суммирует значения в порядке частей отрезка,
+        поэтому результат не зависит от того, какой работник закончил первым
+
+        Параметры:
+        submitted -- список пар (часть отрезка, Future), как из _submit_parts()
+        compensated -- суммировать частичные интегралы через math.fsum
+
+        Возвращает:
+        float -- сумма значений всех частей
+        '''
+        parts = {fut: part for part, fut in submitted} # часть отрезка для каждого Future
+        for fut in futures.as_completed(parts): # берем результаты по мере готовности
+            self.chunk_stats.append(ChunkStat(*parts[fut], fut.result()[1])) # запоминаем статистику части
+        values = [fut.result()[0] for _, fut in submitted] # значения в порядке частей отрезка
+        if compensated: # точное суммирование частичных интегралов
+            return math.fsum(values) # сумма без потери точности
+        acc = 0.0 # сумма частичных интегралов
+        for value in values: # проходим по частям слева направо
+            acc += value # прибавляем частичный интеграл
+        return acc # возвращаем сумму
+
+    def integrate(self, f: Callable[[float], float] | str | tuple, a: float, b: float, *, n_iter: int = 100000,
+                  method: str = 'rectangle', n_chunks: int | None = None, compensated: bool = False) -> float:
+        '''
+        Функция integrate() вычисляет интеграл, распределяя части отрезка по пулу
+
+        Параметры:
+        f -- интегрируемая функция или описание C-функции из integrate_cy.KERNELS
+        a -- нижний предел интегрирования
+        b -- верхний предел интегрирования
+        n_iter -- общее количество итераций
+        method -- квадратурное правило из RULES
+        n_chunks -- количество частей (по умолчанию n_jobs * chunks_per_job)
+        compensated -- компенсированное суммирование внутри частей и между частями
+
+        Возвращает:
+        float -- приближенное значение интеграла
+        '''
+        submitted = self._submit_parts(f, a, b, n_iter, method, n_chunks, compensated) # отправляем части отрезка в пул
+        self.chunk_stats = [] # статистика относится только к текущему вызову
+        return self._collect(submitted, compensated) # суммируем результаты всех частей
+
+    def integrate_batch(self, jobs, *, n_iter: int = 100000, method: str = 'rectangle', n_chunks: int | None = None,
+                        compensated: bool = False) -> list[float]:
+        '''
+        Функция integrate_batch() вычисляет сразу много интегралов: все части всех задач
+        отправляются в пул до ожидания первого результата, поэтому работники не простаивают
+
+        Параметры:
+        jobs -- итерируемый набор троек (f, a, b)
+        n_iter -- количество итераций для каждого интеграла
+        method -- квадратурное правило из RULES
+        n_chunks -- количество частей каждого интеграла (по умолчанию n_jobs * chunks_per_job)
+        compensated -- компенсированное суммирование внутри частей и между частями
+
+        Возвращает:
+        list[float] -- значения интегралов в порядке задач
+        '''
+        pending = [self._submit_parts(f, a, b, n_iter, method, n_chunks, compensated) for f, a, b in jobs] # отправляем все задачи в пул
+        self.chunk_stats = [] # статистика относится только к текущему вызову
+        return [self._collect(submitted, compensated) for submitted in pending] # собираем результаты в порядке задач
+
+    def integrate_shared(self, f: Callable[[float], float], a: float, b: float, *, n_iter: int = 100000,
+                         mode: str = 'partials', n_chunks: int | None = None) -> SharedArray:
+        '''
+        Функция integrate_shared() вычисляет интеграл методом прямоугольников, а работники
+        пишут результаты частей в общий массив SharedArray вместо передачи через pickle
+
+        Параметры:
+        f -- интегрируемая функция (вызывается на массивах numpy, см. integrate_vectorized())
+        a -- нижний предел интегрирования
+        b -- верхний предел интегрирования
+        n_iter -- общее количество итераций
+        mode -- 'partials' (сумма каждой части), 'samples' (вклад f(x)*step каждой точки)
+                или 'cumulative' (интеграл от a до каждой точки сетки)
+        n_chunks -- количество частей (по умолчанию n_jobs * chunks_per_job)
+
+        В режиме 'cumulative' префиксная сумма считается в два параллельных прохода:
+        работники пишут накопленные суммы своих частей, затем к каждой части
+        прибавляется сумма всех предыдущих частей
+
+        Возвращает:
+        SharedArray -- общий массив длины n_chunks ('partials'), n_iter ('samples')
+                       или n_iter + 1 ('cumulative', первый элемент равен 0);
+                       его нужно закрыть через close() или блок with
+
+        Вызывает:
+        ValueError -- если mode неизвестен, n_iter <= 0, n_chunks <= 0 или b <= a
+        '''
+        if mode not in ('partials', 'samples', 'cumulative'): # проверяем режим
+            raise ValueError("mode должен быть 'partials', 'samples' или 'cumulative'") # вызываем исключение
+        if n_iter <= 0: # проверяем, что количество итераций положительное
+            raise ValueError('n_iter должен быть положительным числом') # вызываем исключение
+        if b <= a: # проверяем корректность пределов интегрирования
+            raise ValueError('b должен быть больше a') # вызываем исключение
+        if n_chunks is None: # количество частей не задано явно
+            n_chunks = self.n_jobs * self.chunks_per_job # дробим работу для балансировки
+        if n_chunks <= 0: # проверяем количество частей
+            raise ValueError('n_chunks должен быть положительным числом') # вызываем исключение
+
+        parts = _split_iterations(a, b, n_iter, min(n_chunks, n_iter)) # части с точным учетом итераций
+        step = (b - a) / n_iter # шаг общей сетки
+        length = {'samples': n_iter, 'cumulative': n_iter + 1, 'partials': len(parts)}[mode] # длина общего массива
+        result = SharedArray(length) # выделяем общую память в родителе
+        try:
+            fs, offset = [], 0 # задачи и позиция первой точки текущей части
+            for index, (start, _, local_iter) in enumerate(parts): # отправляем части в пул
+                position = {'samples': offset, 'cumulative': offset + 1, 'partials': index}[mode] # куда работник пишет результат
+                fs.append(self._executor.submit(_shared_chunk, f, result.name, length, start, local_iter, step, position, mode)) # запускаем задачу
+                offset += local_iter # следующая часть начинается после текущей
+            for fut in fs: # ждем завершения всех частей
+                fut.result() # пробрасываем исключения работников
+            if mode == 'cumulative': # второй проход префиксной суммы
+                result.array[0] = 0.0 # интеграл от a до a
+                ends = np.cumsum([local_iter for _, _, local_iter in parts]) # позиции последних точек частей
+                carry = np.concatenate(([0.0], np.cumsum(result.array[ends[:-1]]))) # сумма всех предыдущих частей для каждой части
+                fs = [self._executor.submit(_shared_add, result.name, length, lo + 1, hi + 1, value)
+                      for lo, hi, value in zip(np.concatenate(([0], ends[:-1])), ends, carry) if value] # сдвигаем части параллельно
+                for fut in fs: # ждем завершения второго прохода
+                    fut.result() # пробрасываем исключения работников
+        except BaseException:
+            result.close() # освобождаем память при ошибке
+            raise # передаем исключение дальше
+        return result # возвращаем общий массив с результатами
+
+
+class TestIntegrator(unittest.TestCase):
+    '''
+    Класс TestIntegrator содержит unit-тесты для пула Integrator
+    '''
+    def test_reuse_and_batch(self):
+        '''
+        Функция test_reuse_and_batch() проверяет повторное использование пула и пакетный режим
+        '''
+        jobs = [(math.cos, 0, math.pi/2), (math.sin, 0, math.pi), (math.exp, 0, 1)] # набор задач
+        with Integrator('thread', n_jobs=3) as integrator: # один пул на все вычисления
+            single = [integrator.integrate(f, a, b, n_iter=3000) for f, a, b in jobs] # по одному интегралу
+            batch = integrator.integrate_batch(jobs, n_iter=3000) # все задачи сразу
+        for f, a, b in jobs: # сравниваем с функцией без пула
+            self.assertAlmostEqual(single.pop(0), integrate_threaded(f, a, b, n_jobs=3, n_iter=3000), places=12) # одиночный вызов
+        self.assertAlmostEqual(batch[0], 1.0, places=2) # интеграл cos
+        self.assertAlmostEqual(batch[1], 2.0, places=2) # интеграл sin
+        self.assertAlmostEqual(batch[2], math.e - 1, places=2) # интеграл exp
+
+    def test_process_pool_shutdown(self):
+        '''
+        Функция test_process_pool_shutdown() проверяет пул процессов и его закрытие
+        '''
+        integrator = Integrator('process', n_jobs=2) # создаем пул процессов
+        with integrator: # пул закроется при выходе из блока
+            first = integrator.integrate(math.cos, 0, math.pi/2, n_iter=2000) # первый вызов
+            second = integrator.integrate(math.cos, 0, math.pi/2, n_iter=2000) # второй вызов в том же пуле
+        self.assertEqual(first, second) # одинаковые задачи дают одинаковый результат
+        with self.assertRaises(RuntimeError): # закрытый пул не принимает задачи
+            integrator.integrate(math.cos, 0, 1, n_iter=2000) # пробуем вычислить после закрытия
+
+    def test_exact_iterations_and_stats(self):
+        '''
+        Функция test_exact_iterations_and_stats() проверяет, что при дроблении на части
+        не теряются итерации и собирается статистика частей
+        '''
+        f = lambda x: 2*x**2 + 3*x + 1 # полином
+        expected = integrate(f, 0, 2, n_iter=1001) # эталон без деления на части
+        with Integrator('thread', n_jobs=3, chunks_per_job=5) as integrator: # 15 частей по 66-67 итераций
+            result = integrator.integrate(f, 0, 2, n_iter=1001) # 1001 не делится на 15
+            stats = sorted(integrator.chunk_stats) # статистика частей по возрастанию начала
+        self.assertAlmostEqual(result, expected, places=10) # итерации не потеряны
+        self.assertEqual(len(stats), 15) # количество частей
+        self.assertEqual(sum(stat.n_iter for stat in stats), 1001) # итерации учтены точно
+        self.assertEqual((stats[0].start, stats[-1].end), (0, 2)) # части покрывают весь отрезок
+        self.assertTrue(all(stat.seconds >= 0 for stat in stats)) # время каждой части замерено
+        self.assertAlmostEqual(integrate_processes(math.exp, 0, 2, n_jobs=2, n_iter=1001), integrate(math.exp, 0, 2, n_iter=1001), places=10) # процессы тоже точны
+
+    def test_shared_memory_results(self):
+        '''
+        Функция test_shared_memory_results() проверяет запись частей и точек в общую память
+        '''
+        expected = integrate(math.cos, 0, 2, n_iter=1001) # эталон без общей памяти
+        with Integrator('process', n_jobs=2, chunks_per_job=3) as integrator: # пул процессов
+            with integrator.integrate_shared(math.cos, 0, 2, n_iter=1001) as partials: # суммы частей
+                self.assertEqual(len(partials.array), 6) # по одной сумме на часть
+                self.assertAlmostEqual(partials.array.sum(), expected, places=10) # сумма частей -- интеграл
+            samples = integrator.integrate_shared(math.cos, 0, 2, n_iter=1001, mode='samples') # вклады точек
+            values = samples.array.copy() # копируем до освобождения памяти
+            name = samples.name # запоминаем имя общей памяти
+            samples.close() # освобождаем память
+        self.assertEqual(len(values), 1001) # вклад каждой точки
+        self.assertAlmostEqual(values[0], math.cos(0) * 2 / 1001, places=15) # первая точка -- левый конец
+        self.assertAlmostEqual(values.sum(), expected, places=10) # сумма вкладов -- интеграл
+        with self.assertRaises(FileNotFoundError): # общая память удалена
+            shared_memory.SharedMemory(name=name) # пробуем подключиться к удаленной памяти
+        shared = SharedArray(4) # общий массив
+        view = shared.array[1:] # срез, который держит буфер
+        with self.assertRaises(BufferError): # буфер нельзя отключить, пока есть срез
+            shared.close() # освобождаем память
+        with self.assertRaises(FileNotFoundError): # но общая память уже удалена
+            shared_memory.SharedMemory(name=shared.name) # пробуем подключиться к удаленной памяти
+        del view # срез больше не нужен
+        shared.close() # повторный вызов ничего не делает
+
+    def test_invalid_arguments(self):
+        '''
+        Функция test_invalid_arguments() проверяет обработку некорректных параметров
+        '''
+        with self.assertRaises(ValueError): # неизвестный тип пула
+            Integrator('gpu') # создаем пул неизвестного типа
+        with Integrator('thread', n_jobs=4) as integrator: # корректный пул
+            with self.assertRaises(ValueError): # итераций меньше, чем потоков
+                integrator.integrate(math.cos, 0, 1, n_iter=3) # вызываем с малым n_iter
+
+
+def _integrate_block(f, bounds, n_iter: int, chunk_size: int):
+    '''
+    Функция _integrate_block() вычисляет интегралы f по блоку отрезков средствами numpy
+
+    Если отрезки блока идут подряд и имеют одинаковую длину, абсциссы всех отрезков
+    строятся одним вызовом np.arange по общей сетке, иначе -- построчно для каждого отрезка
+
+    Параметры:
+    f -- интегрируемая функция
+    bounds -- массив формы (m, 2) с границами отрезков
+    n_iter -- количество разбиений каждого отрезка
+    chunk_size -- максимальное количество точек, вычисляемых за один вызов f
+
+    Возвращает:
+    np.ndarray -- значения интегралов по отрезкам блока
+    '''
+    a, b = bounds[:, 0], bounds[:, 1] # нижние и верхние пределы
+    if n_iter > chunk_size: # один отрезок не помещается в блок точек
+        return np.array([integrate_vectorized(f, lo, hi, n_iter=n_iter, chunk_size=chunk_size) for lo, hi in bounds]) # считаем каждый отрезок отдельно
+
+    step = (b - a) / n_iter # шаг на каждом отрезке
+    shared = len(bounds) > 1 and np.allclose(a[1:], b[:-1], rtol=1e-12, atol=0) and np.allclose(step, step[0], rtol=1e-12, atol=0) # отрезки образуют одну равномерную сетку
+    offsets = np.arange(n_iter, dtype=float) # номера точек внутри отрезка
+    rows = max(1, chunk_size // n_iter) # сколько отрезков помещается в один блок точек
+    result = np.empty(len(bounds)) # массив для результатов
+    func = None # способ вызова f определяем на первом блоке
+
+    for start in range(0, len(bounds), rows): # проходим по группам отрезков
+        stop = min(start + rows, len(bounds)) # конец текущей группы
+        if shared: # общая сетка: абсциссы подряд идущих отрезков продолжают друг друга
+            x = a[0] + np.arange(start * n_iter, stop * n_iter, dtype=float) * step[0] # одна сетка на всю группу
+        else:
+            x = (a[start:stop, None] + offsets * step[start:stop, None]).ravel() # своя сетка для каждого отрезка
+        if func is None: # на первом блоке выбираем способ вызова
+            func, y = _vectorize(f, x) # ufunc, векторная функция или np.vectorize
+        else:
+            y = func(x) # вычисляем значения f на всей группе одним вызовом
+        result[start:stop] = np.reshape(y, (stop - start, n_iter)).sum(axis=1) * step[start:stop] # суммируем по каждому отрезку
+
+    return result # возвращаем интегралы блока
+
+
+def _integrate_block_cy(f, bounds, n_iter: int):
+    '''
+    Функция _integrate_block_cy() вычисляет интегралы по блоку отрезков Cython функциями:
+    integrate_kernel() без GIL для описаний C-функций и integrate_cy() для Python функций
 
+    Параметры:
+    f -- интегрируемая функция или описание C-функции из integrate_cy.KERNELS
+    bounds -- массив формы (m, 2) с границами отрезков
+    n_iter -- количество разбиений каждого отрезка
 
-def time_measurements():
+    Возвращает:
+    np.ndarray -- значения интегралов по отрезкам блока
     '''
-    Функция time_measurements() выполняет замеры времени для всех версий вычисления интеграла
+    from integrate_cy import integrate_cy, integrate_kernel # импортируем Cython функции только при необходимости
+    if isinstance(f, (str, tuple)): # f задана описанием C-функции
+        return np.array([integrate_kernel(f, lo, hi, n_iter) for lo, hi in bounds]) # интегрируем без GIL
+    return np.array([integrate_cy(f, lo, hi, n_iter) for lo, hi in bounds]) # интегрируем Python функцию
+
+
+def integrate_many(f: Callable[[float], float] | str | tuple, intervals, *, n_iter: int = 100000, backend: str = 'numpy',
+                   n_jobs: int = 2, chunk_size: int = 65536, integrator: Integrator | None = None) -> np.ndarray:
     '''
+    Функция integrate_many() вычисляет интегралы одной функции по множеству отрезков
+
+    Отрезки делятся на сбалансированные блоки (по 4 блока на работника), блоки
+    вычисляются векторно в numpy или функциями Cython и собираются в исходном порядке
+
+    Параметры:
+    f -- интегрируемая функция (для backend='cython' также описание C-функции)
+    intervals -- массив границ формы (m, 2) или список пар (a, b)
+    n_iter -- количество разбиений каждого отрезка
+    backend -- 'numpy' (в текущем потоке), 'thread', 'process' (блоки numpy в пуле)
+               или 'cython' (блоки Cython в пуле потоков)
+    n_jobs -- количество потоков/процессов, если integrator не передан
+    chunk_size -- максимальное количество точек, вычисляемых за один вызов f
+    integrator -- уже созданный Integrator, пул которого нужно использовать
+
+    Возвращает:
+    np.ndarray -- значения интегралов в порядке отрезков
+
+    Вызывает:
+    ValueError -- если n_iter <= 0, chunk_size <= 0, какой-то b <= a или backend неизвестен
+
+    >>> np.round(integrate_many(np.cos, [(0, math.pi/4), (math.pi/4, math.pi/2)], n_iter=1000), 3)
+    array([0.707, 0.293])
+    '''
+    if backend not in ('numpy', 'thread', 'process', 'cython'): # проверяем название бэкенда
+        raise ValueError("backend должен быть 'numpy', 'thread', 'process' или 'cython'") # вызываем исключение
+    if n_iter <= 0: # проверяем, что количество итераций положительное
+        raise ValueError('n_iter должен быть положительным числом') # вызываем исключение
+    if chunk_size <= 0: # проверяем, что размер блока положительный
+        raise ValueError('chunk_size должен быть положительным числом') # вызываем исключение
+    if isinstance(f, (str, tuple)) and backend != 'cython': # описания C-функций считает только Cython
+        raise ValueError("описание C-функции поддерживается только при backend='cython'") # вызываем исключение
+
+    bounds = np.asarray(intervals, dtype=float).reshape(-1, 2) # приводим границы к массиву формы (m, 2)
+    if np.any(bounds[:, 1] <= bounds[:, 0]): # проверяем корректность пределов каждого отрезка
+        raise ValueError('b должен быть больше a') # вызываем исключение
+    if len(bounds) == 0: # отрезков нет
+        return np.empty(0) # возвращаем пустой массив
+
+    if backend == 'numpy': # вычисляем все в текущем потоке
+        return _integrate_block(f, bounds, n_iter, chunk_size) # один блок на все отрезки
+
+    if integrator is None: # пул не передан -- создаем временный
+        kind = 'process' if backend == 'process' else 'thread' # Cython отпускает GIL, поэтому ему хватает потоков
+        with Integrator(kind, n_jobs=n_jobs) as pool: # пул закроется после вычисления
+            return integrate_many(f, bounds, n_iter=n_iter, backend=backend, chunk_size=chunk_size, integrator=pool) # вычисляем во временном пуле
+
+    blocks = np.array_split(bounds, min(len(bounds), integrator.n_jobs * 4)) # делим отрезки на блоки почти равного размера
+    if backend == 'cython': # блоки считают функции Cython
+        fs = [integrator.submit(_integrate_block_cy, f, block, n_iter) for block in blocks] # отправляем блоки в пул
+    else:
+        fs = [integrator.submit(_integrate_block, f, block, n_iter, chunk_size) for block in blocks] # отправляем блоки в пул
+    return np.concatenate([fut.result() for fut in fs]) # собираем результаты в исходном порядке
+
+
+class TestIntegrateMany(unittest.TestCase):
+    '''
+    Класс TestIntegrateMany содержит unit-тесты для функции integrate_many()
+    '''
+    def check_backend(self, backend, f, intervals):
+        '''
+        Функция check_backend() сравнивает integrate_many() с integrate() по каждому отрезку
+        '''
+        result = integrate_many(f, intervals, n_iter=500, backend=backend, n_jobs=2, chunk_size=2000) # пакетное вычисление
+        self.assertIsInstance(result, np.ndarray) # результат -- массив numpy
+        for value, (a, b) in zip(result, intervals): # сравниваем с поштучным вычислением
+            self.assertAlmostEqual(value, integrate(f, a, b, n_iter=500), places=10) # результаты совпадают
+
+    def test_contiguous_and_scattered(self):
+        '''
+        Функция test_contiguous_and_scattered() проверяет общую сетку и произвольные отрезки
+        '''
+        edges = np.linspace(0, math.pi, 11) # границы подряд идущих отрезков одинаковой длины
+        contiguous = list(zip(edges[:-1], edges[1:])) # отрезки общей сетки
+        scattered = [(0, 1), (-2, 0.5), (3, 3.25), (1, 4)] # отрезки без общей сетки
+        for backend in ('numpy', 'thread', 'process'): # проверяем все numpy бэкенды
+            self.check_backend(backend, math.sin, contiguous) # общая сетка
+            self.check_backend(backend, math.sin, scattered) # отдельные сетки
+
+    def test_cython_backend(self):
+        '''
+        Функция test_cython_backend() проверяет бэкенд Cython для описания C-функции
+        '''
+        try:
+            import integrate_cy # проверяем, что модуль скомпилирован
+        except ImportError:
+            self.skipTest('Cython модуль не скомпилирован') # пропускаем тест без скомпилированного модуля
+        self.check_backend('cython', math.cos, [(0, 1), (1, 2), (5, 7)]) # Python функция через integrate_cy()
+        result = integrate_many('cos', [(0, 1), (1, 2)], n_iter=500, backend='cython') # описание C-функции
+        self.assertAlmostEqual(result[0], integrate(math.cos, 0, 1, n_iter=500), places=10) # совпадает с integrate()
+
+
+def integrate_cumulative(f: Callable[[float], float] | str | tuple, a: float, b: float, *, n_iter: int = 100000,
+                         backend: str = 'numpy', n_jobs: int = 2, chunk_size: int = 65536,
+                         integrator: Integrator | None = None) -> array | np.ndarray:
+    '''
+    Функция integrate_cumulative() вычисляет интеграл от a до каждой точки сетки
+    a, a + step, ..., b методом прямоугольников (накопленный интеграл, функция распределения)
+
+    Параметры:
+    f -- интегрируемая функция (для backend='cython' также описание C-функции)
+    a -- нижний предел интегрирования
+    b -- верхний предел интегрирования
+    n_iter -- количество разбиений интервала
+    backend -- 'python' (цикл, array('d')), 'numpy' (блоки numpy), 'cython'
+               (integrate_cumulative_cy, array('d')) или 'parallel' (префиксная сумма
+               в два прохода по пулу процессов через общую память)
+    n_jobs -- количество процессов для backend='parallel', если integrator не передан
+    chunk_size -- количество точек, обрабатываемых за один вызов f при backend='numpy'
+    integrator -- уже созданный Integrator для backend='parallel'
+
+    Возвращает:
+    array('d') или np.ndarray -- n_iter + 1 значений, первый равен 0, последний -- integrate(f, a, b)
+
+    Вызывает:
+    ValueError -- если n_iter <= 0, b <= a или backend неизвестен
+
+    >>> [round(value, 3) for value in integrate_cumulative(lambda x: 2 * x, 0, 2, n_iter=4, backend='python')]
+    [0.0, 0.0, 0.5, 1.5, 3.0]
+    '''
+    if backend not in ('python', 'numpy', 'cython', 'parallel'): # проверяем название бэкенда
+        raise ValueError("backend должен быть 'python', 'numpy', 'cython' или 'parallel'") # вызываем исключение
+    if n_iter <= 0: # проверяем, что количество итераций положительное
+        raise ValueError('n_iter должен быть положительным числом') # вызываем исключение
+    if b <= a: # проверяем корректность пределов интегрирования
+        raise ValueError('b должен быть больше a') # вызываем исключение
+    step = (b - a) / n_iter # вычисляем ширину каждого прямоугольника
+
+    if backend == 'python': # простой цикл на Python
+        result = array('d', [0.0]) # интеграл от a до a
+        acc = 0.0 # инициализируем аккумулятор для суммы
+        for i in range(n_iter): # проходим по всем подинтервалам
+            acc += f(a + i * step) * step # прибавляем площадь текущего прямоугольника
+            result.append(acc) # записываем интеграл до правого конца разбиения
+        return result # возвращаем накопленные интегралы
+
+    if backend == 'cython': # цикл Cython, без GIL для C-функций
+        from integrate_cy import integrate_cumulative_cy # импортируем Cython функцию только при необходимости
+        return integrate_cumulative_cy(f, a, b, n_iter) # возвращаем array('d')
+
+    if backend == 'parallel': # префиксная сумма по пулу процессов
+        if integrator is None: # пул не передан -- создаем временный
+            with Integrator('process', n_jobs=n_jobs) as pool: # пул закроется после вычисления
+                return integrate_cumulative(f, a, b, n_iter=n_iter, backend=backend, integrator=pool) # вычисляем во временном пуле
+        with integrator.integrate_shared(f, a, b, n_iter=n_iter, mode='cumulative') as shared: # работники пишут в общую память
+            return shared.array.copy() # копируем результат до освобождения общей памяти
+
+    result = np.empty(n_iter + 1) # массив для накопленных интегралов
+    result[0] = 0.0 # интеграл от a до a
+    acc, func = 0.0, None # накопленная сумма предыдущих блоков и способ вызова f
+    for start in range(0, n_iter, chunk_size): # проходим по блокам индексов
+        stop = min(start + chunk_size, n_iter) # конец текущего блока
+        x = a + np.arange(start, stop, dtype=float) * step # строим абсциссы текущего блока
+        if func is None: # на первом блоке выбираем способ вызова
+            func, y = _vectorize(f, x) # ufunc, векторная функция или np.vectorize
+        else:
+            y = func(x) # вычисляем значения f на всем блоке одним вызовом
+        np.cumsum(y * step, out=result[start + 1:stop + 1]) # накопленные суммы внутри блока
+        result[start + 1:stop + 1] += acc # прибавляем сумму предыдущих блоков
+        acc = result[stop] # переносим сумму в следующий блок
+    return result # возвращаем накопленные интегралы
+
+
+class TestIntegrateCumulative(unittest.TestCase):
+    '''
+    Класс TestIntegrateCumulative содержит unit-тесты для функции integrate_cumulative()
+    '''
+    def test_backends_agree(self):
+        '''
+        Функция test_backends_agree() сравнивает все бэкенды с циклом на Python
+        '''
+        expected = integrate_cumulative(math.cos, 0, 2, n_iter=1001, backend='python') # эталон
+        self.assertIsInstance(expected, array) # компактный массив, а не список
+        self.assertEqual(len(expected), 1002) # n_iter + 1 точек сетки
+        self.assertEqual(expected[0], 0.0) # интеграл от a до a
+        self.assertAlmostEqual(expected[-1], integrate(math.cos, 0, 2, n_iter=1001), places=12) # последний -- полный интеграл
+        backends = ['numpy', 'parallel'] # бэкенды, доступные всегда
+        try:
+            import integrate_cy # проверяем, что модуль скомпилирован
+            backends.append('cython') # добавляем бэкенд Cython
+        except ImportError:
+            pass # без модуля проверяем только numpy и процессы
+        for backend in backends: # проверяем каждый бэкенд
+            result = integrate_cumulative(math.cos, 0, 2, n_iter=1001, backend=backend, chunk_size=100) # накопленный интеграл
+            self.assertEqual(len(result), 1002) # та же длина
+            self.assertLess(max(abs(x - y) for x, y in zip(result, expected)), 1e-12) # те же значения
+
+
+class QuadResult(NamedTuple):
+    '''
+    Класс QuadResult хранит результат адаптивного интегрирования
+    '''
+    value: float # приближенное значение интеграла
+    error: float # оценка абсолютной погрешности
+    n_eval: int # количество вычислений подынтегральной функции
+
+
+# узлы и веса квадратуры Гаусса--Кронрода G7-K15 на отрезке [-1, 1] (положительная половина)
+_GK15_NODES = (0.991455371120812639206854697526329, 0.949107912342758524526189684047851,
+               0.864864423359769072789712788640926, 0.741531185599394439863864773280788,
+               0.586087235467691130294144845693013, 0.405845151377397166906606412076961,
+               0.207784955007898467600689403773245, 0.0)
+_GK15_WEIGHTS = (0.022935322010529224963732008058970, 0.063092092629978553290700663189204,
+                 0.104790010322250183839876322541518, 0.140653259715525918745189590510238,
+                 0.169004726639267902826583426598550, 0.190350578064785409913256402421014,
+                 0.204432940075298892414161999234649, 0.209482141084727828012999174891714)
+_G7_WEIGHTS = (0.129484966168869693270611432679082, 0.279705391489276667901467771423780,
+               0.381830050505118944950369775488975, 0.417959183673469387755102040816327)
+
+
+def _gauss_kronrod(f, a: float, b: float) -> tuple[float, float]:
+    '''
+    Функция _gauss_kronrod() вычисляет интеграл на отрезке по правилам K15 и G7
+
+    Возвращает:
+    tuple -- (значение по правилу Кронрода, оценка ошибки |K15 - G7|)
+    '''
+    center = (a + b) / 2 # середина отрезка
+    half = (b - a) / 2 # половина длины отрезка
+    f_center = f(center) # значение в середине отрезка
+    kronrod = f_center * _GK15_WEIGHTS[7] # вклад центрального узла в K15
+    gauss = f_center * _G7_WEIGHTS[3] # вклад центрального узла в G7
+    for j in range(7): # проходим по симметричным парам узлов
+        dx = half * _GK15_NODES[j] # смещение узла от середины
+        pair = f(center - dx) + f(center + dx) # сумма значений в паре узлов
+        kronrod += _GK15_WEIGHTS[j] * pair # узлы K15 -- все пары
+        if j % 2 == 1: # узлы G7 -- каждая вторая пара
+            gauss += _G7_WEIGHTS[j // 2] * pair # добавляем вклад в G7
+    return kronrod * half, abs((kronrod - gauss) * half) # масштабируем на длину отрезка
+
+
+def integrate_adaptive(f: Callable[[float], float], a: float, b: float, *, tol: float = 1e-8,
+                       method: str = 'simpson', max_depth: int = 50) -> QuadResult:
+    '''
+    Функция integrate_adaptive() вычисляет интеграл адаптивным методом: отрезок делится
+    пополам только там, где оценка ошибки больше допустимой
+
+    Методы:
+    'simpson' -- адаптивный метод Симпсона, допуск делится между половинами отрезка,
+                 каждое деление стоит 2 новых вычисления f
+    'gk15' -- глобальный метод Гаусса--Кронрода G7-K15: всегда делится отрезок
+              с наибольшей ошибкой, пока суммарная ошибка больше tol
+
+    Параметры:
+    f -- интегрируемая функция
+    a -- нижний предел интегрирования
+    b -- верхний предел интегрирования
+    tol -- допустимая абсолютная погрешность
+    method -- 'simpson' или 'gk15'
+    max_depth -- максимальное количество делений одного отрезка пополам
+
+    Возвращает:
+    QuadResult -- значение интеграла, оценка погрешности и количество вычислений f
+
+    Вызывает:
+    ValueError -- если b <= a, tol <= 0 или method неизвестен
+
+    >>> result = integrate_adaptive(math.cos, 0, math.pi/2, tol=1e-10, method='gk15')
+    >>> round(result.value, 10), result.n_eval
+    (1.0, 15)
+    '''
+    if b <= a: # проверяем корректность пределов интегрирования
+        raise ValueError('b должен быть больше a') # вызываем исключение
+    if tol <= 0: # проверяем, что допуск положительный
+        raise ValueError('tol должен быть положительным числом') # вызываем исключение
+
+    if method == 'simpson': # адаптивный метод Симпсона
+        fa, fm, fb = f(a), f((a + b) / 2), f(b) # значения на концах и в середине
+        n_eval = 3 # уже выполнено три вычисления
+        stack = deque([(a, b, fa, fm, fb, (b - a) / 6 * (fa + 4 * fm + fb), tol, 0)]) # стек отрезков вместо рекурсии
+        values, errors = [], [] # вклады принятых отрезков
+        while stack: # пока есть непроверенные отрезки
+            lo, hi, f_lo, f_mid, f_hi, whole, local_tol, depth = stack.pop() # берем отрезок из стека
+            mid = (lo + hi) / 2 # середина отрезка
+            f_left, f_right = f((lo + mid) / 2), f((mid + hi) / 2) # значения в четвертях отрезка
+            n_eval += 2 # два новых вычисления
+            left = (mid - lo) / 6 * (f_lo + 4 * f_left + f_mid) # Симпсон на левой половине
+            right = (hi - mid) / 6 * (f_mid + 4 * f_right + f_hi) # Симпсон на правой половине
+            delta = left + right - whole # разница между грубым и точным значением
+            if abs(delta) <= 15 * local_tol or depth >= max_depth: # ошибка (delta/15) в пределах допуска
+                values.append(left + right + delta / 15) # принимаем значение с поправкой Ричардсона
+                errors.append(abs(delta) / 15) # запоминаем оценку ошибки
+            else:
+                stack.append((lo, mid, f_lo, f_left, f_mid, left, local_tol / 2, depth + 1)) # делим левую половину
+                stack.append((mid, hi, f_mid, f_right, f_hi, right, local_tol / 2, depth + 1)) # делим правую половину
+        return QuadResult(math.fsum(values), math.fsum(errors), n_eval) # суммируем вклады отрезков
+
+    if method == 'gk15': # глобальный метод Гаусса--Кронрода
+        value, error = _gauss_kronrod(f, a, b) # первое приближение на всем отрезке
+        n_eval = 15 # правило K15 использует 15 точек
+        heap = [(-error, a, b, value, 0)] # куча отрезков: сверху отрезок с наибольшей ошибкой
+        total_error = error # суммарная оценка ошибки
+        while total_error > tol: # пока точность не достигнута
+            neg_error, lo, hi, value, depth = heap[0] # отрезок с наибольшей ошибкой
+            if depth >= max_depth: # отрезок больше делить нельзя
+                break # останавливаемся с текущей оценкой ошибки
+            heapq.heappop(heap) # убираем отрезок из кучи
+            mid = (lo + hi) / 2 # середина отрезка
+            total_error += neg_error # убираем ошибку разделенного отрезка
+            for part_lo, part_hi in ((lo, mid), (mid, hi)): # обрабатываем обе половины
+                part_value, part_error = _gauss_kronrod(f, part_lo, part_hi) # K15 на половине
+                heapq.heappush(heap, (-part_error, part_lo, part_hi, part_value, depth + 1)) # кладем половину в кучу
+                total_error += part_error # добавляем ошибку половины
+            n_eval += 30 # две половины по 15 точек
+        return QuadResult(math.fsum(item[3] for item in heap), math.fsum(-item[0] for item in heap), n_eval) # суммируем вклады отрезков
+
+    raise ValueError("method должен быть 'simpson' или 'gk15'") # неизвестный метод
+
+
+class TestIntegrateAdaptive(unittest.TestCase):
+    '''
+    Класс TestIntegrateAdaptive содержит unit-тесты для функции integrate_adaptive()
+    '''
+    def test_accuracy_and_evaluations(self):
+        '''
+        Функция test_accuracy_and_evaluations() проверяет точность и число вычислений f
+        '''
+        cases = [
+            (math.cos, 0, math.pi/2, 1.0), # гладкая функция
+            (math.sqrt, 0, 1, 2/3), # особенность производной в нуле
+            (lambda x: 1 / (1 + 100 * x * x), -1, 1, 0.2 * math.atan(10)), # узкий пик в центре
+        ]
+        for method in ('simpson', 'gk15'): # проверяем оба метода
+            for f, a, b, expected in cases: # проверяем каждую функцию
+                result = integrate_adaptive(f, a, b, tol=1e-9, method=method) # адаптивное интегрирование
+                self.assertAlmostEqual(result.value, expected, delta=1e-8) # достигнута нужная точность
+                self.assertLess(result.n_eval, 10000) # на порядки меньше, чем n_iter=1e6
+
+    def test_invalid_arguments(self):
+        '''
+        Функция test_invalid_arguments() проверяет обработку некорректных параметров
+        '''
+        with self.assertRaises(ValueError): # неизвестный метод
+            integrate_adaptive(math.cos, 0, 1, method='romberg') # вызываем с неизвестным методом
+        with self.assertRaises(ValueError): # b <= a
+            integrate_adaptive(math.cos, 1, 0) # вызываем с перепутанными пределами
+
+
+def time_measurements(n_iters=(1000000,), n_jobs=(2, 4, 6, 8), repeat: int = 5):
+    '''
+    Функция time_measurements() выполняет замеры времени для всех доступных версий
+    вычисления интеграла (Python, numpy, потоки, процессы, Cython, noGIL, prange)
+    с помощью набора замеров bench.py; для JSON/CSV отчетов см. python bench.py --help
+
+    Параметры:
+    n_iters -- значения количества итераций
+    n_jobs -- значения количества потоков/процессов
+    repeat -- количество замеров в каждой точке
+    '''
+    from bench import run_benchmarks, print_report # импортируем набор замеров только при необходимости
+
     print('\n' + '-'*50) # выводим разделительную линию
-    print('Время работы') # выводим заголовок
+    print('Время работы: ∫cos(x)dx от 0 до pi/2') # выводим заголовок
     print('-'*50) # выводим разделительную линию
-    
-    test_func = math.cos # задаем тестовую функцию
-    a, b = 0, math.pi/2 # задаем пределы интегрирования
-    n_iter = 1000000 # задаем количество итераций
-    
-    print(f'\nТест: ∫cos(x)dx от {a} до {b}, n_iter={n_iter}') # выводим параметры теста
+    print_report(run_benchmarks(n_iters=n_iters, n_jobs=n_jobs, repeat=repeat)) # замеряем бэкенды и выводим таблицу
+
+
+def compare_rules(tol: float = 1e-6, max_iter: int = 2 ** 22):
+    '''
+    Функция compare_rules() сравнивает правила RULES по количеству вычислений f,
+    необходимому для достижения точности tol на ∫cos(x)dx от 0 до pi/2
+
+    Параметры:
+    tol -- требуемая абсолютная погрешность
+    max_iter -- наибольшее проверяемое количество разбиений
+    '''
+    print('\n' + '-'*50) # выводим разделительную линию
+    print(f'Сравнение правил: вычислений f до точности {tol:g}') # выводим заголовок
     print('-'*50) # выводим разделительную линию
-    
-    print('\n1. Базовая версия программы:') # выводим заголовок для базовой версии
-    setup = 'from __main__ import integrate; import math' # настройка для timeit
-    stmt = f'integrate(math.cos, {a}, {b}, n_iter={n_iter})' # выражение для измерения
-    timer = timeit.Timer(stmt, setup=setup) # создаем таймер
-    base_time = min(timer.repeat(repeat=3, number=1)) # измеряем минимальное время из 3 запусков
-    print(f'   Время: {base_time:.6f} сек') # выводим результат
-    
-    print('\n2. Версия программы с потоками:') # выводим заголовок для потоков
-    for n_jobs in [2, 4, 6, 8]: # перебираем количество потоков
-        setup = 'from __main__ import integrate_threaded; import math' # настройка для timeit
-        stmt = f'integrate_threaded(math.cos, {a}, {b}, n_jobs={n_jobs}, n_iter={n_iter})' # выражение для измерения
-        timer = timeit.Timer(stmt, setup=setup) # создаем таймер
-        time_val = min(timer.repeat(repeat=3, number=1)) # измеряем минимальное время
-        speedup = base_time / time_val if time_val > 0 else 0 # вычисляем ускорение
-        print(f'   {n_jobs} потока(ов): {time_val:.6f} сек, ускорение: {speedup:.2f}x') # выводим результат
-    
-    print('\n3. Версия программы с процессами:') # выводим заголовок для процессов
-    for n_jobs in [2, 4, 6, 8]: # перебираем количество процессов
-        setup = 'from __main__ import integrate_processes; import math' # настройка для timeit
-        stmt = f'integrate_processes(math.cos, {a}, {b}, n_jobs={n_jobs}, n_iter={n_iter})' # выражение для измерения
-        timer = timeit.Timer(stmt, setup=setup) # создаем таймер
-        time_val = min(timer.repeat(repeat=3, number=1)) # измеряем минимальное время
-        speedup = base_time / time_val if time_val > 0 else 0 # вычисляем ускорение
-        print(f'   {n_jobs} процесса(ов): {time_val:.6f} сек, ускорение: {speedup:.2f}x') # выводим результат
+
+    a, b, exact = 0, math.pi/2, 1.0 # пределы и точное значение интеграла
+    for method in RULES: # перебираем правила
+        n_iter = 1 # начинаем с одного разбиения
+        start = timeit.default_timer() # засекаем время поиска
+        while abs(integrate(math.cos, a, b, n_iter=n_iter, method=method) - exact) > tol and n_iter < max_iter: # пока точность не достигнута
+            n_iter *= 2 # удваиваем количество разбиений
+        elapsed = timeit.default_timer() - start # время поиска нужного n_iter
+        error = abs(integrate(math.cos, a, b, n_iter=n_iter, method=method) - exact) # итоговая ошибка
+        status = '' if error <= tol else ' (точность не достигнута)' # отмечаем правила, не уложившиеся в max_iter
+        print(f'   {method:<10} n_iter={n_iter:<8} вычислений f={rule_evaluations(method, n_iter):<8} ошибка={error:.2e} время={elapsed:.4f} сек{status}') # выводим результат
 
 
 def analyze_synchronization():
@@ -207,100 +1324,6 @@ def analyze_synchronization():
     print('- Требовалась координация выполнения') # приводим пример 3
 
 
-def test_cython_versions():
-    '''
-    Функция test_cython_versions() тестирует Cython версии функций
-    '''
-    try:
-        from integrate_cy import integrate_cy, integrate_cos_cy, integrate_cos_nogil # импортируем Cython функции
-        
-        print('\n' + '-'*50) # выводим разделительную линию
-        print('Тестируем Cython версию') # выводим заголовок
-        print('-'*50) # выводим разделительную линию
-        
-        a, b = 0, math.pi/2 # задаем пределы интегрирования
-        n_iter = 1000000 # задаем количество итераций
-        
-        setup_base = 'from __main__ import integrate; import math' # настройка для базовой версии
-        stmt_base = f'integrate(math.cos, {a}, {b}, n_iter={n_iter})' # выражение для базовой версии
-        timer_base = timeit.Timer(stmt_base, setup=setup_base) # создаем таймер для базовой версии
-        base_time = min(timer_base.repeat(repeat=3, number=1)) # измеряем базовое время
-        
-        print('\n1. Cython базовая версия:') # выводим заголовок для Cython базовой
-        setup = 'from integrate_cy import integrate_cy; import math' # настройка для Cython
-        stmt = f'integrate_cy(math.cos, {a}, {b}, n_iter={n_iter})' # выражение для Cython
-        timer = timeit.Timer(stmt, setup=setup) # создаем таймер
-        time_val = min(timer.repeat(repeat=3, number=1)) # измеряем время
-        speedup = base_time / time_val if time_val > 0 else 0 # вычисляем ускорение
-        print(f'   Время: {time_val:.6f} сек, ускорение: {speedup:.2f}x') # выводим результат
-        
-        print('\n2. Cython специализированная версия:') # выводим заголовок для специализированной
-        setup = 'from integrate_cy import integrate_cos_cy' # настройка для специализированной
-        stmt = f'integrate_cos_cy({a}, {b}, n_iter={n_iter})' # выражение для специализированной
-        timer = timeit.Timer(stmt, setup=setup) # создаем таймер
-        time_val = min(timer.repeat(repeat=3, number=1)) # измеряем время
-        speedup = base_time / time_val if time_val > 0 else 0 # вычисляем ускорение
-        print(f'   Время: {time_val:.6f} сек, ускорение: {speedup:.2f}x') # выводим результат
-        
-        print('\n3. Cython noGIL версия:') # выводим заголовок для noGIL
-        setup = 'from integrate_cy import integrate_cos_nogil' # настройка для noGIL
-        stmt = f'integrate_cos_nogil({a}, {b}, n_iter={n_iter})' # выражение для noGIL
-        timer = timeit.Timer(stmt, setup=setup) # создаем таймер
-        time_val = min(timer.repeat(repeat=3, number=1)) # измеряем время
-        speedup = base_time / time_val if time_val > 0 else 0 # вычисляем ускорение
-        print(f'   Время: {time_val:.6f} сек, ускорение: {speedup:.2f}x') # выводим результат
-        
-    except ImportError:
-        print('\nCython модуль не найден. Скомпилируйте его:') # выводим сообщение об ошибке
-        print('python setup_cython.py build_ext --inplace') # выводим команду для компиляции
-
-
-def test_nogil_prange():
-    '''
-    Функция test_nogil_prange() тестирует noGIL версию с использованием prange
-    '''
-    try:
-        from integrate_cy import integrate_cos_nogil_prange # импортируем функцию с prange
-        
-        print('\n' + '-'*50) # выводим разделительную линию
-        print('Тестируем noGIL версию') # выводим заголовок
-        print('-'*50) # выводим разделительную линию
-        
-        a, b = 0, math.pi/2 # задаем пределы интегрирования
-        n_iter = 1000000 # задаем количество итераций
-        
-        setup_base = 'from __main__ import integrate; import math' # настройка для базовой версии
-        stmt_base = f'integrate(math.cos, {a}, {b}, n_iter={n_iter})' # выражение для базовой версии
-        timer_base = timeit.Timer(stmt_base, setup=setup_base) # создаем таймер для базовой версии
-        base_time = min(timer_base.repeat(repeat=3, number=1)) # измеряем базовое время
-        
-        process_times = [0.343870, 0.340902, 0.385189, 0.401880] # данные из предыдущих замеров
-        avg_process_time = sum(process_times) / len(process_times) # вычисляем среднее время процессов
-        
-        print('\nСравнение noGIL потоков с Python процессами:') # выводим заголовок сравнения
-        print('-'*60) # выводим разделительную линию
-        
-        for n_threads in [2, 4, 6, 8]: # перебираем количество потоков
-            setup = 'from integrate_cy import integrate_cos_nogil_prange' # настройка для prange
-            stmt = f'integrate_cos_nogil_prange({a}, {b}, n_iter={n_iter}, n_threads={n_threads})' # выражение для prange
-            timer = timeit.Timer(stmt, setup=setup) # создаем таймер
-            time_val = min(timer.repeat(repeat=3, number=1)) # измеряем время
-            speedup = base_time / time_val if time_val > 0 else 0 # вычисляем ускорение
-            
-            print(f'\n{n_threads} потоков/процессов:') # выводим заголовок для текущего количества
-            print(f'  Cython noGIL: {time_val:.6f} сек') # выводим время prange
-            print(f'  Ускорение относительно базовой Python: {speedup:.2f}x') # выводим ускорение
-            
-            if n_threads == 4: # для 4 потоков/процессов
-                process_speedup = base_time / avg_process_time # вычисляем ускорение процессов
-                print(f'  Python процессы (4): ~{avg_process_time:.3f} сек') # выводим время процессов
-                print(f'  Ускорение относительно базовой Python: ~{process_speedup:.2f}x') # выводим ускорение процессов
-                print(f'  Выигрыш noGIL над процессами: {avg_process_time/time_val:.2f}x') # выводим сравнение
-    
-    except ImportError:
-        print('\nФункция integrate_cos_nogil_prange не найдена в Cython модуле') # выводим сообщение об ошибке
-
-
 def main():
     '''
     Функция main() является основной точкой входа в программу
@@ -320,19 +1343,17 @@ def main():
     print('OK') # выводим результат
     
     print('Unittest:', end=' ') # выводим метку для unittest
-    suite = unittest.TestLoader().loadTestsFromTestCase(TestIntegrate) # создаем набор тестов
+    loader = unittest.TestLoader() # создаем загрузчик тестов
+    test_cases = (TestIntegrate, TestIntegrator, TestIntegrateMany, TestIntegrateCumulative, TestIntegrateAdaptive) # классы тестов
+    suite = unittest.TestSuite(loader.loadTestsFromTestCase(case) for case in test_cases) # создаем набор тестов
     runner = unittest.TextTestRunner(verbosity=0) # создаем runner без подробного вывода
     result = runner.run(suite) # запускаем тесты
     print('OK' if result.wasSuccessful() else 'FAILED') # выводим результат
     
-    print('\nЗамеры времени:') # выводим заголовок итераций 2-3
+    print('\nЗамеры времени (Python, потоки, процессы, Cython, noGIL):') # выводим заголовок итераций 2-5
     time_measurements() # вызываем функцию замеров времени
-    
-    print('\nCython оптимизация:') # выводим заголовок итерации 4
-    test_cython_versions() # вызываем тестирование Cython версий
-    
-    print('\nnoGIL и сравнение:') # выводим заголовок итерации 5
-    test_nogil_prange() # вызываем тестирование noGIL с prange
+
+    compare_rules() # сравниваем квадратурные правила по числу вычислений
     analyze_synchronization() # вызываем анализ синхронизации
     
     print('\n' + '-'*50) # выводим разделительную линию
@@ -1,24 +1,80 @@
+import os # импортируем os для переменных окружения и путей к временным файлам
+import tempfile # импортируем tempfile для временной папки проверки флагов
 from setuptools import setup, Extension # импортируем setup и Extension для создания Python-пакетов
+from setuptools.command.build_ext import build_ext # импортируем стандартную команду сборки расширений
 from Cython.Build import cythonize # импортируем cythonize для компиляции Cython-модулей
-import numpy as np # импортируем numpy, хотя в данном скрипте не используется напрямую
 
 
-extra_compile_args = ['/openmp']  # Для MSVC -- флаг для включения поддержки OpenMP в компиляторе Microsoft
-extra_link_args = ['/openmp'] # флаг для линковщика -- также включает поддержку OpenMP
+# Профиль сборки задается переменными окружения:
+#   INTEGRATE_CY_FAST_MATH=1 -- разрешить -ffast-math (/fp:fast): быстрее, но порядок операций
+#                              с плавающей точкой может меняться, а Кэхэн--Неймайер перестает компенсировать
+#   INTEGRATE_CY_NATIVE=0    -- не использовать -march=native (переносимая сборка для других машин)
+FAST_MATH = os.environ.get('INTEGRATE_CY_FAST_MATH', '0') == '1' # включен ли fast-math
+NATIVE = os.environ.get('INTEGRATE_CY_NATIVE', '1') == '1' # оптимизировать ли под текущий процессор
+
+# флаги зависят от компилятора: тип компилятора -> {группа: (флаги компиляции, флаги линковки)}
+# при -ffast-math GCC векторизует cos/sin/exp через libmvec, поэтому нужна явная линковка с libm
+compiler_flags = {
+    'msvc': { # Для MSVC -- флаги компилятора Microsoft
+        'optimize': (['/O2'], []), 'native': ([], []), 'fast_math': (['/fp:fast'], []), 'openmp': (['/openmp'], []),
+    },
+    'unix': { # Для GCC/Clang на Linux и macOS
+        'optimize': (['-O3'], []), 'native': (['-march=native'], []), 'fast_math': (['-ffast-math'], ['-lm']), 'openmp': (['-fopenmp'], ['-fopenmp']),
+    },
+    'mingw32': { # Для MinGW на Windows
+        'optimize': (['-O3'], []), 'native': (['-march=native'], []), 'fast_math': (['-ffast-math'], []), 'openmp': (['-fopenmp'], ['-fopenmp']),
+    },
+}
+
+
+class BuildExtOpenMP(build_ext):
+    '''
+    Класс BuildExtOpenMP подбирает флаги оптимизации, fast-math и OpenMP под текущий компилятор;
+    флаги, которые компилятор не принимает (например, -fopenmp у Apple Clang), пропускаются
+    '''
+    def _supports(self, compile_args, link_args=()) -> bool:
+        '''
+        Функция _supports() проверяет, что компилятор собирает и компонует пустую программу с флагами
+        '''
+        with tempfile.TemporaryDirectory() as folder: # временная папка для проверки
+            source = os.path.join(folder, 'check.c') # исходный файл проверки
+            with open(source, 'w') as file: # записываем программу
+                file.write('int main(void) { return 0; }\n') # пустая программа
+            try:
+                objects = self.compiler.compile([source], output_dir=folder, extra_postargs=list(compile_args)) # компилируем
+                self.compiler.link_executable(objects, os.path.join(folder, 'check'), extra_postargs=list(link_args)) # компонуем
+            except Exception: # компилятор не принимает флаги
+                return False # флаги не поддерживаются
+        return True # флаги поддерживаются
+
+    def build_extensions(self):
+        flags = compiler_flags.get(self.compiler.compiler_type, {}) # флаги по типу компилятора
+        compile_args, link_args = list(flags.get('optimize', ([], []))[0]), [] # флаги оптимизации есть у любого поддерживаемого компилятора
+        for group, enabled in (('native', NATIVE), ('fast_math', FAST_MATH), ('openmp', True)): # необязательные группы флагов
+            group_compile, group_link = flags.get(group, ([], [])) # флаги группы
+            if enabled and group_compile and self._supports(group_compile, group_link): # группа включена и поддерживается
+                compile_args += group_compile # добавляем флаги компиляции
+                link_args += group_link # добавляем флаги линковки
+            elif group == 'openmp': # без OpenMP prange работает, но последовательно
+                print('OpenMP недоступен: prange будет выполняться в одном потоке') # предупреждаем о последовательной сборке
+        for ext in self.extensions: # проходим по всем расширениям
+            ext.extra_compile_args = ext.extra_compile_args + compile_args # добавляем флаги компилятора
+            ext.extra_link_args = ext.extra_link_args + link_args # добавляем флаги линковщика
+        super().build_extensions() # запускаем стандартную сборку
+
 
 # создаем список расширений для компиляции
 extensions = [
     Extension( # создаем объект Extension для описания компилируемого модуля
         "integrate_cy", # имя модуля, который будет импортироваться в Python
         ["integrate_cy.pyx"], # список исходных файлов на Cython
-        extra_compile_args=extra_compile_args, # дополнительные флаги для компилятора
-        extra_link_args=extra_link_args, # дополнительные флаги для линковщика
     )
 ]
 
 # вызываем функцию setup для конфигурации и сборки пакета
 setup(
     name="integrate_cython", # имя пакета для установки через pip
+    cmdclass={'build_ext': BuildExtOpenMP}, # подменяем команду сборки, чтобы выбрать флаги компилятора
     ext_modules=cythonize( # передаем результат функции cythonize как список модулей для компиляции
         extensions, # список объектов Extension для компиляции
         annotate=True,  # Для HTML отчета -- генерировать аннотированный HTML-файл для анализа кода
@@ -28,4 +84,4 @@ setup(
             'wraparound': False, # отключаем поддержку отрицательных индексов в массивах для ускорения
         }
     ),
-)
\ No newline at end of file
+)
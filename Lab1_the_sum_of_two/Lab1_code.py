@@ -1,5 +1,36 @@
+import bisect # импортируем bisect для поиска индексов правее заданного
+import random # импортируем random для случайных списков в замерах
+import timeit # импортируем timeit для замера времени
+
+import numpy as np # импортируем numpy для векторной версии
+
+
 # создаём функцию target с исходным списком nums и числом, которое нужно получить target
-def target(nums: list[int], target: int): 
+# за один проход: словарь first хранит первый индекс каждого уже встреченного числа,
+# поэтому для каждого числа пара ищется за O(1), а исходный список не изменяется
+def target(nums: list[int], target: int):
+    if not isinstance(target, int): # проверяем, что число target - целое
+        return None # возвращаем None
+    first = {} # словарь: число -> индекс его первого вхождения
+    best = None # лучшая найденная пара индексов
+    for j, num in enumerate(nums): # проходим по списку один раз
+        if not isinstance(num, int): # пропускаем не целые числа
+            continue # переходим к следующему числу
+        i = first.get(target - num) # индекс первого числа, которое в сумме с num даёт target
+        if i is not None and (best is None or i < best[0]): # пара с меньшим первым индексом (при равном первом индексе j уже минимален)
+            best = [i, j] # запоминаем пару
+            if i == 0: # меньше первого индекса не бывает
+                break # дальше искать незачем
+        first.setdefault(num, j) # запоминаем только первое вхождение числа
+    return best # возвращаем минимальную пару индексов или None
+
+
+_target = target # target() под другим именем: внутри функций ниже имя target занято аргументом
+
+
+# прежняя версия target за O(n²): оставлена для сравнения в замерах и работает с копией списка
+def target_naive(nums: list[int], target: int):
+    nums = list(nums) # копия, чтобы не портить список вызывающего
     l = [] # создаём список, в который будем заносить списки индексов
     for num in nums: # цикл: пока число num в списке чисел nums
         if isinstance(num, int) and isinstance(target, int): # проверяем, что число num и число target - целые
@@ -14,8 +45,107 @@ def target(nums: list[int], target: int):
     if len(l) > 0: # проверяем, что в списке l лежит больше 0 списков индексов
         return min(l) # возвращаем минимальную пару индексов
     else:
-        return None # возвращаем None  
-                
+        return None # возвращаем None
+
+
+# векторная версия target для больших целочисленных массивов: массив сортируется один раз
+# (устойчиво, поэтому среди равных чисел первым идёт меньший индекс), а пара для каждого
+# числа ищется бинарным поиском np.searchsorted сразу для всех чисел
+def target_numpy(nums, target: int):
+    if not isinstance(target, int): # проверяем, что число target - целое
+        return None # возвращаем None
+    try:
+        values = np.asarray(nums) # массив чисел без копирования, если nums уже массив numpy
+    except (ValueError, OverflowError): # список неоднородной формы
+        values = np.asarray(nums, dtype=object) # массив объектов
+    if values.ndim != 1 or values.dtype.kind not in 'iu': # не одномерный целочисленный массив (строки, дроби, смешанные типы)
+        return _target(list(nums), target) if values.ndim == 1 else None # считаем обычной версией с её проверками
+    if len(values) < 2: # пару из одного числа не составить
+        return None # возвращаем None
+    low, high = int(values.min()), int(values.max()) # наименьшее и наибольшее число
+    if not all(-2 ** 63 <= x < 2 ** 63 for x in (low, high, target, target - low, target - high)): # разность не помещается в int64 и numpy молча переполнится
+        return _target(values.tolist(), target) # считаем обычной версией на целых числах Python
+    values = values.astype(np.int64, copy=False) # все числа и разности помещаются в int64
+    order = np.argsort(values, kind='stable') # индексы в порядке возрастания чисел
+    ordered = values[order] # отсортированные числа
+    need = target - values # число, которое в сумме с каждым числом даёт target
+    pos = np.minimum(np.searchsorted(ordered, need), len(values) - 1) # первая позиция нужного числа в отсортированном массиве
+    partner = order[pos] # индекс первого вхождения нужного числа
+    same = partner == np.arange(len(values)) # первое вхождение совпало с самим числом
+    pos = np.where(same, np.minimum(pos + 1, len(values) - 1), pos) # тогда берём следующее вхождение
+    partner = order[pos] # индекс пары
+    found = (ordered[pos] == need) & (partner != np.arange(len(values))) # у числа есть пара с другим индексом
+    if not found.any(): # пар нет
+        return None # возвращаем None
+    i = int(np.argmax(found)) # наименьший индекс, у которого есть пара (его пара всегда правее)
+    return [i, int(partner[i])] # возвращаем минимальную пару индексов
+
+
+# создаём класс TwoSumIndex для многих запросов к одному списку: индекс (число -> возрастающий
+# список его индексов) строится один раз за O(n), после чего каждый запрос query() проверяет
+# числа в порядке их первого вхождения и останавливается на первом числе, у которого есть пара
+class TwoSumIndex:
+    def __init__(self, nums: list[int]):
+        self._values = list(nums) # снимок списка: последующие изменения nums не портят индекс
+        self._positions = {} # словарь: целое число -> возрастающий список его индексов (в порядке первого вхождения)
+        for i, num in enumerate(self._values): # проходим по списку один раз
+            if isinstance(num, int): # не целые числа в пары не входят
+                self._positions.setdefault(num, []).append(i) # добавляем индекс числа
+        self._n_values = len(self._values) # длина списка
+
+    def __len__(self):
+        return self._n_values # количество чисел в списке
+
+    # наименьшая пара индексов [i, j] с суммой target или None, как у функции target()
+    def query(self, target: int):
+        if not isinstance(target, int): # проверяем, что число target - целое
+            return None # возвращаем None
+        for num, positions in self._positions.items(): # числа в порядке первого вхождения
+            other = self._positions.get(target - num) # индексы числа, которое в сумме с num даёт target
+            if other is None: # пары для num нет
+                continue # переходим к следующему числу
+            if other is positions: # число складывается само с собой
+                if len(positions) > 1: # нужно хотя бы два вхождения
+                    return [positions[0], positions[1]] # два первых вхождения
+                continue # одного вхождения мало
+            return [positions[0], other[0]] # первое вхождение num меньше всех индексов ещё не проверенных чисел
+        return None # пар нет
+
+    # ленивый генератор всех пар индексов (i, j), i < j, с суммой target в лексикографическом порядке:
+    # пары не собираются в список, поэтому дополнительная память не зависит от их количества
+    def pairs(self, target: int):
+        if not isinstance(target, int): # проверяем, что число target - целое
+            return # пар нет
+        for i, num in enumerate(self._values): # первый индекс пары по возрастанию
+            if not isinstance(num, int): # не целые числа в пары не входят
+                continue # переходим к следующему числу
+            other = self._positions.get(target - num) # индексы второго числа
+            if other is None: # пары для num нет
+                continue # переходим к следующему числу
+            for k in range(bisect.bisect_right(other, i), len(other)): # только индексы правее i
+                yield (i, other[k]) # отдаём пару
+
+
+# создаём функцию benchmark, которая сравнивает время версий на списках разного размера;
+# пара спрятана в конце списка, поэтому каждой версии приходится просмотреть его целиком
+def benchmark(sizes=(10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6), repeat: int = 3, naive_limit: int = 2000):
+    rows = [] # строки отчёта
+    for n in sizes: # перебираем размеры списков
+        nums = random.Random(n).sample(range(10 ** 9), n) # различные числа
+        nums[-2:] = [-5, -7] # единственная пара с отрицательной суммой в конце списка
+        array = np.array(nums) # тот же список в виде массива numpy
+        versions = {'target': lambda: target(nums, -12), 'target_numpy': lambda: target_numpy(array, -12)} # замеряемые версии
+        if n <= naive_limit: # квадратичная версия слишком медленная для больших списков
+            versions['target_naive'] = lambda: target_naive(nums, -12) # прежняя версия
+        for name, run in versions.items(): # перебираем версии
+            assert run() == [n - 2, n - 1] # все версии находят одну и ту же пару
+            seconds = min(timeit.repeat(run, number=1, repeat=repeat)) # лучшее время
+            rows.append((name, n, seconds)) # строка отчёта
+    return rows # возвращаем отчёт
+
 
-result = target([3,3, 3, 3], 6) # результат записываем в переменную result
-print(result) # выводим результат
\ No newline at end of file
+if __name__ == '__main__':
+    result = target([3,3, 3, 3], 6) # результат записываем в переменную result
+    print(result) # выводим результат
+    for name, n, seconds in benchmark(): # выводим замеры
+        print(f'{name:<14}{n:>9}{seconds * 1000:>12.3f} мс') # версия, размер списка и время
\ No newline at end of file
@@ -1,4 +1,5 @@
 import unittest # импортируем библиотеку для проверки тестов
+import numpy as np # импортируем numpy для проверки векторной версии
 import Lab1_code # импортируем файл с кодом, который будем проверять
 
 
@@ -45,6 +46,52 @@ class Tests_for_my_code(unittest.TestCase): # создаём класс тест
     def test_both_type_nums(self): # тест списка из положительных и отрицательных чисел
         self.assertEqual(Lab1_code.target([-1, 4, 45, -3, 2, 9, 4], 8), [0, 5])
 
+    def test_input_not_changed(self): # тест, что исходный список не изменяется
+        nums = [3, 3, 3, 3] # исходный список
+        Lab1_code.target(nums, 6) # ищем пару
+        self.assertEqual(nums, [3, 3, 3, 3])
+
+    def test_lexicographically_smallest(self): # тест, что возвращается пара с наименьшими индексами
+        self.assertEqual(Lab1_code.target([5, 1, 5, 1, 4], 6), [0, 1])
+
+    def test_numpy_matches_target(self): # тест совпадения векторной версии с обычной
+        for nums, target in (([11, 5, 3, 3, 4, 4], 7), ([0, 0, 0, 0], 0), ([1, 2], 4), ([-1, 4, 45, -3, 2, 9, 4], 8), ([5], 10)):
+            self.assertEqual(Lab1_code.target_numpy(nums, target), Lab1_code.target(nums, target))
+
+    def test_numpy_not_ints(self): # тест векторной версии на не целых числах
+        self.assertEqual(Lab1_code.target_numpy([0.5, 1, 3], 4), [1, 2])
+        self.assertEqual(Lab1_code.target_numpy(['q', 'r', 'h'], 'qr'), None)
+
+    def test_numpy_large_array(self): # тест векторной версии на большом массиве
+        nums = np.arange(10 ** 6) * 2 # только чётные числа
+        self.assertEqual(Lab1_code.target_numpy(nums, 3), None)
+        self.assertEqual(Lab1_code.target_numpy(nums, 4), [0, 2])
+
+    def test_numpy_int64_overflow(self): # тест: разность, не помещающаяся в int64, не даёт несуществующую пару
+        self.assertEqual(Lab1_code.target_numpy(np.array([2 ** 62, 2 ** 62]), -2 ** 63), Lab1_code.target([2 ** 62, 2 ** 62], -2 ** 63))
+        self.assertEqual(Lab1_code.target_numpy(np.array([2 ** 62, 2 ** 62]), -2 ** 63), None)
+        self.assertEqual(Lab1_code.target_numpy(np.array([2 ** 63, 1], dtype=np.uint64), 2 ** 63 + 1), [0, 1])
+        self.assertEqual(Lab1_code.target_numpy(np.array([-2 ** 63, 5]), -2 ** 63 + 5), [0, 1])
+
+    def test_index_queries(self): # тест многих запросов к одному индексу
+        nums = [11, 5, 3, 3, 4, 4, 'q', 0.5] # исходный список
+        index = Lab1_code.TwoSumIndex(nums) # строим индекс один раз
+        for target in range(-2, 20): # сравниваем каждый запрос с функцией target
+            self.assertEqual(index.query(target), Lab1_code.target(nums, target))
+        self.assertEqual(index.query('qr'), None)
+
+    def test_index_all_pairs(self): # тест ленивого перебора всех пар
+        index = Lab1_code.TwoSumIndex([3, 3, 3, 1, 5]) # исходный список
+        pairs = index.pairs(6) # генератор пар
+        self.assertEqual(next(pairs), (0, 1)) # пары выдаются по одной
+        self.assertEqual(list(pairs), [(0, 2), (1, 2), (3, 4)])
+        self.assertEqual(list(index.pairs(100)), [])
+
+    def test_index_huge_pairs(self): # тест, что пары не собираются в список
+        index = Lab1_code.TwoSumIndex([0] * 10 ** 4) # около 5 * 10**7 пар
+        pairs = index.pairs(0) # генератор создаётся мгновенно
+        self.assertEqual([next(pairs) for _ in range(3)], [(0, 1), (0, 2), (0, 3)])
+
 
 if __name__ == '__main__':
 
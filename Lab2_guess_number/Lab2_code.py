@@ -1,3 +1,11 @@
+import bisect # импортируем bisect для быстрого отсечения отсутствующих чисел
+import random # импортируем random для случайных чисел в замерах
+import timeit # импортируем timeit для замера времени
+from array import array # импортируем array для компактного хранения отсортированных чисел
+
+import numpy as np # импортируем numpy для векторного поиска многих чисел
+
+
 def main():
     '''Получение данных с клавиатуры'''
     target = input('Введи число, которое нужно отгадать: ') # загаданное пользователем число
@@ -6,10 +14,10 @@ def main():
         nums = list(map(int, input('Введи список, в котором программа будет искать число (целые числа через пробел): ').split())) # ввод списка пользователем
     elif t_or_f == 'no':
         borders = list(map(int, input('Введи верхнюю и нижнюю границы (целые числа через пробел): ').split())) # ввод пользователем верхней и нижней границы
-        nums = list(range(min(borders), max(borders) + 1)) # создание диапазона
+        nums = range(min(borders), max(borders) + 1) # создание диапазона: range не хранит числа, поэтому даже ±10**9 занимает O(1) памяти
     else:
         nums = [] # создание пустого списка, чтобы запустить функцию guess_func, если пользователь не ввёл yes или no
-    type = input('Выберите алгоритм для поиска числа (bin/seq): ') # пользователь задаёт тип алгоритма поиска
+    type = input('Выберите алгоритм для поиска числа (bin/seq/interp/exp): ') # пользователь задаёт тип алгоритма поиска
 
     return guess_func(target=target, nums=nums, type=type) # вызов функции угадывания числа
 
@@ -21,6 +29,8 @@ def senquential(target: int, nums: list[int], count=0):
     nums -- список целых чисел, в которм ищем target
     count -- количество угадываний
     '''
+    if isinstance(nums, range) and isinstance(target, int): # у диапазона позиция числа вычисляется сразу
+        return [target, count + nums.index(target) + 1] if target in nums else None # столько угадываний сделал бы перебор
     for num in nums: # циклом for пробегаемся по элементам списка
         if num != target: # если число не равно загаданному числу
             count += 1 # увеличиваем количество угадывания на 1
@@ -30,8 +40,39 @@ def senquential(target: int, nums: list[int], count=0):
     return None # если цикл вылетел или не запустился возвращаем None
         
 def binary(target: int, nums: list[int], count=0):
-    '''Реализация алгоритма медленного перебора.
-    
+    '''Реализация алгоритма бинарного поиска по индексам lo/hi.
+
+    Границы поиска хранятся индексами, поэтому список не копируется на каждом шаге
+    и поиск действительно занимает O(log n). Отсутствующее число отсекается
+    сразу с помощью bisect, а для найденного количество угадываний совпадает
+    с прежней версией binary_slicing.
+
+    Ключевые аргументы:
+    target -- число, которое нужно угадать
+    nums -- отсортированный по возрастанию список целых чисел (или range), в которм ищем target
+    count -- количество угадываний
+    '''
+    i = bisect.bisect_left(nums, target) # позиция, на которой target стоял бы в отсортированном списке
+    if i == len(nums) or nums[i] != target: # target в списке нет
+        return None # возвращаем None, не тратя угадываний
+    lo, hi = 0, len(nums) # границы оставшейся части списка: nums[lo:hi]
+    while lo < hi: # пока в оставшейся части есть хоть один элемент
+        mid = lo + (hi - lo) // 2 # ищем середину оставшейся части (как len(nums) // 2 у среза)
+        num = nums[mid] # присваеваем переменной num число из списка nums с индексом mid
+        count += 1 # увеличиваем количество угадывания на 1
+        if num == target: # num является target-ом
+            return [num, count] # возвращаем загаданное число и количество угадываний
+        if target > num: # проверяем больше ли target, чем num
+            lo = mid + 1 # если да, сдвигаем левую границу за mid, т.к. mid мы уже проверили
+        else:
+            hi = mid # если нет, сдвигаем правую границу на mid(не включая его)
+    return None # если цикл вылетел или не запустился возвращаем None
+
+
+def binary_slicing(target: int, nums: list[int], count=0):
+    '''Прежняя реализация бинарного поиска срезами: каждый шаг копирует половину
+    списка, поэтому поиск занимает O(n) памяти и времени. Оставлена для замеров.
+
     Ключевые аргументы:
     target -- число, которое нужно угадать
     nums -- список целых чисел, в которм ищем target
@@ -52,29 +93,329 @@ def binary(target: int, nums: list[int], count=0):
     return None # если цикл вылетел или не запустился возвращаем None
 
 
-def guess_func(target: int, nums: list[int], type: str):
-    '''Поиск загаданного числа с помощью одного из двух алгоритмов.
-    
+def interpolation(target: int, nums: list[int], count=0):
+    '''Реализация алгоритма интерполяционного поиска.
+
+    Следующая догадка выбирается пропорционально положению target между крайними
+    числами оставшейся части, поэтому на равномерно распределённых числах
+    поиск делает O(log log n) угадываний. Вычисления целочисленные, без округлений.
+
     Ключевые аргументы:
     target -- число, которое нужно угадать
-    nums -- список целых чисел, в которм ищем target
-    type -- тип алгоритма, который будет искать загаданное число
+    nums -- отсортированный по возрастанию список целых чисел (или range), в которм ищем target
+    count -- количество угадываний
+    '''
+    lo, hi = 0, len(nums) - 1 # границы оставшейся части списка: nums[lo:hi + 1]
+    while lo <= hi and nums[lo] <= target <= nums[hi]: # target может лежать в оставшейся части
+        if nums[hi] == nums[lo]: # все числа оставшейся части одинаковые
+            mid = lo # угадываем первое из них
+        else:
+            mid = lo + (target - nums[lo]) * (hi - lo) // (nums[hi] - nums[lo]) # догадка пропорционально значению target
+        num = nums[mid] # присваеваем переменной num число из списка nums с индексом mid
+        count += 1 # увеличиваем количество угадывания на 1
+        if num == target: # num является target-ом
+            return [num, count] # возвращаем загаданное число и количество угадываний
+        if target > num: # проверяем больше ли target, чем num
+            lo = mid + 1 # если да, сдвигаем левую границу за mid
+        else:
+            hi = mid - 1 # если нет, сдвигаем правую границу перед mid
+    return None # если target вне оставшейся части, возвращаем None
+
+
+def exponential(target: int, nums: list[int], count=0):
+    '''Реализация алгоритма экспоненциального поиска.
+
+    Догадки делаются по индексам 0, 1, 2, 4, 8, ..., пока число не станет не меньше target,
+    затем бинарный поиск идёт между двумя последними догадками. Если target лежит
+    на позиции k, поиск делает O(log k) угадываний, т.е. выигрывает у бинарного
+    поиска, когда target близко к началу списка.
+
+    Ключевые аргументы:
+    target -- число, которое нужно угадать
+    nums -- отсортированный по возрастанию список целых чисел (или range), в которм ищем target
+    count -- количество угадываний
+    '''
+    bound, prev = 0, -1 # текущая догадка и предыдущая (меньше target)
+    while bound < len(nums): # пока догадка внутри списка
+        num = nums[bound] # присваеваем переменной num число из списка nums с индексом bound
+        count += 1 # увеличиваем количество угадывания на 1
+        if num == target: # num является target-ом
+            return [num, count] # возвращаем загаданное число и количество угадываний
+        if num > target: # target левее догадки
+            break # переходим к бинарному поиску
+        prev, bound = bound, max(1, bound * 2) # удваиваем индекс догадки
+    lo, hi = prev + 1, min(bound, len(nums)) # target может лежать только в nums[lo:hi]
+    while lo < hi: # бинарный поиск в оставшейся части
+        mid = lo + (hi - lo) // 2 # ищем середину оставшейся части
+        num = nums[mid] # присваеваем переменной num число из списка nums с индексом mid
+        count += 1 # увеличиваем количество угадывания на 1
+        if num == target: # num является target-ом
+            return [num, count] # возвращаем загаданное число и количество угадываний
+        if target > num: # проверяем больше ли target, чем num
+            lo = mid + 1 # если да, сдвигаем левую границу за mid
+        else:
+            hi = mid # если нет, сдвигаем правую границу на mid(не включая его)
+    return None # если цикл вылетел или не запустился возвращаем None
+
+
+class SearchIndex:
+    '''Отсортированный и проверенный набор чисел для многих поисков.
+
+    Проверка и сортировка выполняются один раз при создании, поэтому каждый
+    следующий поиск занимает O(log n) (интерполяционный -- O(log log n) в среднем),
+    а исходный список не изменяется. Числа хранятся в array('q'); если какое-то
+    число не помещается в 64 бита, используется обычный список.
+
+    Диапазон range и уже отсортированные ленивые последовательности (presorted=True)
+    не копируются: поиск обращается к их элементам по индексу, поэтому даже
+    огромный диапазон занимает O(1) памяти.
+
+    Ключевые аргументы:
+    nums -- список целых чисел, в которм будем искать
+    presorted -- nums уже отсортирован по возрастанию и содержит только целые числа;
+                 тогда он используется как есть, без проверки и копирования
+
+    Вызывает ValueError, если в nums есть не целое число.
+    '''
+    def __init__(self, nums: list[int], presorted: bool = False):
+        if isinstance(nums, range): # диапазон всегда состоит из целых чисел
+            self._values = nums if nums.step > 0 else nums[::-1] # убывающий диапазон переворачиваем, тоже без копирования
+        elif presorted: # последовательность уже подготовлена вызывающим
+            self._values = nums # используем как есть
+        else:
+            if not all(isinstance(num, int) for num in nums): # проверяем, что в nums лежат только целые числа
+                raise ValueError('в списке должны быть только целые числа') # вызываем исключение
+            values = sorted(nums) # отсортированная копия, nums не изменяется
+            try:
+                self._values = array('q', values) # компактный массив 64-битных чисел
+            except OverflowError: # число не помещается в 64 бита
+                self._values = values # храним обычный список
+        self._methods = {'seq': self.seq, 'bin': self.bin, 'interp': self.interp, 'exp': self.exp} # алгоритмы поиска по названию
+
+    def __len__(self):
+        return len(self._values) # количество чисел
+
+    def seq(self, target: int):
+        '''Результат последовательного поиска: в отсортированном списке он угадывает
+        число за (индекс первого вхождения + 1) попыток, поэтому ответ находится
+        через bisect за O(log n) без перебора.'''
+        i = bisect.bisect_left(self._values, target) # индекс первого вхождения target
+        if i == len(self._values) or self._values[i] != target: # target в списке нет
+            return None # возвращаем None
+        return [target, i + 1] # загаданное число и количество угадываний
+
+    def bin(self, target: int):
+        '''Бинарный поиск, как у функции binary.'''
+        return binary(target, self._values) # ищем по отсортированным числам
+
+    def interp(self, target: int):
+        '''Интерполяционный поиск, как у функции interpolation.'''
+        return interpolation(target, self._values) # ищем по отсортированным числам
+
+    def exp(self, target: int):
+        '''Экспоненциальный поиск, как у функции exponential.'''
+        return exponential(target, self._values) # ищем по отсортированным числам
+
+    def search(self, target: int, type: str):
+        '''Поиск target алгоритмом type ('seq', 'bin', 'interp' или 'exp').
+
+        Вызывает ValueError, если алгоритм неизвестен.
+        '''
+        if type not in self._methods: # неизвестный алгоритм
+            raise ValueError(f'неизвестный алгоритм поиска: {type!r}') # вызываем исключение
+        return self._methods[type](target) # ищем выбранным алгоритмом
+
+    def as_int64(self):
+        '''Отсортированные числа в виде массива numpy int64 без копирования или None,
+        если числа хранятся не в array('q') (range, presorted-последовательность,
+        числа больше 64 бит). Массив только для чтения.
+        '''
+        if not isinstance(self._values, array): # числа хранятся не в array('q')
+            return None # векторный доступ невозможен
+        values = np.frombuffer(self._values, dtype=np.int64) # массив поверх тех же байтов
+        values.flags.writeable = False # изменение сломало бы порядок чисел в индексе
+        return values # возвращаем массив
+
+
+def _parse_target(target):
+    '''Загаданное число, как его понимает guess_func: целое число или строка с ним;
+    для остальных значений (дроби, '-+5', '²', ...) возвращает None.
     '''
-    if str(target).lstrip('-+').isdigit() and all([isinstance(num, int) for num in nums]) and isinstance(type, str) \
-        and (type == 'bin' or type == 'seq'): # проверяем, что target - целое число, в списке nums  лежать целые числа, type  является строкой и содержит в себе либо bin, либо seq
-        target = int(target) #  т.к. target был задан строкой, во избежании ошибки при не ккоректном вводе, меняем его тип на int 
-        nums.sort() # сортируем список nums по возрастанию
-        if type == 'seq': # если type содержит в себе seq
-            result = senquential(target=target, nums=nums) # записываем в result результат выполнения функции senquential
-            return result # возвращаем результат
-        elif type == 'bin': # если type содержит в себе bin
-            result = binary(target=target, nums=nums) # записываем в result результат выполнения функции binary
-            return result # возвращаем результат
-        return None # если ни одно из представленных выше условий не верно, возвращвем None 
+    if not str(target).lstrip('-+').isdigit(): # не похоже на целое число
+        return None # число задано некорректно
+    try:
+        return int(target) # т.к. target мог быть задан строкой, меняем его тип на int
+    except (TypeError, ValueError): # isdigit() пропускает '-+5' и надстрочные цифры, которые int() не принимает
+        return None # число задано некорректно
+
+
+def guess_func(target: int, nums: list[int], type: str, presorted: bool = False):
+    '''Поиск загаданного числа с помощью одного из четырёх алгоритмов.
+
+    Список nums не изменяется: поиск идёт по SearchIndex, построенному из его копии.
+    Диапазон range не копируется и не перебирается, поэтому поиск в ±10**9 занимает O(1) памяти;
+    так же можно искать в любой ленивой последовательности с доступом по индексу, если передать presorted=True.
+
+    Ключевые аргументы:
+    target -- число, которое нужно угадать
+    nums -- список или диапазон range целых чисел, в которм ищем target
+    type -- тип алгоритма, который будет искать загаданное число: 'seq' (перебор), 'bin' (бинарный),
+            'interp' (интерполяционный) или 'exp' (экспоненциальный)
+    presorted -- nums уже отсортирован по возрастанию и содержит только целые числа:
+                 он не проверяется и не копируется (см. SearchIndex)
+    '''
+    target = _parse_target(target) # целое число или None
+    if target is not None and isinstance(type, str) and type in ('seq', 'bin', 'interp', 'exp'): # проверяем, что target - целое число, type является строкой и содержит в себе один из алгоритмов
+        try:
+            index = SearchIndex(nums, presorted=presorted) # сортируем и проверяем числа один раз
+        except ValueError: # в списке nums лежат не только целые числа
+            return None # возвращаем None
+        return index.search(target, type) # ищем выбранным алгоритмом
     return None # если какое-то из условий if-а нарушено, возвращаем None
 
 
+RESULT_DTYPE = np.dtype([('found', np.bool_), ('steps', np.int64)]) # тип результата guess_many: найдено ли число и количество угадываний
+
+
+def _binary_steps(values, targets):
+    '''Бинарный поиск всех targets сразу: на каждом шаге все ещё не найденные числа
+    делают одно угадывание, поэтому количество угадываний совпадает с функцией binary,
+    а число шагов цикла -- O(log n) векторных операций.
+
+    Ключевые аргументы:
+    values -- отсортированный массив int64, в котором ищем
+    targets -- массив int64 чисел, которые есть в values
+    '''
+    lo = np.zeros(len(targets), dtype=np.int64) # левые границы оставшихся частей
+    hi = np.full(len(targets), len(values), dtype=np.int64) # правые границы оставшихся частей
+    steps = np.zeros(len(targets), dtype=np.int64) # количество угадываний
+    active = np.ones(len(targets), dtype=np.bool_) # числа, которые ещё не угаданы
+    while active.any(): # пока есть не угаданные числа
+        mid = lo + (hi - lo) // 2 # середины оставшихся частей
+        num = values[np.minimum(mid, len(values) - 1)] # догадки (у угаданных чисел индекс может выйти за массив)
+        steps += active # каждое не угаданное число делает одно угадывание
+        active &= num != targets # угаданные числа выходят из поиска
+        lo = np.where(active & (targets > num), mid + 1, lo) # сдвигаем левые границы за mid
+        hi = np.where(active & (targets < num), mid, hi) # сдвигаем правые границы на mid
+    return steps # возвращаем количество угадываний
+
+
+def guess_many(targets, nums: list[int], type: str, vectorized: bool = True, presorted: bool = False):
+    '''Поиск многих загаданных чисел в одном списке.
+
+    Проверка и сортировка nums выполняются один раз (SearchIndex), после чего ищутся все
+    targets. Для 'seq' и 'bin' при vectorized=True поиск идёт векторно через numpy:
+    np.searchsorted сразу отсекает отсутствующие числа и даёт количество угадываний перебора,
+    а бинарный поиск выполняется для всех чисел одновременно с тем же количеством угадываний,
+    что и у binary. Остальные случаи (interp, exp, range, числа больше 64 бит) ищутся по одному.
+
+    Ключевые аргументы:
+    targets -- числа, которые нужно угадать (как у guess_func: целые числа или строки с ними)
+    nums -- список или диапазон range целых чисел, в которм ищем targets
+    type -- тип алгоритма: 'seq', 'bin', 'interp' или 'exp'
+    vectorized -- использовать векторный поиск numpy, если он возможен
+    presorted -- nums уже отсортирован по возрастанию и содержит только целые числа:
+                 он не проверяется и не копируется (см. SearchIndex)
+
+    Возвращает массив numpy с полями found (найдено ли число) и steps (количество угадываний,
+    0 для не найденных) в порядке targets или None, если nums или type некорректны.
+    '''
+    if not isinstance(type, str) or type not in ('seq', 'bin', 'interp', 'exp'): # проверяем алгоритм
+        return None # возвращаем None
+    try:
+        index = SearchIndex(nums, presorted=presorted) # сортируем и проверяем числа один раз
+    except ValueError: # в списке nums лежат не только целые числа
+        return None # возвращаем None
+    targets = [_parse_target(target) for target in targets] # числа, как их понимает guess_func (некорректные -- None)
+    result = np.zeros(len(targets), dtype=RESULT_DTYPE) # по умолчанию числа не найдены
+    values = index.as_int64() if vectorized and type in ('seq', 'bin') else None # массив numpy без копирования чисел
+    if values is not None and len(values) > 0: # векторный поиск возможен
+        valid = np.array([target is not None and -2 ** 63 <= target < 2 ** 63 for target in targets], dtype=np.bool_) # числа, которые помещаются в int64
+        wanted = np.array([target if ok else 0 for target, ok in zip(targets, valid)], dtype=np.int64) # числа в виде массива
+        pos = np.searchsorted(values, wanted) # позиции первых вхождений
+        found = valid & (pos < len(values)) # число может быть в массиве
+        found[found] = values[pos[found]] == wanted[found] # число есть в массиве
+        result['found'] = found # записываем, какие числа найдены
+        if type == 'seq': # перебор угадывает число за (индекс первого вхождения + 1) попыток
+            result['steps'][found] = pos[found] + 1 # количество угадываний
+        else:
+            result['steps'][found] = _binary_steps(values, wanted[found]) # бинарный поиск всех найденных чисел сразу
+        return result # возвращаем результат
+    for i, target in enumerate(targets): # поиск по одному числу
+        if target is not None: # число задано корректно
+            found = index.search(target, type) # ищем выбранным алгоритмом
+            if found is not None: # число найдено
+                result[i] = (True, found[1]) # записываем результат
+    return result # возвращаем результат
+
+
+def benchmark(sizes=(10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7), number: int = 100):
+    '''Сравнение времени поиска binary и binary_slicing на списках разного размера.
+
+    Ключевые аргументы:
+    sizes -- размеры списков
+    number -- количество поисков при каждом замере
+
+    Возвращает список строк (размер, время binary, время binary_slicing) в секундах на один поиск.
+    '''
+    rows = [] # строки отчёта
+    for n in sizes: # перебираем размеры списков
+        nums = list(range(n)) # отсортированный список
+        target = n // 3 # число, которое ищем
+        assert binary(target, nums) == binary_slicing(target, nums) # обе версии дают одинаковый результат
+        fast = min(timeit.repeat(lambda: binary(target, nums), number=number, repeat=3)) / number # время версии с индексами
+        slow = min(timeit.repeat(lambda: binary_slicing(target, nums), number=max(1, number // 10), repeat=3)) / max(1, number // 10) # время версии со срезами
+        rows.append((n, fast, slow)) # строка отчёта
+    return rows # возвращаем отчёт
+
+
+def compare_types(sizes=(10 ** 3, 10 ** 5, 10 ** 7), n_targets: int = 200, near: int = 16, seq_limit: int = 10 ** 5):
+    '''Сравнение алгоритмов guess_func по среднему количеству угадываний и времени.
+
+    Для каждого размера ищутся случайные числа из равномерно распределённого списка
+    (выигрывает interp) и числа среди первых near элементов (выигрывает exp).
+    Время seq замеряется настоящим перебором senquential (SearchIndex.seq находит
+    количество угадываний через bisect и не показал бы O(n)); для случайных чисел
+    в списках длиннее seq_limit перебор слишком долгий, и время seq не замеряется.
+
+    Ключевые аргументы:
+    sizes -- размеры списков
+    n_targets -- количество искомых чисел в каждом замере
+    near -- сколько первых элементов списка считаются близкими к началу
+    seq_limit -- наибольший размер списка, для которого замеряется перебор случайных чисел
+
+    Возвращает список строк (размер, набор чисел, тип, среднее количество угадываний,
+    время одного поиска в секундах или None, если оно не замерялось).
+    '''
+    rows = [] # строки отчёта
+    for n in sizes: # перебираем размеры списков
+        rng = random.Random(n) # генератор случайных чисел
+        values = sorted(rng.sample(range(10 ** 9), n)) # равномерно распределённые различные числа
+        index = SearchIndex(values, presorted=True) # индекс поверх того же списка
+        targets = {'uniform': [values[rng.randrange(n)] for _ in range(n_targets)], # случайные числа списка
+                   'near_start': [values[rng.randrange(min(near, n))] for _ in range(n_targets)]} # числа у начала списка
+        for kind, chosen in targets.items(): # перебираем наборы чисел
+            for type in ('seq', 'bin', 'interp', 'exp'): # перебираем алгоритмы
+                guesses = sum(index.search(target, type)[1] for target in chosen) / len(chosen) # среднее количество угадываний
+                if type == 'seq': # перебор замеряется настоящим проходом по списку
+                    run = lambda: [senquential(target, values) for target in chosen] # перебор O(n)
+                    if kind == 'uniform' and n > seq_limit: # перебор случайных чисел в большом списке слишком долгий
+                        run = None # время не замеряем
+                else:
+                    run = lambda: [index.search(target, type) for target in chosen] # поиск по индексу
+                seconds = None if run is None else min(timeit.repeat(run, number=1, repeat=3)) / len(chosen) # время одного поиска
+                rows.append((n, kind, type, guesses, seconds)) # строка отчёта
+    return rows # возвращаем отчёт
+
+
 if __name__ == '__main__': # запуск функции main
     result = main() # присваиваем результат выполнения функции main переменной result
     print('-' * 100) # делвем красивое пунктирное разгрничения входных и выходных данных
-    print(result) # выводим на печать значение переменной result
\ No newline at end of file
+    print(result) # выводим на печать значение переменной result
+    print('-' * 100) # отделяем замеры от результата
+    for n, fast, slow in benchmark(): # выводим замеры binary и binary_slicing
+        print(f'{n:>9}  binary {fast * 10 ** 6:>10.2f} мкс  binary_slicing {slow * 10 ** 6:>12.2f} мкс') # размер списка и время одного поиска
+    print('-' * 100) # отделяем сравнение алгоритмов
+    for n, kind, algorithm, guesses, seconds in compare_types(): # выводим сравнение алгоритмов guess_func
+        time_text = 'не замерялось' if seconds is None else f'{seconds * 10 ** 6:.2f} мкс' # время одного поиска
+        print(f'{n:>9}  {kind:<10}  {algorithm:<6}  угадываний {guesses:>12.1f}  время {time_text}') # размер, набор чисел, алгоритм, угадывания и время
\ No newline at end of file
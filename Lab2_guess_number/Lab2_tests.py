@@ -1,4 +1,5 @@
 import unittest # импортируем библиотеку для проверки тестов
+import random # импортируем random для случайных списков
 import Lab2_code # импортируем файл с кодом, который будем проверять
 
 
@@ -61,5 +62,134 @@ class Tests_for_my_code(unittest.TestCase): # создаём класс тест
         self.assertEqual(Lab2_code.guess_func(4, [1, 2, 5, 6, 4, 8, 9, 23, 45, 4], 'seq'), [4, 3])
 
 
+    def test_binary_matches_slicing(self): # тест: binary с индексами даёт те же угадывания, что и версия со срезами
+        rng = random.Random(2) # генератор случайных чисел
+        for _ in range(300): # случайные списки
+            nums = sorted(rng.choices(range(-20, 20), k=rng.randint(0, 30))) # отсортированный список с повторами
+            target = rng.randint(-22, 22) # число может отсутствовать в списке
+            self.assertEqual(Lab2_code.binary(target, nums), Lab2_code.binary_slicing(target, nums))
+
+    def test_binary_big_list(self): # тест: binary на большом списке делает не больше log2(n) + 1 угадываний
+        nums = list(range(10 ** 6)) # большой отсортированный список
+        self.assertEqual(Lab2_code.binary(0, nums), [0, 20])
+        self.assertIsNone(Lab2_code.binary(10 ** 6, nums))
+
+
+    def test_input_not_changed(self): # тест: guess_func не сортирует список вызывающего
+        nums = [5, 3, 9, 1] # неотсортированный список
+        self.assertEqual(Lab2_code.guess_func(9, nums, 'seq'), [9, 4])
+        self.assertEqual(nums, [5, 3, 9, 1])
+
+    def test_search_index_methods(self): # тест: все алгоритмы SearchIndex находят число, seq и bin совпадают с функциями
+        rng = random.Random(3) # генератор случайных чисел
+        for _ in range(300): # случайные списки
+            nums = rng.choices(range(-50, 50), k=rng.randint(0, 40)) # неотсортированный список с повторами
+            index = Lab2_code.SearchIndex(nums) # индекс строится один раз
+            for target in rng.choices(range(-55, 55), k=5): # несколько запросов к одному индексу
+                self.assertEqual(index.seq(target), Lab2_code.senquential(target, sorted(nums)))
+                self.assertEqual(index.bin(target), Lab2_code.binary(target, sorted(nums)))
+                for type in ('interp', 'exp'): # новые алгоритмы
+                    result = index.search(target, type) # результат поиска
+                    self.assertEqual(result is not None, target in nums)
+                    if result is not None: # число найдено
+                        self.assertEqual(result[0], target)
+
+    def test_search_index_errors(self): # тест: не целые числа и неизвестный алгоритм вызывают ValueError
+        with self.assertRaises(ValueError):
+            Lab2_code.SearchIndex([1, 2.5])
+        with self.assertRaises(ValueError):
+            Lab2_code.SearchIndex([1, 2]).search(1, 'yes')
+
+    def test_search_index_huge_numbers(self): # тест: числа больше 64 бит хранятся в списке
+        index = Lab2_code.SearchIndex([2 ** 70, -2 ** 70, 5]) # числа не помещаются в array('q')
+        self.assertEqual(index.bin(2 ** 70), [2 ** 70, 2])
+        self.assertEqual(index.interp(-2 ** 70), [-2 ** 70, 1])
+
+
+    def test_huge_range(self): # тест: поиск в диапазоне ±10**9 без создания списка
+        nums = range(-10 ** 9, 10 ** 9 + 1) # диапазон из 2 * 10**9 + 1 чисел
+        self.assertEqual(Lab2_code.guess_func(10 ** 9 - 1, nums, 'seq'), [10 ** 9 - 1, 2 * 10 ** 9])
+        self.assertEqual(Lab2_code.guess_func(0, nums, 'bin'), [0, 1])
+        self.assertEqual(Lab2_code.guess_func(10 ** 9 + 1, nums, 'bin'), None)
+
+    def test_lazy_sequence_presorted(self): # тест: ленивая последовательность (не range) не перебирается целиком
+        class Squares: # квадраты 0, 1, 4, ..., (n - 1)**2, вычисляемые по индексу
+            def __init__(self, n):
+                self.n, self.reads = n, 0 # длина и количество обращений
+            def __len__(self):
+                return self.n # длина последовательности
+            def __getitem__(self, i):
+                self.reads += 1 # считаем обращение
+                return i * i # квадрат индекса
+        nums = Squares(10 ** 9) # миллиард чисел, ни одно не хранится
+        self.assertEqual(Lab2_code.guess_func(12345 ** 2, nums, 'bin', presorted=True), [12345 ** 2, 29])
+        self.assertEqual(Lab2_code.guess_func(12345 ** 2 + 1, nums, 'exp', presorted=True), None)
+        result = Lab2_code.guess_many([0, 7 ** 2, 8], nums, 'interp', presorted=True) # много чисел сразу
+        self.assertEqual(result['found'].tolist(), [True, True, False])
+        self.assertLess(nums.reads, 1000) # прочитано лишь несколько элементов
+
+    def test_range_matches_list(self): # тест: range даёт те же результаты, что и такой же список
+        for nums in (range(-7, 20, 3), range(20, -7, -3), range(0)): # возрастающий, убывающий и пустой диапазоны
+            for target in range(-10, 25): # числа внутри и вне диапазона
+                for type in ('seq', 'bin'): # оба алгоритма
+                    self.assertEqual(Lab2_code.guess_func(target, nums, type), Lab2_code.guess_func(target, list(nums), type))
+
+
+    def test_common_test_interp(self): # обычный тест для type = 'interp'
+        self.assertEqual(Lab2_code.guess_func(24, [20, 21, 22, 23, 24, 25, 26, 27, 28], 'interp'), [24, 1])
+
+    def test_common_test_exp(self): # обычный тест для type = 'exp'
+        self.assertEqual(Lab2_code.guess_func(24, [20, 21, 22, 23, 24, 25, 26, 27, 28], 'exp'), [24, 4])
+
+    def test_interp_and_exp_not_in_list(self): # тест: target нет в списке для type = 'interp' и type = 'exp'
+        for type in ('interp', 'exp'): # оба алгоритма
+            self.assertEqual(Lab2_code.guess_func(2, [3, 4, 5], type), None)
+            self.assertEqual(Lab2_code.guess_func(4, [3, 5, 7, 9], type), None)
+            self.assertEqual(Lab2_code.guess_func(2, [], type), None)
+
+    def test_interp_and_exp_few_guesses(self): # тест: interp быстр на равномерных числах, exp -- у начала списка
+        nums = range(0, 3 * 10 ** 6, 3) # равномерно распределённые числа
+        self.assertLessEqual(Lab2_code.guess_func(123457 * 3, nums, 'interp')[1], 2)
+        self.assertLessEqual(Lab2_code.guess_func(5 * 3, nums, 'exp')[1], 7)
+        self.assertEqual(Lab2_code.guess_func(5 * 3, nums, 'bin')[1], 19)
+
+
+    def test_guess_many_matches_guess_func(self): # тест: guess_many даёт те же результаты, что и guess_func для каждого числа
+        rng = random.Random(4) # генератор случайных чисел
+        for _ in range(100): # случайные списки
+            nums = rng.choices(range(-40, 40), k=rng.randint(0, 50)) # неотсортированный список с повторами
+            targets = rng.choices(range(-45, 45), k=20) + ['7', 'fff', 0.5, 2 ** 70] # числа, строка с числом и некорректные значения
+            for type in ('seq', 'bin', 'interp', 'exp'): # все алгоритмы
+                expected = [Lab2_code.guess_func(target, nums, type) for target in targets] # результаты по одному числу
+                expected = [(True, found[1]) if found else (False, 0) for found in expected] # в виде (found, steps)
+                for vectorized in (True, False): # векторный и обычный поиск
+                    result = Lab2_code.guess_many(targets, nums, type, vectorized=vectorized) # результаты всех чисел
+                    self.assertEqual([(bool(found), int(steps)) for found, steps in result], expected)
+
+    def test_guess_many_invalid(self): # тест: некорректные nums или type дают None, пустые targets -- пустой массив
+        self.assertIsNone(Lab2_code.guess_many([1], [1, 2.5], 'bin'))
+        self.assertIsNone(Lab2_code.guess_many([1], [1, 2], 'yes'))
+        self.assertEqual(len(Lab2_code.guess_many([], [1, 2], 'bin')), 0)
+
+    def test_guess_many_bad_targets(self): # тест: некорректные числа не прерывают поиск остальных
+        for vectorized in (True, False): # векторный и обычный поиск
+            result = Lab2_code.guess_many(['-+5', '²', None, '5', 5], [1, 5, 9], 'bin', vectorized=vectorized) # ищем все числа
+            self.assertEqual(result['found'].tolist(), [False, False, False, True, True])
+            self.assertEqual(result['steps'].tolist(), [0, 0, 0, 1, 1])
+        self.assertEqual(Lab2_code.guess_func('-+5', [1, 5, 9], 'bin'), None)
+
+    def test_search_index_as_int64(self): # тест: массив numpy без копирования есть только у array('q')
+        values = Lab2_code.SearchIndex([3, 1, 2]).as_int64() # числа в array('q')
+        self.assertEqual(values.tolist(), [1, 2, 3])
+        self.assertFalse(values.flags.writeable)
+        self.assertIsNone(Lab2_code.SearchIndex(range(5)).as_int64())
+        self.assertIsNone(Lab2_code.SearchIndex([2 ** 70]).as_int64())
+
+    def test_guess_many_range(self): # тест: guess_many ищет в диапазоне без создания списка
+        result = Lab2_code.guess_many([0, 10 ** 9, 10 ** 9 + 1], range(-10 ** 9, 10 ** 9 + 1), 'bin') # поиск в диапазоне ±10**9
+        self.assertEqual(result['found'].tolist(), [True, True, False])
+        self.assertEqual(result['steps'].tolist(), [1, 30, 0])
+
+
 if __name__ == '__main__':
     unittest.main()